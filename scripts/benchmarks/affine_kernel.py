@@ -0,0 +1,35 @@
+# %%
+"""Run time of affine conversions (degC to degF) of large temperature grids,
+with the expression form ``x * a + b`` and with the single pass kernel of
+impunity, into a new array and in place.
+
+    python affine_kernel.py [grid size]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+from impunity.runtime import affine, convert
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    grid = np.random.default_rng().random((size, size)) * 40 - 10
+    buffer = grid.copy()
+
+    def expression_inplace():
+        np.multiply(buffer, 1.8, out=buffer)
+        np.add(buffer, 32, out=buffer)
+
+    cases = {
+        "new array": (lambda: grid * 1.8 + 32, lambda: affine(grid, 1.8, 32)),
+        "in place": (expression_inplace, lambda: convert(buffer, 1.8, 32)),
+    }
+    print(f"grid of {size} x {size} float64")
+    print(f"{'conversion':<12} {'expression (ms)':>16} {'kernel (ms)':>12}")
+    for name, (expression, kernel) in cases.items():
+        times = [
+            1000 * min(timeit.repeat(f, number=3, repeat=5)) / 3
+            for f in (expression, kernel)
+        ]
+        print(f"{name:<12} {times[0]:>16.1f} {times[1]:>12.1f}")
@@ -0,0 +1,52 @@
+# %%
+"""Run time of the conversion of telemetry (one column per channel, each
+with its own unit) with a Python loop over the channels calling
+impunity.converter(), and with impunity.batch_convert(), into a new array
+and in place.
+
+    python batch_conversion.py [number of rows]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+from impunity import batch_convert, converter
+
+FROM_UNITS = ["ft", "kts", "degC", "hPa", "ft/min", "deg", "lb", "nmi"]
+TO_UNITS = ["m", "m/s", "K", "Pa", "m/s", "rad", "kg", "km"]
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    telemetry = np.random.default_rng().random((rows, len(FROM_UNITS)))
+    buffer = telemetry.copy()
+
+    def loop():
+        result = np.empty_like(telemetry)
+        for i, units in enumerate(zip(FROM_UNITS, TO_UNITS)):
+            result[:, i] = converter(*units)(telemetry[:, i])
+        return result
+
+    def loop_inplace():
+        for i, units in enumerate(zip(FROM_UNITS, TO_UNITS)):
+            column = buffer[:, i]
+            converter(*units)(column, out=column)
+
+    cases = {
+        "new array": (
+            loop,
+            lambda: batch_convert(telemetry, FROM_UNITS, TO_UNITS),
+        ),
+        "in place": (
+            loop_inplace,
+            lambda: batch_convert(buffer, FROM_UNITS, TO_UNITS, out=buffer),
+        ),
+    }
+    print(f"{rows} rows x {len(FROM_UNITS)} channels, float64")
+    print(f"{'conversion':<12} {'loop (ms)':>10} {'batch (ms)':>11}")
+    for name, functions in cases.items():
+        times = [
+            1000 * min(timeit.repeat(f, number=3, repeat=5)) / 3
+            for f in functions
+        ]
+        print(f"{name:<12} {times[0]:>10.1f} {times[1]:>11.1f}")
@@ -0,0 +1,87 @@
+# %%
+"""Arithmetic operations and run time of rewritten functions, with and
+without the folding of chained conversions.
+
+    python conversion_folding.py [array size]
+"""
+
+import dis
+import importlib
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+import numpy as np
+from impunity import optimizer
+
+SOURCE = """
+from typing import Any
+
+from typing_extensions import Annotated
+
+from impunity import impunity
+
+m = Annotated[Any, "m"]
+ft = Annotated[Any, "ft"]
+
+
+@impunity
+def total(a: "m", b: "m", c: "m") -> "m":
+    return a + b + c
+
+
+@impunity
+def above_ground(h: "ft") -> "ft":
+    ground: "m" = 120
+    return h - ground
+"""
+
+
+def operations(fun):
+    """Number of arithmetic operations in the code of a function."""
+    return sum(
+        instruction.opname.startswith("BINARY_")
+        for instruction in dis.get_instructions(fun)
+        if instruction.opname != "BINARY_SUBSCR"
+    )
+
+
+def load(folder, name, passes):
+    (Path(folder) / f"{name}.py").write_text(SOURCE)
+    saved = optimizer.PASSES
+    optimizer.PASSES = passes
+    try:
+        return importlib.import_module(name)
+    finally:
+        optimizer.PASSES = saved
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = np.random.default_rng()
+    args = {
+        "total": (rng.random(size), rng.random(size), rng.random(size)),
+        "above_ground": (rng.random(size),),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sys.path.insert(0, tmp)
+        plain = load(tmp, "unfolded_module", [])
+        folded = load(tmp, "folded_module", optimizer.PASSES)
+
+        print(f"{'function':<15} {'operations':>13} {'time (ms)':>17}")
+        for name, values in args.items():
+            times = []
+            for module in (plain, folded):
+                fun = getattr(module, name)
+                times.append(
+                    1000
+                    * min(timeit.repeat(lambda: fun(*values), number=10))
+                    / 10
+                )
+            passes = [operations(getattr(m, name)) for m in (plain, folded)]
+            print(
+                f"{name:<15} {passes[0]:>6} -> {passes[1]:<4}"
+                f" {times[0]:>7.2f} -> {times[1]:<7.2f}"
+            )
@@ -0,0 +1,57 @@
+# %%
+"""Run time of products of a scalar and an array with commensurable units,
+with the conversion factor placed on the array (as impunity did before) or
+on the operand with the fewest elements.
+
+    python conversion_placement.py [array size]
+"""
+
+import sys
+import timeit
+from typing import Any
+
+from typing_extensions import Annotated
+
+import numpy as np
+from impunity import impunity
+
+
+@impunity
+def areas(
+    width: Annotated[float, "m"], lengths: Annotated[np.ndarray, "ft"]
+) -> Annotated[np.ndarray, "m**2"]:
+    return width * lengths
+
+
+@impunity
+def aspect_ratios(
+    width: Annotated[float, "m"], lengths: Annotated[np.ndarray, "ft"]
+) -> Annotated[np.ndarray, "dimensionless"]:
+    return width / lengths
+
+
+def areas_array(width: Any, lengths: Any) -> Any:
+    # factor applied to the array operand
+    return width * (lengths * 0.3048)
+
+
+def aspect_ratios_array(width: Any, lengths: Any) -> Any:
+    return width / (lengths * 0.3048)
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    values = np.random.default_rng().random(size)
+    cases = {
+        "areas": (areas_array, areas, (2.0, values)),
+        "aspect_ratios": (aspect_ratios_array, aspect_ratios, (2.0, values)),
+    }
+
+    print(f"{'function':<14} {'time (ms)':>17}")
+    for name, (before, after, args) in cases.items():
+        np.testing.assert_allclose(before(*args), after(*args))
+        times = [
+            1000 * min(timeit.repeat(lambda f=f: f(*args), number=5)) / 5
+            for f in (before, after)
+        ]
+        print(f"{name:<14} {times[0]:>7.2f} -> {times[1]:<7.2f}")
@@ -0,0 +1,102 @@
+# %%
+"""Run time of array functions using a parameter in several expressions
+which expect the same unit, with one conversion per use (as impunity did
+before) or one conversion per unit, and the number of conversions saved.
+
+    python conversion_sharing.py [array size]
+"""
+
+import importlib
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+import numpy as np
+from impunity import optimizer, stats
+
+SOURCE = """
+from typing import Any
+
+import numpy as np
+from typing_extensions import Annotated
+
+from impunity import impunity
+
+
+@impunity
+def clearance(
+    altitude: Annotated[np.ndarray, "ft"],
+    ground: Annotated[np.ndarray, "m"],
+    ceiling: Annotated[np.ndarray, "m"],
+) -> Annotated[np.ndarray, "m"]:
+    height: Annotated[np.ndarray, "m"] = altitude
+    above = ground - height
+    below = ceiling - altitude
+    return np.minimum(above, below)
+
+
+@impunity
+def temperature(h: Annotated[np.ndarray, "m"]) -> Annotated[np.ndarray, "K"]:
+    return 288.15 - 0.0065 * h
+
+
+@impunity
+def pressure(h: Annotated[np.ndarray, "m"]) -> Annotated[np.ndarray, "Pa"]:
+    return 101325 * (1 - 2.25577e-5 * h) ** 5.25588
+
+
+@impunity
+def density(
+    altitude: Annotated[np.ndarray, "ft"],
+) -> Annotated[np.ndarray, "kg/m^3"]:
+    t: Annotated[np.ndarray, "K"] = temperature(altitude)
+    p: Annotated[np.ndarray, "Pa"] = pressure(altitude)
+    return p / (287.05287 * t)
+"""
+
+
+def load(folder, name, passes):
+    (Path(folder) / f"{name}.py").write_text(SOURCE)
+    saved = optimizer.PASSES
+    optimizer.PASSES = passes
+    try:
+        return importlib.import_module(name)
+    finally:
+        optimizer.PASSES = saved
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    rng = np.random.default_rng()
+    values = (
+        rng.random(size) * 40_000,
+        rng.random(size) * 1000,
+        rng.random(size) * 3000 + 10_000,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sys.path.insert(0, tmp)
+        passes = [
+            p for p in optimizer.PASSES if p is not optimizer.ConversionSharing
+        ]
+        plain = load(tmp, "unshared_module", passes)
+        stats(True)
+        shared = load(tmp, "shared_module", optimizer.PASSES)
+        saved = {
+            name.rsplit(".", 1)[-1]: s.saved for name, s in stats().items()
+        }
+
+        print(f"{'function':<10} {'time (ms)':>17} {'saved':>6}")
+        for name in ("clearance", "density"):
+            functions = [getattr(module, name) for module in (plain, shared)]
+            args = values[:1] if name == "density" else values
+            np.testing.assert_allclose(*(f(*args) for f in functions))
+            times = [
+                1000 * min(timeit.repeat(lambda f=f: f(*args), number=5)) / 5
+                for f in functions
+            ]
+            print(
+                f"{name:<10} {times[0]:>7.2f} -> {times[1]:<7.2f}"
+                f" {saved[name]:>6}"
+            )
@@ -0,0 +1,39 @@
+# %%
+"""Time per call of conversions outside decorated functions: a bare
+multiplication, impunity.converter() and pint's Quantity.to, on a scalar and
+on an array of speeds (km/h to kts).
+
+    python converter.py [array size]
+"""
+
+import sys
+import timeit
+
+import pint
+
+import numpy as np
+from impunity import converter
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    ureg = pint.UnitRegistry()
+    to_knots = converter("km/h", "kts")
+    factor = to_knots(1.0)
+
+    print(
+        f"{'value':<8} {'multiply (µs)':>14} {'converter (µs)':>15} "
+        f"{'pint (µs)':>10}"
+    )
+    for name, value in (("scalar", 100.0), ("array", np.full(size, 100.0))):
+        quantity = ureg.Quantity(value, "km/h")
+        times = [
+            1e6 * min(timeit.repeat(f, number=1000, repeat=5)) / 1000
+            for f in (
+                lambda: value * factor,
+                lambda: to_knots(value),
+                lambda: quantity.to("kts").m,
+            )
+        ]
+        print(
+            f"{name:<8} {times[0]:>14.2f} {times[1]:>15.2f} {times[2]:>10.2f}"
+        )
@@ -0,0 +1,119 @@
+# %%
+"""Time spent decorating the functions of a large synthetic module.
+
+Compares the generation of code objects with compile() on the rewritten AST
+with the former round trip through the source code (astor.to_source followed
+by exec).
+
+    python decoration_time.py [number of functions]
+"""
+
+import ast
+import copy
+import importlib
+import inspect
+import sys
+import tempfile
+import textwrap
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import astor
+
+from impunity.rewriter import generate_code
+from impunity.visitor import Visitor
+
+HEADER = """\
+from typing import Any
+
+from typing_extensions import Annotated
+
+"""
+
+TEMPLATE = """
+def speed_{i}(
+    distance: Annotated[Any, "m"], duration: Annotated[Any, "s"]
+) -> Annotated[Any, "km/h"]:
+    total: Annotated[Any, "km"] = distance
+    for k in range(3):
+        total = total + k * distance
+    return total / duration
+
+
+def altitude_{i}(h: Annotated[Any, "ft"]) -> Annotated[Any, "m"]:
+    return speed_{i}(h, 2) + h
+"""
+
+
+def write_module(folder: Path, n: int) -> str:
+    source = HEADER + "".join(TEMPLATE.format(i=i) for i in range(n))
+    (folder / "synthetic.py").write_text(source)
+    return "synthetic"
+
+
+def astor_codes(fun: Any, tree: ast.Module) -> Dict[str, Any]:
+    """The former code generation: back to source code, and exec."""
+    source = astor.to_source(tree)
+    env: Dict[str, Any] = {}
+    exec(source, sys.modules[fun.__module__].__dict__.copy(), env)
+    return {"": env[fun.__name__].__code__}
+
+
+def compile_codes(fun: Any, tree: ast.Module) -> Dict[str, Any]:
+    ast.fix_missing_locations(tree)
+    return generate_code(fun, tree.body[0], "synthetic.py")
+
+
+def run(
+    functions: List[Any], generate: Callable[..., Any]
+) -> Tuple[float, float]:
+    """Returns the total decoration time and the code generation time."""
+    module_vars = Visitor.module_annotations(functions[0].__module__)
+    trees = [
+        ast.parse(textwrap.dedent(inspect.getsource(f))) for f in functions
+    ]
+    total = generation = 0.0
+    for fun, tree in zip(functions, trees):
+        t0 = time.perf_counter()
+        visitor = Visitor(fun, False, False, module_vars)
+        new_tree = visitor.visit(copy.deepcopy(tree))
+        t1 = time.perf_counter()
+        generate(fun, new_tree)
+        t2 = time.perf_counter()
+        total += t2 - t0
+        generation += t2 - t1
+    return total, generation
+
+
+if __name__ == "__main__":
+    import logging
+
+    logging.disable(logging.WARNING)
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sys.path.insert(0, tmp)
+        module = importlib.import_module(write_module(Path(tmp), n))
+        functions = [
+            getattr(module, name)
+            for name in dir(module)
+            if name.startswith(("speed_", "altitude_"))
+        ]
+        for fun in functions:
+            Visitor.add_func(fun)
+
+        astor_total, astor_gen = min(
+            run(functions, astor_codes) for _ in range(3)
+        )
+        compile_total, compile_gen = min(
+            run(functions, compile_codes) for _ in range(3)
+        )
+
+    print(f"{len(functions)} functions (total / code generation)")
+    print(f"astor.to_source + exec: {astor_total:.3f}s / {astor_gen:.3f}s")
+    print(f"compile(ast):           {compile_total:.3f}s / {compile_gen:.3f}s")
+    print(
+        f"speedup:                {astor_total / compile_total:.2f}x"
+        f" / {astor_gen / compile_gen:.2f}x"
+    )
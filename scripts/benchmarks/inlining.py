@@ -0,0 +1,83 @@
+# %%
+"""Run time of functions calling small decorated functions, with and
+without the inlining of these calls (``@impunity(inline=True)``), on
+scalars and on arrays.
+
+    python inlining.py [array size]
+"""
+
+import sys
+import timeit
+from typing import Any
+
+from typing_extensions import Annotated
+
+import numpy as np
+from impunity import impunity, inline_info
+
+GAMMA = 1.40
+R = 287.05287
+
+
+@impunity
+def temperature(h: Annotated[Any, "m"]) -> Annotated[Any, "K"]:
+    temp: Annotated[Any, "K"] = 288.15 - 0.0065 * h
+    return temp
+
+
+@impunity
+def altitude(h: Annotated[Any, "ft"]) -> Annotated[Any, "m"]:
+    return h
+
+
+@impunity
+def sound_speed(h: Annotated[Any, "ft"]) -> Annotated[Any, "kts"]:
+    temp: Annotated[Any, "K"] = temperature(h)
+    a: Annotated[Any, "m/s"] = np.sqrt(GAMMA * R * temp)
+    return a
+
+
+@impunity(inline=True)
+def sound_speed_inlined(h: Annotated[Any, "ft"]) -> Annotated[Any, "kts"]:
+    temp: Annotated[Any, "K"] = temperature(h)
+    a: Annotated[Any, "m/s"] = np.sqrt(GAMMA * R * temp)
+    return a
+
+
+@impunity
+def round_trip(h: Annotated[Any, "m"]) -> Annotated[Any, "m"]:
+    return altitude(h)
+
+
+@impunity(inline=True)
+def round_trip_inlined(h: Annotated[Any, "m"]) -> Annotated[Any, "m"]:
+    # m -> ft (caller) and ft -> m (callee) cancel out
+    return altitude(h)
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    values = np.random.default_rng().random(size) * 10_000
+    cases = {
+        "sound_speed": (sound_speed, sound_speed_inlined),
+        "round_trip": (round_trip, round_trip_inlined),
+    }
+    print("inlined calls:", inline_info())
+
+    print(f"{'function':<12} {'scalar (us)':>17} {'array (ms)':>17}")
+    for name, (before, after) in cases.items():
+        np.testing.assert_allclose(before(values), after(values))
+        scalar = [
+            1e6
+            * min(timeit.repeat(lambda f=f: f(1000.0), number=10_000))
+            / 10_000
+            for f in (before, after)
+        ]
+        array = [
+            1000 * min(timeit.repeat(lambda f=f: f(values), number=5)) / 5
+            for f in (before, after)
+        ]
+        print(
+            f"{name:<12} {scalar[0]:>7.3f} -> {scalar[1]:<7.3f}"
+            f" {array[0]:>7.2f} -> {array[1]:<7.2f}"
+        )
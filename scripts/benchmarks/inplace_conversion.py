@@ -0,0 +1,80 @@
+# %%
+"""Peak memory and run time of array functions with conversions, with and
+without @impunity(inplace=True).
+
+    python inplace_conversion.py [array size]
+"""
+
+import importlib
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+SOURCE = """
+import numpy as np
+from typing_extensions import Annotated
+
+from impunity import impunity
+
+
+@impunity(inplace={inplace})
+def height(
+    altitude: Annotated[np.ndarray, "ft"], ground: Annotated[np.ndarray, "ft"]
+) -> Annotated[np.ndarray, "m"]:
+    difference: Annotated[np.ndarray, "ft"] = altitude - ground
+    return difference
+
+
+@impunity(inplace={inplace})
+def temperature(
+    total: Annotated[np.ndarray, "degC"],
+    ram_rise: Annotated[np.ndarray, "degC"],
+) -> Annotated[np.ndarray, "degF"]:
+    static: Annotated[np.ndarray, "degC"] = total - ram_rise
+    return static
+"""
+
+
+def load(folder, name, inplace):
+    (Path(folder) / f"{name}.py").write_text(SOURCE.format(inplace=inplace))
+    return importlib.import_module(name)
+
+
+def peak_memory(fun, *args):
+    """Peak memory allocated during a call (in MB), beyond the result."""
+    tracemalloc.start()
+    result = fun(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (peak - result.nbytes) / 2**20
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    rng = np.random.default_rng()
+    args = (rng.random(size) * 1000, rng.random(size))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sys.path.insert(0, tmp)
+        modules = [
+            load(tmp, "copy_module", False),
+            load(tmp, "inplace_module", True),
+        ]
+
+        print(f"{'function':<12} {'temporaries (MB)':>20} {'time (ms)':>17}")
+        for name in ("height", "temperature"):
+            funs = [getattr(module, name) for module in modules]
+            np.testing.assert_allclose(funs[0](*args), funs[1](*args))
+            memory = [peak_memory(fun, *args) for fun in funs]
+            times = [
+                1000 * min(timeit.repeat(lambda f=f: f(*args), number=5)) / 5
+                for f in funs
+            ]
+            print(
+                f"{name:<12} {memory[0]:>9.0f} -> {memory[1]:<8.0f}"
+                f" {times[0]:>7.2f} -> {times[1]:<7.2f}"
+            )
@@ -0,0 +1,82 @@
+# %%
+"""Run time of a simulation loop converting a loop invariant parameter at
+each iteration, with and without the hoisting of invariant conversions.
+
+    python loop_hoisting.py [number of iterations]
+"""
+
+import importlib
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+from impunity import optimizer
+
+SOURCE = """
+from typing import Any
+
+from typing_extensions import Annotated
+
+from impunity import impunity
+
+m = Annotated[Any, "m"]
+ft = Annotated[Any, "ft"]
+m_s = Annotated[Any, "m/s"]
+ft_s = Annotated[Any, "ft/s"]
+
+
+@impunity
+def descent(altitude: "m", rate: m_s) -> "m":
+    return altitude - rate
+
+
+@impunity
+def simulate(altitude: "ft", rate: ft_s, steps: int) -> "m":
+    current: "m" = 0
+    for _ in range(steps):
+        current = current + descent(altitude, rate)
+    return current
+
+
+@impunity
+def profile(altitude: "ft", steps: int) -> "m":
+    return sum([altitude * step for step in range(steps)])
+"""
+
+
+def load(folder, name, passes):
+    (Path(folder) / f"{name}.py").write_text(SOURCE)
+    saved = optimizer.PASSES
+    optimizer.PASSES = passes
+    try:
+        return importlib.import_module(name)
+    finally:
+        optimizer.PASSES = saved
+
+
+if __name__ == "__main__":
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    args = {"simulate": (35000.0, 20.0, steps), "profile": (35000.0, steps)}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sys.path.insert(0, tmp)
+        passes = [
+            p for p in optimizer.PASSES if p is not optimizer.ConversionHoister
+        ]
+        plain = load(tmp, "unhoisted_module", passes)
+        hoisted = load(tmp, "hoisted_module", optimizer.PASSES)
+
+        print(f"{'function':<10} {'time (ms)':>17}")
+        for name, values in args.items():
+            times = [
+                1000
+                * min(
+                    timeit.repeat(
+                        lambda: getattr(module, name)(*values), number=5
+                    )
+                )
+                / 5
+                for module in (plain, hoisted)
+            ]
+            print(f"{name:<10} {times[0]:>7.2f} -> {times[1]:<7.2f}")
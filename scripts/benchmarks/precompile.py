@@ -0,0 +1,104 @@
+# %%
+"""Time spent by impunity.precompile() on a large synthetic package, for
+several numbers of worker processes, compared with serial decoration.
+
+    python precompile.py [number of modules] [functions per module]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+
+HEADER = """\
+from typing import Any
+
+from typing_extensions import Annotated
+
+from impunity import impunity
+
+"""
+
+TEMPLATE = """
+@impunity
+def speed_{i}(
+    distance: Annotated[Any, "m"], duration: Annotated[Any, "s"]
+) -> Annotated[Any, "km/h"]:
+    total: Annotated[Any, "km"] = distance
+    for k in range(3):
+        total = total + k * distance
+    return total / duration
+
+
+@impunity
+def altitude_{i}(h: Annotated[Any, "ft"]) -> Annotated[Any, "m"]:
+    return speed_{i}(h, 2) + h
+"""
+
+SERIAL = """
+import time
+t0 = time.perf_counter()
+import {package}.module_0
+{imports}
+print(time.perf_counter() - t0)
+"""
+
+PARALLEL = """
+import time
+import impunity
+t0 = time.perf_counter()
+impunity.precompile("{package}", workers={workers})
+{imports}
+print(time.perf_counter() - t0)
+"""
+
+
+def write_package(folder: Path, modules: int, functions: int) -> str:
+    package = folder / "synthetic_package"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    for m in range(modules):
+        source = HEADER + "".join(
+            TEMPLATE.format(i=i) for i in range(functions)
+        )
+        (package / f"module_{m}.py").write_text(source)
+    return package.name
+
+
+def run(folder: str, code: str) -> float:
+    env = dict(os.environ, PYTHONPATH=folder, PYTHONDONTWRITEBYTECODE="1")
+    out = subprocess.check_output(
+        [sys.executable, "-c", textwrap.dedent(code)], env=env, cwd=folder
+    )
+    return float(out.decode().split()[-1])
+
+
+if __name__ == "__main__":
+    modules = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    functions = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    with tempfile.TemporaryDirectory() as tmp:
+        package = write_package(Path(tmp), modules, functions)
+        imports = "\n".join(
+            f"import {package}.module_{m}" for m in range(modules)
+        )
+        serial = run(tmp, SERIAL.format(package=package, imports=imports))
+        print(f"{2 * functions * modules} functions")
+        print(f"serial decoration: {serial:.3f}s")
+
+        workers = 1
+        while workers <= (os.cpu_count() or 1):
+            for pycache in Path(tmp).rglob("__pycache__"):
+                for pyc in pycache.glob("*.opt-impunity.pyc"):
+                    pyc.unlink()
+            code = PARALLEL.format(
+                package=package, workers=workers, imports=imports
+            )
+            duration = run(tmp, code)
+            print(
+                f"precompile(workers={workers}): {duration:.3f}s "
+                f"({serial / duration:.2f}x)"
+            )
+            workers *= 2
@@ -0,0 +1,108 @@
+# %%
+"""Generate src/impunity/unit_table.py, the table of common units used by
+impunity to analyse code without importing pint.
+
+Each unit is stored with its scale (and the inverse of its scale) and offset
+with respect to the root units of pint, and with the exponents of its
+dimensions, as computed by the version of pint installed: the factors of
+conversion between units of the table are the same as those of pint. Only
+the names resolved by pint are written: the table never interprets a name
+differently from pint.
+
+    python unit_table.py && ruff format ../src/impunity/unit_table.py
+"""
+
+from pathlib import Path
+
+import pint
+
+DIMENSIONS = (
+    "[length]",
+    "[mass]",
+    "[time]",
+    "[temperature]",
+    "[current]",
+    "[substance]",
+    "[luminosity]",
+)
+
+# units which accept prefixes, with their symbol prefixes (e.g. km) or long
+# prefixes (e.g. kilometer)
+SYMBOLS = "m g s A K mol cd N Pa J W Wh Hz V C F T Wb ohm Ω L l bar eV rad"
+NAMES = (
+    "meter metre gram second ampere kelvin mole newton pascal joule watt "
+    "hertz volt coulomb farad tesla weber liter litre"
+)
+SYMBOL_PREFIXES = "Y Z E P T G M k h da d c m u µ n p f a"
+NAME_PREFIXES = (
+    "yotta zetta exa peta tera giga mega kilo hecto deca deci centi milli "
+    "micro nano pico femto atto"
+)
+
+# other units (and aliases) without prefixes
+OTHERS = """
+dimensionless percent ppm
+ft foot feet in inch yd yard mi mile nmi nautical_mile au ly
+t tonne metric_ton lb pound oz ounce slug
+min minute h hr hour d day week year
+degC celsius degree_Celsius °C degF fahrenheit degree_Fahrenheit °F
+degR rankine degree_Rankine °R
+kt kts knot knots mph kph fps
+lbf kgf dyn atm psi inHg mmHg torr
+cal calorie kcal BTU erg hp horsepower
+deg degree degrees radian radians arcmin arcsec sr steradian
+rpm revolution turn
+gal gallon
+"""
+
+
+def entries(ureg):
+    names = OTHERS.split()
+    names += SYMBOLS.split()
+    names += NAMES.split()
+    names += [f"{name}s" for name in NAMES.split()]
+    names += [p + u for p in SYMBOL_PREFIXES.split() for u in SYMBOLS.split()]
+    names += [p + u for p in NAME_PREFIXES.split() for u in NAMES.split()]
+
+    yield "dimensionless", (1.0, 1.0, 0.0, (0,) * len(DIMENSIONS))
+    for name in dict.fromkeys(names):
+        try:
+            factor, root = ureg.get_root_units(name)
+            dimensionality = ureg.get_dimensionality(name)
+        except Exception:
+            continue
+        if set(dimensionality) - set(DIMENSIONS):
+            continue
+        dimensions = tuple(int(dimensionality[d]) for d in DIMENSIONS)
+        offset = 0.0
+        if not ureg.Quantity(0, name).to(root).m == 0:
+            # temperatures, defined with respect to kelvin
+            _, unit, _ = ureg.parse_unit_name(name)[0]
+            converter = ureg._units[unit].converter
+            factor, offset = converter.scale, converter.offset
+            inverse = 1 / factor
+        else:
+            # pint computes the inverse along the definitions of the unit
+            inverse, _ = ureg.get_root_units(f"1 / {name}")
+        yield name, (float(factor), float(inverse), float(offset), dimensions)
+
+
+if __name__ == "__main__":
+    ureg = pint.UnitRegistry()
+    lines = [
+        f"# Generated by scripts/unit_table.py with pint {pint.__version__}.",
+        "# Do not edit: run the script again instead.",
+        "",
+        "# base dimensions, in the order of the exponents of the units",
+        "DIMENSIONS = (",
+        *(f'    "{dimension}",' for dimension in DIMENSIONS),
+        ")",
+        "",
+        "# unit: (scale, 1 / scale, offset, exponents of the dimensions)",
+        "UNITS = {",
+    ]
+    for name, value in entries(ureg):
+        lines.append(f'    "{name}": {value!r},')
+    lines.append("}")
+    path = Path(__file__).parents[1] / "src" / "impunity" / "unit_table.py"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
@@ -1,3 +1,26 @@
+from .build import precompile
+from .cache import cache_info
+from .converters import batch_convert, converter
+from .hook import install_import_hook, uninstall_import_hook
+from .inline import inline_info
+from .lazy import lazy_info
+from .module import rewrite_module
+from .registry import get_registry, set_registry
+from .stats import stats
 from .wrapper import impunity
 
-__all__ = ["impunity"]
+__all__ = [
+    "batch_convert",
+    "cache_info",
+    "converter",
+    "get_registry",
+    "impunity",
+    "inline_info",
+    "install_import_hook",
+    "lazy_info",
+    "precompile",
+    "rewrite_module",
+    "set_registry",
+    "stats",
+    "uninstall_import_hook",
+]
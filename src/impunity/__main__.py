@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import argparse
+import importlib
+import os
+import sys
+import time
+from typing import List, Optional
+
+
+def compile_command(args: argparse.Namespace) -> int:
+    from .build import compile_tree
+
+    t0 = time.perf_counter()
+    results = compile_tree(args.paths, jobs=args.jobs, force=args.force)
+    total = time.perf_counter() - t0
+
+    width = max((len(result.module) for result in results), default=0)
+    for result in results:
+        status = "ok" if result.error is None else f"error: {result.error}"
+        print(f"{result.module:<{width}}  {result.duration:8.3f}s  {status}")
+
+    errors = sum(result.error is not None for result in results)
+    print(f"{len(results)} modules compiled in {total:.3f}s ({errors} errors)")
+    return 1 if errors else 0
+
+
+def profile_command(args: argparse.Namespace) -> int:
+    from .stats import PHASES, stats
+
+    target = args.module
+    if target.endswith(".py") or os.sep in target:
+        folder, filename = os.path.split(os.path.abspath(target))
+        sys.path.insert(0, folder)
+        target = os.path.splitext(filename)[0]
+    elif "" not in sys.path and os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+
+    stats(True)
+    t0 = time.perf_counter()
+    importlib.import_module(target)
+    total = time.perf_counter() - t0
+    report = sorted(stats().values(), key=lambda s: s.total, reverse=True)
+
+    width = max([len("function")] + [len(s.name) for s in report])
+    header = " ".join(f"{phase:>9}" for phase in ("total", *PHASES))
+    print(
+        f"{'function':<{width}} {header} {'pint':>5} {'conv':>5} {'saved':>5}"
+    )
+    for s in report[: args.limit]:
+        phases = " ".join(f"{s.phases[phase]:9.4f}" for phase in PHASES)
+        print(
+            f"{s.name:<{width}} {s.total:9.4f} {phases}"
+            f" {s.pint_calls:5d} {s.conversions:5d} {s.saved:5d}"
+        )
+    decoration = sum(s.total for s in report)
+    print(
+        f"{len(report)} functions decorated in {decoration:.3f}s "
+        f"(import of {args.module}: {total:.3f}s)"
+    )
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m impunity",
+        description="Command line tools for impunity",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = subparsers.add_parser(
+        "compile",
+        help="write the rewritten bytecode of packages ahead of time",
+        description=(
+            "Rewrite all the modules of the given packages and cache the "
+            "result as bytecode in __pycache__ folders. Processes which "
+            "call impunity.install_import_hook() for these packages then "
+            "import already converted code."
+        ),
+    )
+    compile_parser.add_argument(
+        "paths", nargs="+", help="package directories or module files"
+    )
+    compile_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of worker processes (default: number of cores)",
+    )
+    compile_parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="rewrite modules even if the bytecode is up to date",
+    )
+    compile_parser.set_defaults(func=compile_command)
+
+    profile_parser = subparsers.add_parser(
+        "profile",
+        help="report the time spent decorating the functions of a module",
+        description=(
+            "Import a module and report, for each decorated function, the "
+            "time spent in each phase of the decoration, the number of "
+            "calls to pint and the number of conversions inserted. "
+            "Functions are sorted by decreasing cost."
+        ),
+    )
+    profile_parser.add_argument(
+        "module", help="module name (e.g. my_package.models) or file path"
+    )
+    profile_parser.add_argument(
+        "-n",
+        "--limit",
+        type=int,
+        default=None,
+        help="number of functions to report (default: all)",
+    )
+    profile_parser.set_defaults(func=profile_command)
+
+    args = parser.parse_args(argv)
+    return int(args.func(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import marshal
+import os
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from . import hook
+from .hook import ImpunityFinder, bytecode_path, install_import_hook
+
+# packages hooked in the current (worker) process
+_hooked_packages: Set[str] = set()
+
+
+class BuildResult(NamedTuple):
+    """Outcome of the compilation of one module.
+
+    Attributes:
+        module : str
+            Name of the module
+        path : str
+            Path to the source file of the module
+        duration : float
+            Time (in seconds) spent importing and rewriting the module
+        error : Optional[str]
+            Error message if the module could not be compiled
+    """
+
+    module: str
+    path: str
+    duration: float
+    error: Optional[str] = None
+
+
+def find_modules(path: Path) -> Tuple[Path, List[Tuple[str, Path]]]:
+    """List the modules of a package directory (or of a single module).
+
+    Returns the folder to add to ``sys.path`` to import them, and the list
+    of (module name, source file), sorted by module name.
+    """
+    path = path.resolve()
+    if path.is_file():
+        return path.parent, [(path.stem, path)]
+
+    root = path.parent
+    modules = []
+    for source in path.rglob("*.py"):
+        relative = source.relative_to(root).with_suffix("")
+        parts = relative.parts
+        if parts[-1] == "__init__":
+            parts = parts[:-1]
+        modules.append((".".join(parts), source))
+    return root, sorted(modules)
+
+
+def compile_module(root: str, package: str, module: str) -> BuildResult:
+    """Import a module through the impunity import hook in order to write
+    its rewritten bytecode. Meant to run in a worker process."""
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    sys.dont_write_bytecode = False
+    if package not in _hooked_packages:
+        install_import_hook(package)
+        _hooked_packages.add(package)
+
+    t0 = time.perf_counter()
+    try:
+        imported = importlib.import_module(module)
+    except BaseException:
+        error = traceback.format_exc(limit=-1).strip().splitlines()[-1]
+        return BuildResult(module, "", time.perf_counter() - t0, error)
+    return BuildResult(
+        module, imported.__file__ or "", time.perf_counter() - t0
+    )
+
+
+def compile_tree(
+    paths: Sequence[os.PathLike[str] | str],
+    jobs: Optional[int] = None,
+    force: bool = False,
+) -> List[BuildResult]:
+    """Write the rewritten bytecode of all the modules of some packages.
+
+    The modules are imported in a pool of ``jobs`` worker processes (one
+    per core by default) with the impunity import hook. The bytecode is
+    written in the ``__pycache__`` folders of the source tree, and then
+    loaded by processes which install the import hook for these packages.
+
+    With ``force``, existing rewritten bytecode is discarded first.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    tasks = []
+    for path in paths:
+        root, modules = find_modules(Path(path))
+        for module, source in modules:
+            if force:
+                Path(bytecode_path(str(source))).unlink(missing_ok=True)
+            package = module.split(".")[0]
+            tasks.append((str(root), package, module))
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(compile_module, *task) for task in tasks]
+        return [future.result() for future in futures]
+
+
+def precompile_module(
+    root: str, package: str, module: str
+) -> Tuple[BuildResult, Dict[str, bytes]]:
+    """Rewrite a module in a worker process, and return the rewritten code
+    of the modules imported for the first time in this worker (marshalled,
+    by source path)."""
+    known = set(hook._memory)
+    result = compile_module(root, package, module)
+    entries = {
+        path: marshal.dumps(entry)
+        for path, entry in hook._memory.items()
+        if path not in known
+    }
+    return result, entries
+
+
+def package_modules(package: str) -> Tuple[Path, List[str]]:
+    """List the modules of an importable package without importing it.
+
+    Returns the folder to add to ``sys.path`` to import them, and the
+    sorted list of their names.
+    """
+    spec = importlib.util.find_spec(package)
+    if spec is None or spec.origin is None:
+        raise ModuleNotFoundError(f"No module named {package!r}", name=package)
+    if not spec.submodule_search_locations:
+        return Path(spec.origin).parent, [package]
+
+    folder = Path(spec.origin).parent
+    depth = len(package.split("."))
+    modules = []
+    for source in folder.rglob("*.py"):
+        parts = source.relative_to(folder).with_suffix("").parts
+        if parts[-1] == "__init__":
+            parts = parts[:-1]
+        modules.append(".".join((package, *parts)))
+    return folder.parents[depth - 1], sorted(modules)
+
+
+def precompile(
+    package: str, workers: Optional[int] = None
+) -> List[BuildResult]:
+    """Rewrite the decorated functions of a package in parallel.
+
+    The modules of the package are rewritten in a pool of ``workers``
+    processes (one per core by default), and the rewritten code is sent
+    back to the current process. The import hook is installed for the
+    package: when the package is then imported, the decorators find their
+    functions already rewritten and have nothing left to analyse.
+
+    .. code-block:: python
+
+        import impunity
+
+        impunity.precompile("my_package", workers=8)
+
+        import my_package.models  # no analysis at this point
+
+    Call this function before the package is imported: modules which are
+    already imported are not affected. The rewritten code is also written
+    to the ``__pycache__`` folders, as with ``python -m impunity compile``.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    root, modules = package_modules(package)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(precompile_module, str(root), package, module)
+            for module in modules
+        ]
+        outcomes = [future.result() for future in futures]
+
+    results = []
+    for result, entries in outcomes:
+        for path, data in entries.items():
+            hook._memory[path] = marshal.loads(data)
+        results.append(result)
+
+    if not any(
+        isinstance(finder, ImpunityFinder) and finder.matches(package)
+        for finder in sys.meta_path
+    ):
+        install_import_hook(package)
+    return results
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import logging
+import marshal
+import os
+import re
+import sys
+import types
+from contextlib import contextmanager
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+from .registry import registry_fingerprint
+from .visitor import Visitor, is_annotated
+
+_log = logging.getLogger(__name__)
+
+MAGIC = b"IMPC"
+VERSION = 4
+
+
+class CacheInfo(NamedTuple):
+    """Counters of the on-disk cache of rewritten code.
+
+    Attributes:
+        hits : int
+            Number of decorated objects installed from the cache.
+        misses : int
+            Number of decorated objects analysed because no entry was found.
+        stores : int
+            Number of entries written to disk.
+        invalidations : int
+            Number of stale entries found on disk (and later overwritten).
+    """
+
+    hits: int
+    misses: int
+    stores: int
+    invalidations: int
+
+
+class CacheEntry(NamedTuple):
+    """Content of a cache file.
+
+    Attributes:
+        codes : dict[str, types.CodeType]
+            Rewritten code objects, indexed by method name for classes and
+            by the empty string for functions.
+        messages : list[str]
+            Warnings emitted during the analysis, replayed on a cache hit.
+    """
+
+    codes: Dict[str, types.CodeType]
+    messages: List[str]
+
+
+_counters: Dict[str, int] = dict(hits=0, misses=0, stores=0, invalidations=0)
+_file_digests: Dict[str, tuple[int, int, str]] = {}
+
+
+def cache_info() -> CacheInfo:
+    """Report hit/miss counts of the on-disk cache for the current process."""
+    return CacheInfo(**_counters)
+
+
+def cache_enabled() -> bool:
+    """Default value for the ``cache`` parameter of the decorator.
+
+    The cache is enabled through the ``IMPUNITY_CACHE`` environment variable
+    (any value but "", "0", "false" or "no"), or implicitly when
+    ``IMPUNITY_CACHE_DIR`` is set.
+    """
+    if os.environ.get("IMPUNITY_CACHE_DIR"):
+        return True
+    value = os.environ.get("IMPUNITY_CACHE", "")
+    return value.lower() not in ("", "0", "false", "no")
+
+
+@functools.lru_cache(maxsize=None)
+def impunity_version() -> str:
+    """Version of impunity, read once per process from the package
+    metadata."""
+    try:
+        return metadata.version("impunity")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def file_digest(filename: str) -> Optional[str]:
+    """Hash of a source file, memoized on its size and modification time."""
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    cached = _file_digests.get(filename)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    with open(filename, "rb") as fh:
+        digest = hashlib.sha256(fh.read()).hexdigest()
+    _file_digests[filename] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
+
+def impunity_functions(module: str) -> List[Callable[..., Any]]:
+    """Impunity functions defined in a module, sorted by name."""
+    return [
+        fun
+        for key, fun in sorted(Visitor.impunity_func.items())
+        if key[0] == module
+    ]
+
+
+def dependency_digest(fun: Callable[..., Any]) -> str:
+    """Summary of what the analysis reads outside of the source file.
+
+    Annotated aliases and signatures of impunity functions imported in the
+    module of ``fun``, or called as ``module.function(...)``, change the
+    rewritten code without changing its source.
+    """
+    fun_globals = sys.modules[fun.__module__].__dict__
+    elements = []
+    for name, value in fun_globals.items():
+        if is_annotated(value):
+            elements.append(f"{name}={value.__metadata__[0]!r}")
+        elif isinstance(value, types.ModuleType):
+            annotations = getattr(value, "__annotations__", {})
+            elements.append(f"{name}:{sorted(map(repr, annotations.items()))}")
+            for other in impunity_functions(value.__name__):
+                annotations = getattr(other, "__annotations__", {})
+                elements.append(
+                    f"{name}.{other.__name__}"
+                    f"{sorted(map(repr, annotations.items()))}"
+                )
+        elif callable(value) and hasattr(value, "__module__"):
+            key = (value.__module__, getattr(value, "__name__", ""))
+            if key in Visitor.impunity_func and key[0] != fun.__module__:
+                annotations = getattr(value, "__annotations__", {})
+                elements.append(f"{name}{sorted(annotations.items())!r}")
+    return hashlib.sha256("\n".join(sorted(elements)).encode()).hexdigest()
+
+
+def cache_key(fun: Callable[..., Any], *options: Any) -> Optional[str]:
+    """Key of the cache entry for a decorated function or class.
+
+    The key covers the source file, the position of the object in the file,
+    the impunity and Python versions, the unit registry and the decorator
+    options. Returns None when the source file cannot be found.
+    """
+    try:
+        filename = inspect.getfile(fun)
+    except TypeError:
+        return None
+    if (source_digest := file_digest(filename)) is None:
+        return None
+
+    code = getattr(fun, "__code__", None)
+    firstlineno = getattr(code, "co_firstlineno", 0)
+    elements = [
+        f"v{VERSION}",
+        impunity_version(),
+        sys.version,
+        registry_fingerprint(),
+        source_digest,
+        f"{fun.__module__}.{fun.__qualname__}:{firstlineno}",
+        repr(options),
+        dependency_digest(fun),
+    ]
+    return hashlib.sha256("\n".join(elements).encode()).hexdigest()
+
+
+def cache_path(fun: Callable[..., Any]) -> Optional[Path]:
+    """Location of the cache file, in a __pycache__ folder by default.
+
+    The ``IMPUNITY_CACHE_DIR`` environment variable redirects all cache
+    files to a single directory.
+    """
+    try:
+        source = Path(inspect.getfile(fun))
+    except TypeError:
+        return None
+    qualname = re.sub(r"[^\w.]", "_", fun.__qualname__)
+    tag = sys.implementation.cache_tag
+    if directory := os.environ.get("IMPUNITY_CACHE_DIR"):
+        filename = f"{fun.__module__}.{qualname}.impunity-{tag}.bin"
+        return Path(directory) / filename
+    filename = f"{source.stem}.{qualname}.impunity-{tag}.bin"
+    return source.parent / "__pycache__" / filename
+
+
+def load(fun: Callable[..., Any], key: str) -> Optional[CacheEntry]:
+    """Return the cached entry of ``fun`` if it matches ``key``."""
+    path = cache_path(fun)
+    try:
+        assert path is not None
+        data = path.read_bytes()
+    except (AssertionError, OSError):
+        _counters["misses"] += 1
+        return None
+
+    header = MAGIC + bytes.fromhex(key)
+    if not data.startswith(header):
+        _counters["invalidations"] += 1
+        _counters["misses"] += 1
+        return None
+
+    try:
+        codes, messages = marshal.loads(data[len(header) :])
+    except (EOFError, ValueError, TypeError):
+        _log.debug(f"Corrupted cache file {path}")
+        _counters["invalidations"] += 1
+        _counters["misses"] += 1
+        return None
+
+    _counters["hits"] += 1
+    return CacheEntry(codes, messages)
+
+
+def store(
+    fun: Callable[..., Any],
+    key: str,
+    codes: Dict[str, types.CodeType],
+    messages: List[str],
+) -> None:
+    """Write an entry for ``fun``, replacing any stale one."""
+    if (path := cache_path(fun)) is None:
+        return
+    payload = MAGIC + bytes.fromhex(key) + marshal.dumps((codes, messages))
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        _log.debug(f"Could not write cache file {path}: {e}")
+        return
+    _counters["stores"] += 1
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self, records: List[str]) -> None:
+        super().__init__(logging.WARNING)
+        self.records = records
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record.getMessage())
+
+
+@contextmanager
+def record_warnings() -> Iterator[List[str]]:
+    """Collect the warnings emitted by the visitor during the analysis."""
+    records: List[str] = []
+    handler = _ListHandler(records)
+    logger = logging.getLogger("impunity.visitor")
+    logger.addHandler(handler)
+    try:
+        yield records
+    finally:
+        logger.removeHandler(handler)
+
+
+def replay_warnings(messages: List[str]) -> None:
+    logger = logging.getLogger("impunity.visitor")
+    for msg in messages:
+        logger.warning(msg)
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import functools
+from math import isclose
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
+
+from . import registry, units
+from .registry import get_registry
+from .stats import count
+
+if TYPE_CHECKING:
+    from pint import Unit
+
+# number of entries kept in the caches (least recently used are evicted)
+UNIT_CACHE_SIZE = 1024
+PLAN_CACHE_SIZE = 4096
+
+
+class UnitInfo(NamedTuple):
+    """A parsed unit of measure.
+
+    Attributes:
+        unit : pint.Unit
+            The unit, parsed by the unit registry
+        dimensionality : Any
+            Dimensionality of the unit (e.g. [length] / [time])
+    """
+
+    unit: Unit
+    dimensionality: Any
+
+
+class ConversionPlan(NamedTuple):
+    """How to convert values from one unit to another.
+
+    A value ``x`` in the received unit is ``scale * x + offset`` in the
+    expected unit.
+
+    Attributes:
+        kind : str
+            One of "identity", "scale", "offset" (scale is 1), "affine", or
+            "nonlinear" (no conversion can be inserted in the code)
+        scale : float
+            Multiplicative factor
+        offset : float
+            Additive constant
+        factor : float
+            Value of one received unit in the expected unit
+    """
+
+    kind: str
+    scale: float = 1
+    offset: float = 0
+    factor: float = 1
+
+
+IDENTITY = ConversionPlan("identity")
+
+
+@functools.lru_cache(maxsize=UNIT_CACHE_SIZE)
+def parse_unit(unit: Any) -> UnitInfo:
+    """Parse a unit with the registry of impunity (memoized)."""
+    count(pint_calls=1)
+    pint_unit = get_registry().Unit(unit)
+    return UnitInfo(pint_unit, pint_unit.dimensionality)
+
+
+def builtin_unit(unit: Any) -> Optional[units.Unit]:
+    """Parse a unit with the table of common units of impunity, unless a
+    custom registry is configured. Returns None if pint is needed."""
+    if isinstance(unit, units.Unit):
+        return unit
+    if registry._custom:
+        return None
+    return units.parse(unit)
+
+
+def product(left: Any, right: Any, divide: bool = False) -> Any:
+    """Unit of the product (or of the quotient) of two quantities.
+
+    The result is an interned unit (see :mod:`impunity.units`) if both units
+    are in the table of common units, or else an expression for pint.
+    """
+    left_unit, right_unit = builtin_unit(left), builtin_unit(right)
+    if (
+        left_unit is None
+        or right_unit is None
+        or left_unit.offset != 0
+        or right_unit.offset != 0
+    ):
+        operator = "/" if divide else "*"
+        return f"{units.group(str(left))}{operator}{units.group(str(right))}"
+    if divide:
+        return units.intern(left_unit / right_unit)
+    return units.intern(left_unit * right_unit)
+
+
+def power(unit: Any, exponent: Any) -> Any:
+    """Unit of a quantity raised to a constant exponent."""
+    builtin = builtin_unit(unit)
+    if (
+        builtin is None
+        or builtin.offset != 0
+        or not isinstance(exponent, (int, float))
+    ):
+        return f"({unit})^({exponent!r})"
+    return units.intern(builtin ** units.normalize(exponent))
+
+
+def is_unit(unit: Any) -> bool:
+    """Check whether a unit is defined (in the table of common units, or
+    else in the registry)."""
+    if builtin_unit(unit) is not None:
+        return True
+    count(pint_calls=1)
+    return unit in get_registry()
+
+
+@functools.lru_cache(maxsize=PLAN_CACHE_SIZE)
+def conversion_plan(received: Any, expected: Any) -> Optional[ConversionPlan]:
+    """Compute how to convert values from the received to the expected unit.
+
+    Returns None if the units are not compatible. Plans are memoized for
+    each pair of units, and shared by all the visitors of the process.
+    Common units are converted with the built-in table of units, without
+    importing pint (see :mod:`impunity.units`).
+    """
+    received_unit = builtin_unit(received)
+    expected_unit = builtin_unit(expected)
+    if received_unit is not None and expected_unit is not None:
+        if not received_unit.is_compatible_with(expected_unit):
+            return None
+        scale, offset = units.affine(received_unit, expected_unit)
+        if isclose(scale, 1, rel_tol=1e-14):
+            scale = 1  # rounding errors between aliases (e.g. dPa and µbar)
+        if offset == 0:
+            if scale == 1:
+                return IDENTITY
+            return ConversionPlan("scale", scale, 0, scale)
+        kind = "offset" if scale == 1 else "affine"
+        return ConversionPlan(kind, scale, offset, scale + offset)
+
+    # derived units are known to pint by their expression
+    if isinstance(received, units.Unit):
+        received = received.name
+    if isinstance(expected, units.Unit):
+        expected = expected.name
+    received_info = parse_unit(received)
+    expected_info = parse_unit(expected)
+    count(pint_calls=1)
+    if not received_info.unit.is_compatible_with(expected_info.unit):
+        return None
+
+    count(pint_calls=3)
+    Q_ = get_registry().Quantity
+    e0 = Q_(0, received).to(expected).m
+    e1 = Q_(1, received).to(expected).m
+    e10 = Q_(10, received).to(expected).m
+
+    if e0 == 0:
+        if e1 == 1:
+            return IDENTITY
+        return ConversionPlan("scale", e1, 0, e1)
+    if e1 - e0 == 1:
+        return ConversionPlan("offset", 1, e1 - 1, e1)
+    if isclose(10 * (e1 - e0) + e0, e10):
+        return ConversionPlan("affine", e1 - e0, e0, e1)
+    return ConversionPlan("nonlinear", factor=e1)
+
+
+def clear_cache() -> None:
+    """Discard all parsed units and conversion plans, e.g. when the unit
+    registry changes."""
+    from .converters import channel_factors, converter
+
+    parse_unit.cache_clear()
+    conversion_plan.cache_clear()
+    converter.cache_clear()
+    channel_factors.cache_clear()
+    units.clear()
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import functools
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+from .conversion import conversion_plan
+from .runtime import BLOCK_SIZE, _affine_kernel, _numpy, affine
+
+# number of converters kept in the cache (least recently used are evicted)
+CONVERTER_CACHE_SIZE = 1024
+
+# types converted without looking for NumPy arrays
+SCALAR_TYPES = {float, int}
+
+
+def convert_array(value: Any, scale: float, offset: float, out: Any) -> Any:
+    """Return ``value * scale + offset``, computed into ``out`` if it is not
+    None.
+
+    Memory-mapped arrays are converted block by block, so that the values
+    are read only once and no temporary array of the size of the file is
+    allocated. Arrays of floating point numbers keep their dtype.
+    """
+    numpy = _numpy()
+    if out is None and (numpy is None or not isinstance(value, numpy.memmap)):
+        if offset != 0:
+            return affine(value, scale, offset)
+        return value * scale
+    if out is not None and (
+        numpy is None or not isinstance(out, numpy.ndarray)
+    ):
+        raise TypeError("out= must be a NumPy array")
+
+    value = numpy.asanyarray(value)
+    if out is None:
+        dtype = numpy.result_type(value.dtype, 1.0)
+        out = numpy.empty(value.shape, dtype=dtype)
+    if (
+        value.shape == out.shape
+        and value.flags.c_contiguous
+        and out.flags.c_contiguous
+    ):
+        _affine_kernel(numpy, value, scale, offset, out)
+    else:
+        numpy.multiply(value, scale, out=out)
+        if offset != 0:
+            numpy.add(out, offset, out=out)
+    return out
+
+
+def identity(value: Any, out: Any = None) -> Any:
+    """Convert values between equivalent units."""
+    if out is None:
+        return value
+    return convert_array(value, 1, 0, out)
+
+
+def specialize(scale: float, offset: float) -> Callable[..., Any]:
+    """Build a function computing ``value * scale + offset``, with a fast
+    path for scalars."""
+
+    if scale == 1 and offset == 0:
+        return identity
+
+    if offset == 0:
+
+        def scaled(value: Any, out: Any = None) -> Any:
+            if out is None and type(value) in SCALAR_TYPES:
+                return value * scale
+            return convert_array(value, scale, 0, out)
+
+        return scaled
+
+    def shifted(value: Any, out: Any = None) -> Any:
+        if out is None and type(value) in SCALAR_TYPES:
+            return value * scale + offset
+        return convert_array(value, scale, offset, out)
+
+    return shifted
+
+
+@functools.lru_cache(maxsize=CONVERTER_CACHE_SIZE)
+def converter(src: Any, dst: Any) -> Callable[..., Any]:
+    """Return a function converting values from the ``src`` to the ``dst``
+    unit, for code outside decorated functions.
+
+    The conversion is planned once (see
+    :func:`impunity.conversion.conversion_plan`), and the function returned
+    only multiplies values by a constant and/or adds a constant: its cost is
+    close to the one of the bare operation. Converters are cached for each
+    pair of units.
+
+    The function takes a scalar or an array, and an optional ``out``
+    argument (a NumPy array, possibly the value itself, in which the result
+    is written). Arrays of floating point numbers keep their dtype, and
+    ``np.memmap`` arrays are converted block by block.
+
+    .. code-block:: python
+
+        to_knots = impunity.converter("km/h", "kts")
+        to_knots(100)  # 53.99568034557236
+        to_knots(speeds, out=speeds)  # in place
+
+    Raises ValueError if the units are not compatible, or if the conversion
+    is not affine (e.g. for logarithmic units).
+    """
+    return specialize(*affine_plan(src, dst))
+
+
+def affine_plan(src: Any, dst: Any) -> Tuple[float, float]:
+    """Scale and offset of the conversion between two units."""
+    plan = conversion_plan(src, dst)
+    if plan is None:
+        raise ValueError(f"Cannot convert from {src} to {dst}")
+    if plan.kind == "nonlinear":
+        raise ValueError(f"Conversion from {src} to {dst} is not affine")
+    return plan.scale, plan.offset
+
+
+@functools.lru_cache(maxsize=CONVERTER_CACHE_SIZE)
+def channel_factors(
+    from_units: Tuple[Any, ...], to_units: Tuple[Any, ...]
+) -> Tuple[Any, Optional[Any]]:
+    """Scales and offsets (None if all zero) of the conversions of several
+    channels, as read-only NumPy arrays."""
+    import numpy
+
+    if len(from_units) != len(to_units):
+        raise ValueError(
+            f"{len(from_units)} units to convert from, "
+            f"but {len(to_units)} units to convert to"
+        )
+    factors = []
+    for i, (src, dst) in enumerate(zip(from_units, to_units)):
+        try:
+            factors.append(affine_plan(src, dst))
+        except ValueError as error:
+            raise ValueError(f"Channel {i}: {error}") from None
+    scales = numpy.array([scale for scale, _ in factors], dtype=float)
+    offsets = numpy.array([offset for _, offset in factors], dtype=float)
+    scales.flags.writeable = False
+    offsets.flags.writeable = False
+    return scales, offsets if offsets.any() else None
+
+
+def batch_convert(
+    matrix: Any,
+    from_units: Sequence[Any],
+    to_units: Sequence[Any],
+    axis: int = -1,
+    out: Any = None,
+) -> Any:
+    """Convert channels of values with different units at once.
+
+    The ``axis`` of ``matrix`` indexes the channels: e.g. with the default
+    (-1), each column of a 2-D array is a channel, converted from
+    ``from_units[i]`` to ``to_units[i]``. The scales and offsets of the
+    conversions are computed once for each tuple of units, and applied to
+    all the values in a single pass over memory, block by block. Arrays of
+    floating point numbers keep their dtype; pass ``out=matrix`` to convert
+    them in place.
+
+    .. code-block:: python
+
+        batch_convert(telemetry, ["ft", "kts", "degC"], ["m", "m/s", "K"])
+
+    Raises ValueError if the units of a channel are not compatible.
+    """
+    import numpy
+
+    scales, offsets = channel_factors(tuple(from_units), tuple(to_units))
+    matrix = numpy.asanyarray(matrix)
+    if matrix.ndim == 0 or matrix.shape[axis] != scales.size:
+        raise ValueError(
+            f"Expected {scales.size} channels along axis {axis} of an array "
+            f"of shape {matrix.shape}"
+        )
+    if out is None:
+        dtype = numpy.result_type(matrix.dtype, 1.0)
+        out = numpy.empty(matrix.shape, dtype=dtype)
+
+    # broadcast the factors along the axis of the channels
+    shape = [1] * matrix.ndim
+    shape[axis] = scales.size
+    scales = scales.reshape(shape)
+    if offsets is not None:
+        offsets = offsets.reshape(shape)
+
+    # blocks of rows (or of columns if channels are rows) fitting in cache
+    other = 1 if axis in (0, -matrix.ndim) else 0
+    length = matrix.shape[other] if matrix.ndim > 1 else 1
+    step = max(1, BLOCK_SIZE * length // max(matrix.size, 1))
+    for start in range(0, length, step):
+        index = [slice(None)] * matrix.ndim
+        if matrix.ndim > 1:
+            index[other] = slice(start, start + step)
+        block = tuple(index)
+        numpy.multiply(matrix[block], scales, out=out[block])
+        if offsets is not None:
+            numpy.add(out[block], offsets, out=out[block])
+    return out
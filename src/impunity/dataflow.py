@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import ast
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# units of the variables on a path of the code, by name
+Units = Dict[str, Any]
+
+# statements after which the next statement is not run
+JUMPS = (ast.Return, ast.Raise, ast.Break, ast.Continue)
+LOOPS = (ast.For, ast.AsyncFor, ast.While)
+DEFINITIONS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+def terminates(stmts: List[ast.stmt]) -> bool:
+    """Check whether a block never runs the statement following it (it
+    always returns, raises, breaks or continues)."""
+    if not stmts:
+        return False
+    last = stmts[-1]
+    if isinstance(last, JUMPS):
+        return True
+    if isinstance(last, ast.If):
+        return terminates(last.body) and terminates(last.orelse)
+    return False
+
+
+def loop_jumps(stmts: List[ast.stmt]) -> Iterator[ast.stmt]:
+    """Find the ``break`` and ``continue`` statements of the body of a loop
+    (not those of nested loops or functions)."""
+    for stmt in stmts:
+        if isinstance(stmt, (ast.Break, ast.Continue)):
+            yield stmt
+        elif not isinstance(stmt, (*LOOPS, *DEFINITIONS)):
+            for field in ("body", "orelse", "finalbody"):
+                yield from loop_jumps(getattr(stmt, field, []))
+            for handler in getattr(stmt, "handlers", []):
+                yield from loop_jumps(handler.body)
+            for case in getattr(stmt, "cases", []):
+                yield from loop_jumps(case.body)
+
+
+def merge(
+    states: List[Units],
+    compatible: Callable[[Any, Any], bool],
+    before: Optional[Units] = None,
+) -> Tuple[Units, List[Dict[str, Tuple[Any, Any]]], List[str]]:
+    """Merge the units of the variables at the end of several paths joining
+    at the same point (the phi functions of SSA form).
+
+    A variable with different units on several paths takes the unit it has
+    on most paths (then its unit ``before`` the paths, then its unit on the
+    first path); the other paths convert it before the join, so that paths
+    which do not change the unit of a variable do not convert it. The unit
+    of a variable is unknown after the join if it is unknown (None) on one
+    of the paths, or if it has incompatible units on several paths.
+
+    Returns the merged units, the conversions (variable: (unit on the path,
+    merged unit)) to append to each path, and the names of the variables
+    with incompatible units.
+    """
+    conversions: List[Dict[str, Tuple[Any, Any]]] = [{} for _ in states]
+    if not states:
+        return {}, conversions, []
+    merged = dict(states[0])
+    if all(state == states[0] for state in states[1:]):
+        return merged, conversions, []
+
+    incompatible: List[str] = []
+    for state in states[1:]:
+        for name, unit in state.items():
+            if merged.get(name, None) != unit:
+                merged[name] = elect(name, states, before)
+
+    for name, unit in list(merged.items()):
+        if unit is None:
+            continue
+        if any(name in state and state[name] is None for state in states):
+            merged[name] = None
+            continue
+        paths: Dict[int, Any] = {
+            i: state[name]
+            for i, state in enumerate(states)
+            if state.get(name, None) not in (None, unit)
+        }
+        if not all(compatible(other, unit) for other in paths.values()):
+            incompatible.append(name)
+            merged[name] = None
+            continue
+        for i, other in paths.items():
+            conversions[i][name] = (other, unit)
+    return merged, conversions, incompatible
+
+
+def elect(name: str, states: List[Units], before: Optional[Units]) -> Any:
+    """Choose the unit of a variable after the join of several paths."""
+    units = [state[name] for state in states if state.get(name) is not None]
+    if not units:
+        return None
+    votes = {unit: units.count(unit) for unit in units}
+    most = max(votes.values())
+    if before is not None and votes.get(before.get(name, None), 0) == most:
+        return before[name]
+    return next(unit for unit in units if votes[unit] == most)
+
+
+def restart(before: Units, state: Units) -> Units:
+    """Units at the start of another path from the same point as a visited
+    path: the units known before, and the units of the variables introduced
+    on the visited path, which serve as declarations."""
+    result = dict(before)
+    for name, unit in state.items():
+        if name not in before:
+            result[name] = unit
+    return result
+
+
+def loop_back(before: Units, state: Units) -> Dict[str, Tuple[Any, Any]]:
+    """Conversions at the end of the body of a loop, which bring back the
+    variables to their units at the start of the loop."""
+    return {
+        name: (state[name], unit)
+        for name, unit in before.items()
+        if unit is not None
+        and state.get(name, None) is not None
+        and state[name] != unit
+    }
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import ast
+import hashlib
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import logging
+import marshal
+import os
+import sys
+import types
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from .cache import file_digest, impunity_functions, impunity_version
+from .module import register_tree, rewrite_module
+from .registry import registry_fingerprint
+from .visitor import Visitor, is_annotated
+
+_log = logging.getLogger(__name__)
+
+MAGIC = importlib.util.MAGIC_NUMBER + b"IMPH"
+OPTIMIZATION = "impunity"
+
+Dependencies = Tuple[Tuple[str, str], ...]
+# the rewritten code and the qualified names of the definitions replaced
+# with their rewritten version in this code
+Entry = Tuple[str, Dependencies, types.CodeType, Tuple[str, ...]]
+Precompiled = Tuple[types.CodeType, Tuple[str, ...]]
+
+# rewritten code of the modules loaded by the hook, by source path, and code
+# rewritten by the workers of impunity.precompile()
+_memory: Dict[str, Entry] = {}
+
+
+def bytecode_path(source_path: str) -> str:
+    """Location of the rewritten bytecode, next to the regular .pyc files.
+
+    For example: ``__pycache__/module.cpython-311.opt-impunity.pyc``.
+    """
+    return importlib.util.cache_from_source(
+        source_path, optimization=OPTIMIZATION
+    )
+
+
+def source_key(source: bytes) -> str:
+    elements = [
+        hashlib.sha256(source).hexdigest(),
+        impunity_version(),
+        registry_fingerprint(),
+    ]
+    return hashlib.sha256("\n".join(elements).encode()).hexdigest()
+
+
+def alias_origins(module: types.ModuleType, tree: ast.AST) -> Set[str]:
+    """Names of the modules from which ``module`` imports annotated aliases
+    (e.g. ``from .units import m``), according to its own import
+    statements."""
+    fun_globals = vars(module)
+    origins = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ImportFrom):
+            continue
+        relative = "." * node.level + (node.module or "")
+        try:
+            origin = importlib.util.resolve_name(relative, module.__package__)
+        except ImportError:
+            continue
+        if any(
+            is_annotated(fun_globals.get(alias.asname or alias.name, None))
+            for alias in node.names
+        ):
+            origins.add(origin)
+    return origins
+
+
+def module_dependencies(
+    module: types.ModuleType, tree: Optional[ast.AST] = None
+) -> Dependencies:
+    """Source files read by the analysis of a module, besides its own.
+
+    The analysis reads the annotations and aliases of modules imported in
+    the module, the signatures of impunity functions imported from other
+    modules, and the annotated aliases imported from other modules (found
+    in the import statements of ``tree``, the AST of the module). The
+    dependencies only depend on the module, not on the other modules
+    already imported, so that the bytecode is the same whatever the order
+    of the imports.
+    """
+    if tree is None:
+        with open(module.__file__ or "", "rb") as fh:
+            tree = ast.parse(fh.read())
+    filenames = set()
+    for name in alias_origins(module, tree):
+        origin = sys.modules.get(name, None)
+        filenames.add(getattr(origin, "__file__", None))
+    for value in list(vars(module).values()):
+        if isinstance(value, types.ModuleType):
+            if (
+                getattr(value, "__annotations__", None)
+                or impunity_functions(value.__name__)
+                or any(map(is_annotated, list(vars(value).values())))
+            ):
+                filenames.add(getattr(value, "__file__", None))
+        elif callable(value) and hasattr(value, "__module__"):
+            key = (value.__module__, getattr(value, "__name__", ""))
+            if key in Visitor.impunity_func and key[0] != module.__name__:
+                origin = sys.modules.get(key[0], None)
+                filenames.add(getattr(origin, "__file__", None))
+
+    # relative paths keep the bytecode valid when the tree is moved
+    folder = os.path.dirname(module.__file__ or "")
+    dependencies = []
+    for filename in sorted(f for f in filenames if f and f.endswith(".py")):
+        if (digest := file_digest(filename)) is not None:
+            dependencies.append((os.path.relpath(filename, folder), digest))
+    return tuple(dependencies)
+
+
+class ImpunityLoader(importlib.machinery.SourceFileLoader):
+    """Load modules with the conversions already inserted in the bytecode.
+
+    On the first import, the module is executed in batch mode (see
+    :func:`impunity.rewrite_module`): decorated definitions are replaced in
+    the AST of the module by their rewritten version, and the resulting
+    module is compiled and cached as a .pyc file. The next imports load this
+    bytecode directly, and the decorators of the replaced definitions do not
+    run any analysis while the module is executed.
+    """
+
+    def load_bytecode(
+        self, source_path: str, key: str
+    ) -> Optional[Precompiled]:
+        entry = _memory.get(source_path, None)
+        if entry is None or not self.is_valid(source_path, key, entry):
+            try:
+                with open(bytecode_path(source_path), "rb") as fh:
+                    data = fh.read()
+            except OSError:
+                return None
+            if not data.startswith(MAGIC):
+                return None
+            try:
+                entry = marshal.loads(data[len(MAGIC) :])
+            except (EOFError, ValueError, TypeError):
+                return None
+            if not self.is_valid(source_path, key, entry):
+                return None
+            _memory[source_path] = entry
+        return entry[2], entry[3]
+
+    @staticmethod
+    def is_valid(source_path: str, key: str, entry: Entry) -> bool:
+        if not isinstance(entry, tuple) or len(entry) != 4:
+            return False
+        cached_key, dependencies, _code, _spliced = entry
+        if cached_key != key:
+            return False
+        folder = os.path.dirname(source_path)
+        for filename, digest in dependencies:
+            if file_digest(os.path.join(folder, filename)) != digest:
+                return False
+        return True
+
+    def write_bytecode(
+        self,
+        source_path: str,
+        key: str,
+        dependencies: Dependencies,
+        code: types.CodeType,
+        spliced: Tuple[str, ...],
+    ) -> None:
+        if sys.dont_write_bytecode:
+            return
+        path = bytecode_path(source_path)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        # marshal flags objects depending on their reference count: a round
+        # trip makes the output reproducible from one build to the other
+        entry = (key, dependencies, code, spliced)
+        content = marshal.loads(marshal.dumps(entry))
+        data = marshal.dumps(content)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as fh:
+                fh.write(MAGIC + data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            _log.debug(f"Could not write {path}: {e}")
+
+    def exec_module(self, module: types.ModuleType) -> None:
+        source_path = self.get_filename(module.__name__)
+        source = self.get_data(source_path)
+        key = source_key(source)
+
+        if (precompiled := self.load_bytecode(source_path, key)) is not None:
+            code, spliced = precompiled
+            # the decorators of these definitions have nothing left to do
+            module.__impunity_precompiled__ = spliced  # type: ignore
+            exec(code, module.__dict__)
+            return
+
+        tree = ast.parse(source, filename=source_path)
+        original_code = compile(tree, source_path, "exec", dont_inherit=True)
+
+        module.__impunity_batch__ = True  # type: ignore
+        replaced = register_tree(module.__name__, tree)
+        exec(original_code, module.__dict__)
+        # a no-op if the module already called rewrite_module itself
+        rewrite_module(module)
+
+        new_code = compile(tree, source_path, "exec", dont_inherit=True)
+        dependencies = module_dependencies(module, tree)
+        entry = (key, dependencies, new_code, tuple(sorted(replaced)))
+        _memory[source_path] = entry
+        self.write_bytecode(source_path, *entry)
+
+
+class ImpunityFinder(importlib.abc.MetaPathFinder):
+    """Meta path finder applying :class:`ImpunityLoader` to some packages."""
+
+    def __init__(self, packages: Sequence[str]) -> None:
+        self.packages = tuple(packages)
+
+    def matches(self, fullname: str) -> bool:
+        return any(
+            fullname == package or fullname.startswith(package + ".")
+            for package in self.packages
+        )
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]],
+        target: Optional[types.ModuleType] = None,
+    ) -> Optional[importlib.machinery.ModuleSpec]:
+        if not self.matches(fullname):
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path, target)
+        if spec is None or not isinstance(
+            spec.loader, importlib.machinery.SourceFileLoader
+        ):
+            return None
+        assert spec.origin is not None
+        spec.loader = ImpunityLoader(fullname, spec.origin)
+        return spec
+
+
+_finders: List[ImpunityFinder] = []
+
+
+def install_import_hook(*packages: str) -> ImpunityFinder:
+    """Rewrite the given packages (and their subpackages) at import time.
+
+    Decorated functions and classes of these packages are rewritten once,
+    and the rewritten module is cached in a ``.opt-impunity.pyc`` file in
+    the ``__pycache__`` folder. The next imports load this bytecode, which
+    already contains the conversions, so the decorators have nothing left
+    to do.
+
+    .. code-block:: python
+
+        import impunity
+
+        impunity.install_import_hook("my_package")
+
+        import my_package.models  # rewritten and cached
+
+    The hook must be installed before the packages are imported.
+    """
+    finder = ImpunityFinder(packages)
+    sys.meta_path.insert(0, finder)
+    _finders.append(finder)
+    return finder
+
+
+def uninstall_import_hook() -> None:
+    """Remove all the finders added by :func:`install_import_hook`."""
+    while _finders:
+        finder = _finders.pop()
+        if finder in sys.meta_path:
+            sys.meta_path.remove(finder)
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import ast
+import builtins
+import copy
+import sys
+import threading
+import types
+import weakref
+from typing import Any, Callable, Dict, List, NamedTuple, Set, Tuple
+
+# maximal number of nodes in the expression of an inlined function
+INLINE_MAX_SIZE = 60
+
+# expressions which do not evaluate all their operands exactly once, in
+# order, or which bind names
+UNSUPPORTED = (
+    ast.BoolOp,
+    ast.IfExp,
+    ast.Lambda,
+    ast.ListComp,
+    ast.SetComp,
+    ast.DictComp,
+    ast.GeneratorExp,
+    ast.NamedExpr,
+    ast.Await,
+    ast.Yield,
+    ast.YieldFrom,
+    ast.Starred,
+)
+
+
+class Inlinable(NamedTuple):
+    """A decorated function which can be inlined in its callers.
+
+    Attributes:
+        params : tuple[str, ...]
+            Names of the parameters of the function
+        expression : ast.expr
+            Rewritten expression returned by the function, in terms of its
+            parameters and of globals
+        size : int
+            Number of nodes of the expression
+        names : frozenset[str]
+            Global (or builtin) names read by the expression
+    """
+
+    params: Tuple[str, ...]
+    expression: ast.expr
+    size: int
+    names: frozenset[str]
+
+
+_inlinable: weakref.WeakKeyDictionary[Any, Inlinable] = (
+    weakref.WeakKeyDictionary()
+)
+_inlined: Dict[str, List[str]] = {}
+_lock = threading.Lock()
+
+
+def inline_info() -> Dict[str, List[str]]:
+    """Report the calls inlined in the functions decorated with
+    ``@impunity(inline=True)``, by caller (module and qualified names)."""
+    with _lock:
+        return {caller: list(callees) for caller, callees in _inlined.items()}
+
+
+def calls(node: ast.AST) -> List[ast.Call]:
+    """Calls in an expression, in the order in which they are made."""
+    result: List[ast.Call] = []
+    for child in ast.iter_child_nodes(node):
+        result += calls(child)
+    if isinstance(node, ast.Call):
+        result.append(node)
+    return result
+
+
+def substitute(node: ast.expr, values: Dict[str, ast.expr]) -> ast.expr:
+    """Replace the names of ``values`` in a (copied) expression."""
+
+    class Substitution(ast.NodeTransformer):
+        def visit_Name(self, name: ast.Name) -> ast.AST:
+            if name.id in values:
+                return values[name.id]
+            return name
+
+    return Substitution().visit(node)  # type: ignore
+
+
+def register_inlinable(fun: Any, definition: ast.stmt) -> None:
+    """Record the rewritten definition of a decorated function, if it can be
+    inlined in its callers.
+
+    The body of the function must be a sequence of assignments to local
+    variables, each used once, followed by a return statement: the local
+    variables are substituted in the returned expression. Functions with
+    default values, variable arguments or closures are not inlined, nor
+    are functions wrapped by other decorators (calls resolve to the
+    wrapper).
+    """
+    if not (
+        isinstance(definition, ast.FunctionDef)
+        and isinstance(fun, types.FunctionType)
+        and not fun.__code__.co_freevars
+    ):
+        return
+    args = definition.args
+    if (
+        args.posonlyargs
+        or args.vararg
+        or args.kwonlyargs
+        or args.kwarg
+        or args.defaults
+    ):
+        return
+
+    body = list(definition.body)
+    if (
+        body
+        and isinstance(body[0], ast.Expr)
+        and isinstance(body[0].value, ast.Constant)
+    ):
+        body = body[1:]  # docstring
+    if not body or not isinstance(body[-1], ast.Return):
+        return
+    returned = body[-1].value
+    if returned is None:
+        return
+
+    expression = copy.deepcopy(returned)
+    made = calls(returned)
+    locals_: Dict[str, ast.expr] = {}
+    for stmt in body[:-1]:
+        if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1:
+            target, value = stmt.targets[0], stmt.value
+        elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+            target, value = stmt.target, stmt.value
+        else:
+            return
+        if not isinstance(target, ast.Name) or target.id in locals_:
+            return
+        locals_[target.id] = value
+    order = [call for value in locals_.values() for call in calls(value)]
+    order += made
+
+    for name, value in reversed(list(locals_.items())):
+        uses = sum(
+            isinstance(node, ast.Name) and node.id == name
+            for node in ast.walk(expression)
+        )
+        if uses != 1:
+            return
+        # the value may refer to the variables assigned before
+        expression = substitute(expression, {name: copy.deepcopy(value)})
+
+    nodes = list(ast.walk(expression))
+    if any(isinstance(node, UNSUPPORTED) for node in nodes):
+        return
+    # calls (which may have side effects) are made in the same order
+    original = [ast.dump(call) for call in order]
+    if [ast.dump(call) for call in calls(expression)] != original:
+        return
+
+    params = tuple(arg.arg for arg in args.args)
+    names = frozenset(
+        node.id
+        for node in nodes
+        if isinstance(node, ast.Name) and node.id not in params
+    )
+    if names & set(locals_):
+        return
+    with _lock:
+        _inlinable[fun] = Inlinable(params, expression, len(nodes), names)
+
+
+def is_pure(node: ast.expr) -> bool:
+    """Check whether evaluating an argument has no side effect (names,
+    literals and arithmetic operations on them)."""
+    return all(
+        isinstance(
+            child,
+            (
+                ast.Name,
+                ast.Constant,
+                ast.BinOp,
+                ast.UnaryOp,
+                ast.operator,
+                ast.unaryop,
+                ast.expr_context,
+            ),
+        )
+        for child in ast.walk(node)
+    )
+
+
+def local_names(node: ast.AST) -> Set[str]:
+    """Names bound in a function (including its parameters)."""
+    names: Set[str] = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name) and not isinstance(child.ctx, ast.Load):
+            names.add(child.id)
+        elif isinstance(child, ast.arg):
+            names.add(child.arg)
+        elif isinstance(child, (ast.Global, ast.Nonlocal)):
+            names.update(child.names)
+        elif isinstance(child, ast.alias):
+            names.add(child.asname or child.name.split(".")[0])
+        elif isinstance(child, ast.ExceptHandler) and child.name:
+            names.add(child.name)
+        elif child is not node and isinstance(
+            child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+        ):
+            names.add(child.name)
+    return names
+
+
+class CallInliner(ast.NodeTransformer):
+    """Substitute the expression of small decorated functions to the calls
+    made by a function.
+
+    Arguments must be free of side effects (see :func:`is_pure`), and the
+    global names read by the inlined expression must refer to the same
+    objects in the caller. The conversions of the callee then appear next
+    to the conversions of the caller, and are merged by the optimisation
+    passes.
+    """
+
+    def __init__(
+        self,
+        fun: Callable[..., Any],
+        max_size: int = INLINE_MAX_SIZE,
+    ) -> None:
+        self.fun = fun
+        self.max_size = max_size
+        self.fun_globals = sys.modules[fun.__module__].__dict__
+        self.locals: Set[str] = set()
+        self.inlined: List[str] = []
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.AST:
+        saved = self.locals
+        self.locals = saved | local_names(node)
+        result = self.generic_visit(node)
+        self.locals = saved
+        return result
+
+    visit_AsyncFunctionDef = visit_FunctionDef  # type: ignore
+
+    def resolve(self, name: str) -> Any:
+        if name in self.fun_globals:
+            return self.fun_globals[name]
+        return getattr(builtins, name, None)
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        node = self.generic_visit(node)  # type: ignore
+        if not isinstance(node, ast.Call) or not isinstance(
+            node.func, ast.Name
+        ):
+            return node
+        name = node.func.id
+        if name in self.locals or name not in self.fun_globals:
+            return node
+        callee = self.fun_globals[name]
+        if callee is self.fun:
+            return node
+        with _lock:
+            inlinable = _inlinable.get(callee, None)
+        if (
+            inlinable is None
+            or inlinable.size > self.max_size
+            or node.keywords
+            or len(node.args) != len(inlinable.params)
+            or not all(is_pure(arg) for arg in node.args)
+        ):
+            return node
+
+        # global names of the callee must mean the same in the caller
+        callee_globals = callee.__globals__
+        for global_name in inlinable.names:
+            if global_name in self.locals:
+                return node
+            if global_name in callee_globals:
+                value = callee_globals[global_name]
+            else:
+                value = getattr(builtins, global_name, None)
+            if self.resolve(global_name) is not value:
+                return node
+
+        # arguments used several times must be cheap to evaluate
+        values = dict(zip(inlinable.params, node.args))
+        for param, arg in values.items():
+            uses = sum(
+                isinstance(child, ast.Name) and child.id == param
+                for child in ast.walk(inlinable.expression)
+            )
+            if uses > 1 and not isinstance(arg, (ast.Name, ast.Constant)):
+                return node
+
+        expression = substitute(
+            copy.deepcopy(inlinable.expression),
+            {param: copy.deepcopy(arg) for param, arg in values.items()},
+        )
+        for child in ast.walk(expression):
+            if isinstance(child, (ast.expr, ast.stmt)):
+                ast.copy_location(child, node)
+        self.inlined.append(f"{callee.__module__}.{callee.__qualname__}")
+        return expression
+
+
+def inline_calls(
+    tree: ast.AST, fun: Callable[..., Any], max_size: int = INLINE_MAX_SIZE
+) -> ast.AST:
+    """Inline the calls to small decorated functions in the rewritten AST
+    of ``fun``, and record them (see :func:`inline_info`)."""
+    inliner = CallInliner(fun, max_size)
+    tree = inliner.visit(tree)
+    if inliner.inlined:
+        with _lock:
+            _inlined[f"{fun.__module__}.{fun.__qualname__}"] = inliner.inlined
+    return tree
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import functools
+import threading
+import time
+import types
+from typing import Any, Callable, Dict, NamedTuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class LazyInfo(NamedTuple):
+    """Counters of functions decorated with ``@impunity(lazy=True)``.
+
+    Attributes:
+        deferred : int
+            Number of functions for which the analysis was deferred.
+        compiled : int
+            Number of deferred functions analysed on their first call.
+        analysis_time : float
+            Time (in seconds) spent analysing deferred functions.
+        avoided_time : float
+            Estimate of the analysis time avoided so far, based on the
+            average analysis time of compiled functions.
+    """
+
+    deferred: int
+    compiled: int
+    analysis_time: float
+    avoided_time: float
+
+
+_counters: Dict[str, Any] = dict(deferred=0, compiled=0, analysis_time=0.0)
+_counters_lock = threading.Lock()
+
+
+def lazy_info() -> LazyInfo:
+    """Report how many functions were analysed lazily, and for what cost."""
+    with _counters_lock:
+        deferred = _counters["deferred"]
+        compiled = _counters["compiled"]
+        analysis_time = _counters["analysis_time"]
+    mean_time = analysis_time / compiled if compiled else 0.0
+    return LazyInfo(
+        deferred,
+        compiled,
+        analysis_time,
+        (deferred - compiled) * mean_time,
+    )
+
+
+def _trampoline(
+    *args: Any, __impunity_state__: Any = None, **kwargs: Any
+) -> Any:
+    return __impunity_state__(*args, **kwargs)
+
+
+class _LazyState:
+    """Rewrites the function on the first call, then forwards calls to it."""
+
+    def __init__(
+        self,
+        fun: Callable[..., Any],
+        trampoline: types.FunctionType,
+        rewrite: Callable[[Any], Any],
+        counted: bool,
+    ) -> None:
+        self.fun = fun
+        self.trampoline = trampoline
+        self.rewrite = rewrite
+        self.counted = counted
+        self.done = False
+        self.lock = threading.Lock()
+
+    def compile(self) -> None:
+        with self.lock:
+            if self.done:
+                return
+            t0 = time.perf_counter()
+            self.rewrite(self.fun)
+            elapsed = time.perf_counter() - t0
+
+            # The trampoline takes over the rewritten code: later calls do
+            # not go through the trampoline anymore.
+            trampoline = self.trampoline
+            trampoline.__code__ = self.fun.__code__
+            trampoline.__defaults__ = self.fun.__defaults__
+            trampoline.__kwdefaults__ = self.fun.__kwdefaults__
+            self.done = True
+
+        if not self.counted:
+            return
+        with _counters_lock:
+            _counters["compiled"] += 1
+            _counters["analysis_time"] += elapsed
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if not self.done:
+            self.compile()
+        return self.fun(*args, **kwargs)
+
+
+def defer(fun: F, rewrite: Callable[[F], F], counted: bool = True) -> F:
+    """Return a trampoline which rewrites ``fun`` on its first call.
+
+    The trampoline carries the same name, annotations, docstring and
+    globals as ``fun``: it can be called, inspected and analysed by impunity
+    in other functions as the original function. The trampoline has no
+    closure, so ``fun`` must not have any either. Unless ``counted`` is
+    False, the function is counted in :func:`lazy_info`.
+    """
+    trampoline = types.FunctionType(
+        _trampoline.__code__, fun.__globals__, fun.__name__
+    )
+    functools.update_wrapper(trampoline, fun)
+    state = _LazyState(fun, trampoline, rewrite, counted)
+    trampoline.__kwdefaults__ = {"__impunity_state__": state}
+
+    if counted:
+        with _counters_lock:
+            _counters["deferred"] += 1
+    return trampoline  # type: ignore
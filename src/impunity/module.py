@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import ast
+import copy
+import inspect
+import sys
+import threading
+import types
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from .lazy import defer
+from .rewriter import rewrite_object
+from .visitor import Visitor
+
+# objects waiting for the rewriting of their module, by module name
+_pending: Dict[str, List[Tuple[Callable[..., Any], Dict[str, Any]]]] = {}
+# AST of the modules, and names of the definitions replaced with their
+# rewritten version in this AST (None if the AST is not used for the code of
+# the module)
+_trees: Dict[str, Tuple[ast.Module, Optional[Set[str]]]] = {}
+_lock = threading.Lock()
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def is_batch_module(fun: Callable[..., Any]) -> bool:
+    """Check whether the module of ``fun`` defines the batch marker.
+
+    Modules setting ``__impunity_batch__ = True`` before their decorated
+    functions are rewritten in one pass by :func:`rewrite_module`, which
+    resets the marker.
+    """
+    module = sys.modules.get(fun.__module__, None)
+    return bool(getattr(module, "__impunity_batch__", False))
+
+
+def is_precompiled(fun: Callable[..., Any]) -> bool:
+    """Check whether ``fun`` is being defined with code which has already
+    been rewritten (see :func:`impunity.install_import_hook`).
+
+    Only the definitions replaced in the cached code of the module are
+    concerned, while the body of the module is executed: functions
+    decorated afterwards (e.g. by a factory) are rewritten as usual.
+    """
+    module = sys.modules.get(fun.__module__, None)
+    spec = getattr(module, "__spec__", None)
+    return getattr(spec, "_initializing", False) and getattr(
+        fun, "__qualname__", None
+    ) in getattr(module, "__impunity_precompiled__", ())
+
+
+def defer_to_module(fun: F, options: Dict[str, Any]) -> F:
+    """Postpone the rewriting of ``fun`` until its module is rewritten.
+
+    Returns a trampoline which rewrites ``fun`` on its first call if this
+    call comes before :func:`rewrite_module` (see
+    :func:`impunity.lazy.defer`). Classes and closures cannot be replaced
+    by a trampoline: they are rewritten right away.
+    """
+    if getattr(fun, "__closure__", True) is not None:
+        module = sys.modules[fun.__module__]
+        rewrite_definitions(module, [(fun, options)], *module_tree(module))
+        return fun
+    with _lock:
+        _pending.setdefault(fun.__module__, []).append((fun, options))
+    return defer(fun, rewrite_deferred, counted=False)
+
+
+def rewrite_deferred(fun: F) -> F:
+    """Rewrite a deferred function called before the end of its module."""
+    with _lock:
+        pending = _pending.get(fun.__module__, [])
+        found: List[Tuple[Callable[..., Any], Dict[str, Any]]] = [
+            (other, options) for other, options in pending if other is fun
+        ]
+        pending[:] = [entry for entry in pending if entry[0] is not fun]
+    if found:
+        module = sys.modules[fun.__module__]
+        rewrite_definitions(module, found, *module_tree(module))
+    return fun
+
+
+def module_tree(
+    module: types.ModuleType,
+) -> Tuple[ast.Module, Optional[Set[str]]]:
+    """AST of a module, registered or parsed once from its source."""
+    with _lock:
+        if (entry := _trees.get(module.__name__, None)) is not None:
+            return entry
+    entry = (ast.parse(inspect.getsource(module)), None)
+    with _lock:
+        return _trees.setdefault(module.__name__, entry)
+
+
+def locate_definition(
+    tree: ast.Module, qualname: str
+) -> Optional[Tuple[List[ast.stmt], int]]:
+    """Find the definition of an object in the AST of its module.
+
+    Returns the list of statements containing the definition, and the index
+    of the definition in this list.
+    """
+    location = None
+    body = tree.body
+    for name in qualname.split("."):
+        for i, stmt in enumerate(body):
+            if (
+                isinstance(
+                    stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+                )
+                and stmt.name == name
+            ):
+                location = (body, i)
+                body = stmt.body
+                break
+        else:
+            # e.g. "<locals>" in the qualified name
+            return None
+    return location
+
+
+def register_tree(module_name: str, tree: ast.Module) -> Set[str]:
+    """Provide the AST of a module before it is executed.
+
+    :func:`rewrite_module` then uses this AST instead of parsing the source
+    of the module, and replaces the decorated definitions with their
+    rewritten version in this AST. Returns the set of the qualified names
+    of the replaced definitions, filled as they are rewritten.
+    """
+    spliced: Set[str] = set()
+    with _lock:
+        _trees[module_name] = (tree, spliced)
+    return spliced
+
+
+def rewrite_module(module: Union[types.ModuleType, str]) -> int:
+    """Rewrite all the decorated functions and classes of a module at once.
+
+    The source of the module is parsed only once, and the annotations of
+    the module are collected only once for all the decorated objects.
+    Only objects decorated after the ``__impunity_batch__ = True`` marker
+    are concerned: call this function at the end of the module. Functions
+    called before are rewritten on their first call, classes and closures
+    when they are decorated; objects decorated afterwards are rewritten
+    as usual.
+
+    .. code-block:: python
+
+        from impunity import impunity, rewrite_module
+
+        __impunity_batch__ = True
+
+        @impunity
+        def speed(distance: "m", duration: "s") -> "km/h":
+            return distance / duration
+
+        rewrite_module(__name__)
+
+    Returns the number of objects rewritten by this call.
+    """
+    if isinstance(module, str):
+        module = sys.modules[module]
+
+    with _lock:
+        pending = _pending.pop(module.__name__, [])
+    if pending:
+        rewrite_definitions(module, pending, *module_tree(module))
+    with _lock:
+        _trees.pop(module.__name__, None)
+    module.__impunity_batch__ = False  # type: ignore
+    return len(pending)
+
+
+def rewrite_definitions(
+    module: types.ModuleType,
+    pending: List[Tuple[Callable[..., Any], Dict[str, Any]]],
+    tree: ast.Module,
+    spliced: Optional[Set[str]],
+) -> None:
+    """Rewrite objects of a module, with their definitions in its AST.
+
+    If ``spliced`` is not None, the definitions are replaced in ``tree``
+    with their rewritten version, and their names are added to
+    ``spliced``.
+    """
+    module_vars = Visitor.module_annotations(module.__name__)
+
+    for fun, options in pending:
+        trees: List[ast.AST] = []
+        if (location := locate_definition(tree, fun.__qualname__)) is None:
+            rewrite_object(fun, module_vars=module_vars, **options)
+            continue
+
+        body, idx = location
+        # the module keeps the original definition unless it is rewritten
+        node = copy.deepcopy(body[idx])
+        assert isinstance(
+            node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+        )
+        # line numbers relative to the first line of the object, as if
+        # the source of the object had been parsed alone
+        first = min(
+            [node.lineno] + [deco.lineno for deco in node.decorator_list]
+        )
+        ast.increment_lineno(node, 1 - first)
+        fun_tree = ast.Module(body=[node], type_ignores=[])
+
+        if spliced is not None:
+            options = dict(options, cache=False)
+        rewrite_object(
+            fun,
+            fun_tree=fun_tree,
+            firstlineno=first,
+            module_vars=module_vars,
+            trees=trees,
+            **options,
+        )
+
+        if spliced is not None and trees:
+            body[idx] = cast(ast.Module, trees[0]).body[0]
+            spliced.add(fun.__qualname__)
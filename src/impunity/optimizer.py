@@ -0,0 +1,967 @@
+from __future__ import annotations
+
+import ast
+import itertools
+from math import isclose
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+from .runtime import AFFINE_NAME, CONVERT_NAME
+from .stats import count
+
+Number = Union[int, float]
+
+
+def conversion_constant(value: Number) -> ast.Constant:
+    """Build the constant of a conversion inserted in the code.
+
+    Only these constants are merged by the optimisation passes: arithmetic
+    written by the user is never reordered.
+    """
+    node = ast.Constant(value)
+    node.impunity_conversion = True  # type: ignore
+    return node
+
+
+def mark_kind(node: ast.AST, kind: Optional[str]) -> None:
+    """Record the kind ("scalar" or "array") of a converted value.
+
+    Only the conversions of arrays call :func:`impunity.runtime.affine`
+    (see :class:`AffineKernels`).
+    """
+    node.impunity_kind = kind  # type: ignore
+
+
+def is_conversion(node: ast.AST) -> bool:
+    return isinstance(node, ast.Constant) and getattr(
+        node, "impunity_conversion", False
+    )
+
+
+def literal_value(node: ast.AST) -> Optional[Number]:
+    """Value of a numeric literal (e.g. ``1000`` or ``-2.5``), if any."""
+    if isinstance(node, ast.UnaryOp) and isinstance(
+        node.op, (ast.USub, ast.UAdd)
+    ):
+        value = literal_value(node.operand)
+        if value is None:
+            return None
+        return -value if isinstance(node.op, ast.USub) else value
+    if (
+        isinstance(node, ast.Constant)
+        and isinstance(node.value, (int, float))
+        and not isinstance(node.value, bool)
+        and not is_conversion(node)
+    ):
+        return node.value
+    return None
+
+
+def constant_variables(node: ast.FunctionDef) -> Dict[str, Tuple[Any, Number]]:
+    """Find local variables assigned exactly once, to a numeric literal, by
+    a statement of the body of the function (not in a branch or a loop).
+
+    Returns the assignment statement and the value of each variable: after
+    this statement, the variable always holds this value.
+    """
+    candidates: Dict[str, Tuple[Any, Number]] = {}
+    for stmt in node.body:
+        target: Optional[ast.expr] = None
+        if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1:
+            target = stmt.targets[0]
+        elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+            target = stmt.target
+        value = getattr(stmt, "value", None)
+        if (
+            isinstance(target, ast.Name)
+            and value is not None
+            and (literal := literal_value(value)) is not None
+        ):
+            candidates[target.id] = (stmt, literal)
+
+    if not candidates:
+        return {}
+
+    # any other binding of the name disqualifies it
+    bindings = binding_counts(node)
+    return {
+        name: candidate
+        for name, candidate in candidates.items()
+        if bindings.get(name, 0) == 1
+    }
+
+
+def binding_counts(node: ast.AST) -> Dict[str, int]:
+    """Count the statements and expressions binding each name in ``node``.
+
+    Names declared global or nonlocal, and names of arguments, count as
+    several bindings: their value is never known from the code alone.
+    """
+    bindings: Dict[str, int] = {}
+    for child in ast.walk(node):
+        names: List[str] = []
+        if isinstance(child, ast.Name) and not isinstance(child.ctx, ast.Load):
+            names = [child.id]
+        elif isinstance(child, (ast.Global, ast.Nonlocal)):
+            names = list(child.names)
+            names += names  # never a single binding
+        elif isinstance(child, ast.arg):
+            names = [child.arg, child.arg]
+        elif child is not node and isinstance(
+            child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+        ):
+            names = [child.name, child.name]
+        elif isinstance(child, ast.alias):
+            name = child.asname or child.name.split(".")[0]
+            names = [name, name]
+        elif isinstance(child, ast.ExceptHandler) and child.name:
+            names = [child.name, child.name]
+        for name in names:
+            bindings[name] = bindings.get(name, 0) + 1
+    return bindings
+
+
+def decompose(node: ast.expr) -> Tuple[ast.expr, Number, Number]:
+    """Write a chain of conversions as ``base * scale + offset``."""
+    if isinstance(node, ast.BinOp) and is_conversion(node.right):
+        constant = node.right.value  # type: ignore
+        if isinstance(node.op, ast.Mult):
+            base, scale, offset = decompose(node.left)
+            return base, scale * constant, offset * constant
+        if isinstance(node.op, ast.Add):
+            base, scale, offset = decompose(node.left)
+            return base, scale, offset + constant
+    return node, 1, 0
+
+
+class ConversionFolder(ast.NodeTransformer):
+    """Merge chained conversions into a single affine operation.
+
+    Conversions inserted by the visitor are multiplications by, or
+    additions of, constants built with :func:`conversion_constant`. When
+    several of them apply to the same value, e.g.
+    ``(x * 3.28084 + 32) * 0.5``, they are merged into ``x * a + b``, so
+    that arrays are only traversed once or twice. Multiplications by 1 and
+    additions of 0 are removed. Conversions of numeric literals, and of
+    local variables only ever assigned a numeric literal, are computed
+    once and for all.
+    """
+
+    def __init__(self) -> None:
+        # constant variables of the functions being visited, innermost last
+        self.scopes: List[Dict[str, Tuple[Any, Number]]] = []
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.AST:
+        self.scopes.append(constant_variables(node))
+        result = self.generic_visit(node)
+        self.scopes.pop()
+        return result
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> ast.AST:
+        self.scopes.append({})
+        result = self.generic_visit(node)
+        self.scopes.pop()
+        return result
+
+    def visit_Lambda(self, node: ast.Lambda) -> ast.AST:
+        self.scopes.append({})
+        result = self.generic_visit(node)
+        self.scopes.pop()
+        return result
+
+    def value(self, node: ast.AST) -> Optional[Number]:
+        """Value of a literal, or of a constant variable after its
+        assignment."""
+        if (value := literal_value(node)) is not None:
+            return value
+        if isinstance(node, ast.Name) and self.scopes:
+            if (constant := self.scopes[-1].get(node.id, None)) is None:
+                return None
+            stmt, value = constant
+            end = (stmt.end_lineno or stmt.lineno, stmt.end_col_offset or 0)
+            start = (getattr(node, "lineno", 0), getattr(node, "col_offset", 0))
+            if start >= end:
+                return value
+        return None
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        node = self.generic_visit(node)  # type: ignore
+        if not (
+            isinstance(node, ast.BinOp)
+            and isinstance(node.op, (ast.Mult, ast.Add))
+            and is_conversion(node.right)
+        ):
+            return node
+
+        base, scale, offset = decompose(node)
+        if (value := self.value(base)) is not None:
+            result: ast.expr = ast.Constant(value * scale + offset)
+        else:
+            result = base
+            if not isclose(scale, 1, rel_tol=1e-12):
+                result = ast.BinOp(
+                    result, ast.Mult(), conversion_constant(scale)
+                )
+            if offset != 0:
+                result = ast.BinOp(
+                    result, ast.Add(), conversion_constant(offset)
+                )
+        return ast.copy_location(result, node)
+
+
+def is_conversion_chain(node: ast.AST) -> bool:
+    return (
+        isinstance(node, ast.BinOp)
+        and isinstance(node.op, (ast.Mult, ast.Add))
+        and is_conversion(node.right)
+    )
+
+
+def target_names(node: Optional[ast.AST]) -> Set[str]:
+    """Names bound by an assignment target (e.g. ``a, (b, c)``)."""
+    if node is None:
+        return set()
+    return {
+        child.id
+        for child in ast.walk(node)
+        if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Store)
+    }
+
+
+# nodes whose body is not evaluated where it is defined
+DEFERRED = (
+    ast.FunctionDef,
+    ast.AsyncFunctionDef,
+    ast.ClassDef,
+    ast.Lambda,
+    ast.GeneratorExp,
+)
+COMPREHENSIONS = (ast.ListComp, ast.SetComp, ast.DictComp)
+BLOCKS = ("body", "orelse", "finalbody")
+
+
+def walk_evaluated(nodes: Iterable[ast.AST]) -> Iterator[ast.AST]:
+    """Walk the nodes evaluated with ``nodes``, not the bodies of nested
+    functions, classes, lambdas or generators."""
+    todo = list(nodes)
+    while todo:
+        node = todo.pop()
+        yield node
+        if not isinstance(node, DEFERRED):
+            todo.extend(ast.iter_child_nodes(node))
+
+
+def header_nodes(stmt: ast.stmt) -> List[ast.AST]:
+    """Expressions of a statement, without its nested blocks of statements
+    (e.g. the test of an ``if``, the target and iterable of a ``for``)."""
+    nodes: List[ast.AST] = []
+    for field, value in ast.iter_fields(stmt):
+        if field in (*BLOCKS, "handlers", "cases"):
+            continue
+        values = value if isinstance(value, list) else [value]
+        nodes += [v for v in values if isinstance(v, ast.AST)]
+    return nodes
+
+
+def parent_links(nodes: Iterable[ast.AST]) -> Dict[ast.AST, ast.AST]:
+    parents: Dict[ast.AST, ast.AST] = {}
+    for node in nodes:
+        for outer in ast.walk(node):
+            for child in ast.iter_child_nodes(outer):
+                parents[child] = outer
+    return parents
+
+
+def used_in_arithmetic(node: ast.Name, parents: Dict[ast.AST, ast.AST]) -> bool:
+    """Check that a name is read as an operand of an arithmetic operation or
+    of a comparison, possibly indexed (e.g. ``x[i]``)."""
+    current: ast.AST = node
+    while isinstance(getattr(current, "ctx", None), ast.Load):
+        parent = parents.get(current, None)
+        if isinstance(parent, ast.Subscript) and parent.value is current:
+            current = parent
+            continue
+        return isinstance(parent, (ast.BinOp, ast.UnaryOp, ast.Compare))
+    return False
+
+
+def only_used_in_arithmetic(nodes: Sequence[ast.AST], name: str) -> bool:
+    """Check that ``name`` only appears in ``nodes`` as an operand of
+    arithmetic operations or comparisons, possibly indexed (e.g. ``x[i]``).
+
+    Such a value can neither be rebound nor modified in place in ``nodes``,
+    nor through an alias made in ``nodes``. Aliases made before ``nodes``
+    are found by :func:`aliased_names`.
+    """
+    parents = parent_links(nodes)
+    return all(
+        used_in_arithmetic(child, parents)
+        for node in nodes
+        for child in ast.walk(node)
+        if isinstance(child, ast.Name) and child.id == name
+    )
+
+
+def aliased_names(function: ast.AST) -> Set[str]:
+    """Names read other than in arithmetic anywhere in a function (e.g. in
+    ``g = h``, or passed to a function): their value may be modified in
+    place through another name."""
+    parents = parent_links([function])
+    return {
+        child.id
+        for child in ast.walk(function)
+        if isinstance(child, ast.Name)
+        and isinstance(child.ctx, ast.Load)
+        and not used_in_arithmetic(child, parents)
+    }
+
+
+class ConversionHoister(ast.NodeTransformer):
+    """Compute the conversions of loop invariant values before the loop.
+
+    Conversions in the body of a ``for`` or ``while`` loop, or in the
+    elements and conditions of a list, set or dict comprehension, are
+    evaluated at each iteration. When the converted value is a variable
+    which is neither rebound nor used other than in arithmetic within the
+    loop (e.g. an annotated parameter), the conversion is computed once,
+    the first time it is evaluated, and kept in a new local variable::
+
+        for i in range(n):       __impunity_h_0__ = None
+            y += h * 0.3048  -->  for i in range(n):
+                                      y += (
+                                          __impunity_h_0__
+                                          if __impunity_h_0__ is not None
+                                          else (__impunity_h_0__ := h * 0.3048)
+                                      )
+
+    so that nothing is converted if the loop runs zero times. Only the
+    conversions evaluated at each iteration (not in branches, nor after a
+    ``continue`` or a condition of a comprehension) of variables bound
+    before the loop on every path (parameters, and variables assigned by
+    preceding statements of the same block) are concerned.
+    """
+
+    def __init__(self, temporaries: Optional[Iterator[int]] = None) -> None:
+        # numbers of the new local variables, shared by the passes
+        self.temporaries = (
+            temporaries if temporaries is not None else itertools.count()
+        )
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.AST:
+        return self.visit_function(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> ast.AST:
+        return self.visit_function(node)
+
+    def visit_function(
+        self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]
+    ) -> ast.AST:
+        self.visit(node.args)
+        node.decorator_list = [self.visit(d) for d in node.decorator_list]
+        arguments = {
+            arg.arg for arg in ast.walk(node.args) if isinstance(arg, ast.arg)
+        }
+        # names which may change without a binding in the function
+        excluded = aliased_names(node)
+        for child in ast.walk(node):
+            if isinstance(child, (ast.Global, ast.Nonlocal)):
+                excluded.update(child.names)
+            elif isinstance(child, ast.Name) and isinstance(child.ctx, ast.Del):
+                excluded.add(child.id)
+        node.body = self.block(node.body, arguments - excluded, excluded)
+        return node
+
+    def block(
+        self, stmts: List[ast.stmt], bound: Set[str], excluded: Set[str]
+    ) -> List[ast.stmt]:
+        """Hoist conversions out of the loops of a list of statements.
+
+        ``bound`` are the variables bound when the first statement is run.
+        """
+        bound = set(bound)
+        result: List[ast.stmt] = []
+        for stmt in stmts:
+            if isinstance(stmt, DEFERRED):
+                result.append(self.visit(stmt))
+                continue
+
+            headers = header_nodes(stmt)
+
+            # comprehensions in the expressions of the statement (the
+            # iterables of inner generators cannot assign variables)
+            for child in walk_evaluated(headers):
+                if isinstance(child, COMPREHENSIONS):
+                    nodes = [
+                        node
+                        for node in comprehension_nodes(child)
+                        if all(node is not g.iter for g in child.generators)
+                    ]
+                    result += self.hoist(child, nodes, headers, bound)
+
+            if isinstance(stmt, (ast.For, ast.AsyncFor, ast.While)):
+                nodes = list(unconditional_body(stmt.body))
+                if isinstance(stmt, ast.While):
+                    nodes += always_evaluated([stmt.test])
+                result += self.hoist(stmt, nodes, [stmt], bound)
+
+            # nested blocks
+            inner = set(bound)
+            if isinstance(stmt, (ast.For, ast.AsyncFor)):
+                inner |= target_names(stmt.target)
+            elif isinstance(stmt, (ast.With, ast.AsyncWith)):
+                for item in stmt.items:
+                    inner |= target_names(item.optional_vars)
+            for field in BLOCKS:
+                body = getattr(stmt, field, None)
+                if isinstance(body, list) and body:
+                    setattr(stmt, field, self.block(body, inner, excluded))
+            for handler in getattr(stmt, "handlers", []):
+                handler_bound = inner | (
+                    {handler.name} if handler.name else set()
+                )
+                handler.body = self.block(handler.body, handler_bound, excluded)
+            for case in getattr(stmt, "cases", []):
+                case.body = self.block(case.body, inner, excluded)
+
+            result.append(stmt)
+            if isinstance(stmt, ast.Assign):
+                for target in stmt.targets:
+                    bound |= target_names(target)
+            elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+                bound |= target_names(stmt.target)
+            bound -= excluded
+        return result
+
+    def hoist(
+        self,
+        owner: ast.AST,
+        nodes: List[ast.AST],
+        region: List[ast.AST],
+        bound: Set[str],
+    ) -> List[ast.stmt]:
+        """Replace the invariant conversions in ``nodes``, the expressions
+        of ``owner`` (a loop or a comprehension) evaluated at each
+        iteration, with variables.
+
+        The conversions are invariant if their variable does not change in
+        ``region``, the code run between the new assignment and the last
+        evaluation of the conversion. The variables are computed at the
+        first evaluation of the conversion, so that loops running zero
+        times do not convert anything. Returns the new assignments.
+        """
+        invariant: Dict[str, bool] = {}
+        names: Dict[str, str] = {}
+        candidates = set(always_evaluated(list(nodes)))
+
+        def hoisted(node: ast.AST) -> Optional[ast.expr]:
+            if node not in candidates or not is_conversion_chain(node):
+                return None
+            base, _, _ = decompose(cast(ast.BinOp, node))
+            if not isinstance(base, ast.Name) or base.id not in bound:
+                return None
+            if base.id not in invariant:
+                invariant[base.id] = only_used_in_arithmetic(region, base.id)
+            if not invariant[base.id]:
+                return None
+            key = ast.dump(node)
+            if key not in names:
+                names[key] = f"__impunity_{base.id}_{next(self.temporaries)}__"
+            name = names[key]
+            # name if name is not None else (name := conversion)
+            lazy = ast.IfExp(
+                test=ast.Compare(
+                    left=ast.Name(id=name, ctx=ast.Load()),
+                    ops=[ast.IsNot()],
+                    comparators=[ast.Constant(None)],
+                ),
+                body=ast.Name(id=name, ctx=ast.Load()),
+                orelse=ast.NamedExpr(
+                    target=ast.Name(id=name, ctx=ast.Store()),
+                    value=cast(ast.expr, node),
+                ),
+            )
+            return ast.copy_location(lazy, node)
+
+        replace(owner, hoisted)
+        return [
+            ast.Assign(
+                targets=[ast.Name(id=name, ctx=ast.Store())],
+                value=ast.Constant(None),
+            )
+            for name in names.values()
+        ]
+
+
+def assigned_names(node: ast.AST) -> Set[str]:
+    """Names assigned by an assignment statement (e.g. ``a = b = ...``)."""
+    if isinstance(node, ast.Assign):
+        targets = node.targets
+    elif isinstance(node, ast.AnnAssign) and node.value is not None:
+        targets = [node.target]
+    else:
+        return set()
+    return {target.id for target in targets if isinstance(target, ast.Name)}
+
+
+def unconditional_nodes(stmt: ast.stmt) -> Iterator[ast.AST]:
+    """Walk the expressions of a statement which are always evaluated when
+    the statement is run (not the nested blocks, the branches of ``if``
+    expressions, the right operands of ``and`` and ``or``, or the elements
+    of comprehensions)."""
+    todo = header_nodes(stmt)
+    if isinstance(stmt, (ast.For, ast.AsyncFor)):
+        todo = [stmt.iter]
+    return always_evaluated(todo)
+
+
+def always_evaluated(todo: List[ast.AST]) -> Iterator[ast.AST]:
+    """Walk the parts of expressions which are always evaluated with them
+    (see :func:`unconditional_nodes`)."""
+    while todo:
+        node = todo.pop()
+        yield node
+        if isinstance(node, DEFERRED):
+            continue
+        if isinstance(node, ast.BoolOp):
+            todo.append(node.values[0])
+        elif isinstance(node, ast.IfExp):
+            todo.append(node.test)
+        elif isinstance(node, COMPREHENSIONS):
+            todo.append(node.generators[0].iter)
+        else:
+            todo.extend(ast.iter_child_nodes(node))
+
+
+def unconditional_body(stmts: List[ast.stmt]) -> Iterator[ast.AST]:
+    """Walk the expressions always evaluated when a block of statements is
+    run, up to the first statement which may leave the block (e.g. with
+    ``continue`` in a branch)."""
+    for stmt in stmts:
+        yield from unconditional_nodes(stmt)
+        if any(
+            isinstance(child, (ast.Break, ast.Continue, ast.Return, ast.Raise))
+            for child in walk_evaluated([stmt])
+        ):
+            return
+
+
+def comprehension_nodes(node: ast.AST) -> List[ast.AST]:
+    """Expressions of a comprehension evaluated for each of its elements,
+    before the first condition (``if``) of its generators."""
+    nodes: List[ast.AST] = []
+    for i, generator in enumerate(node.generators):  # type: ignore
+        if i > 0:
+            nodes.append(generator.iter)
+        if generator.ifs:
+            nodes.append(generator.ifs[0])
+            return nodes
+    return nodes + [
+        getattr(node, field)
+        for field in ("key", "value", "elt")
+        if hasattr(node, field)
+    ]
+
+
+def conversion_chains(nodes: Iterable[ast.AST]) -> Iterator[ast.BinOp]:
+    """Find the (folded) conversions evaluated with ``nodes``, outermost
+    first."""
+    # links of the chains already found (e.g. x * a in x * a + b)
+    links: Set[ast.AST] = set()
+    for node in nodes:
+        if node in links or not is_conversion_chain(node):
+            continue
+        yield cast(ast.BinOp, node)
+        link = cast(ast.BinOp, node).left
+        while is_conversion_chain(link):
+            links.add(link)
+            link = cast(ast.BinOp, link).left
+
+
+class ConversionSharing(ast.NodeTransformer):
+    """Convert each variable once per unit it is used in.
+
+    The visitor converts a value where it is used: a variable used in
+    several expressions expecting the same (compatible) unit is converted
+    each time. When the same conversion of a variable appears more than
+    once in a block, it is assigned to a new local variable before the
+    first statement which always evaluates it::
+
+        a = h * 0.3048 + 1           __impunity_h_0__ = h * 0.3048
+        b = h * 0.3048 * 2     -->   a = __impunity_h_0__ + 1
+                                     b = __impunity_h_0__ * 2
+
+    so that each variable is converted at most once to each of the units
+    it is used in. Only parameters which are never rebound, and variables
+    assigned once (by an assignment statement) in the function, are
+    concerned, when they are only used in arithmetic (they cannot change in
+    place). The number of conversions saved is recorded in the statistics
+    of the function (see :func:`impunity.stats`).
+    """
+
+    def __init__(self, temporaries: Optional[Iterator[int]] = None) -> None:
+        # numbers of the new local variables, shared by the passes
+        self.temporaries = (
+            temporaries if temporaries is not None else itertools.count()
+        )
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.AST:
+        return self.visit_function(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> ast.AST:
+        return self.visit_function(node)
+
+    def visit_function(
+        self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]
+    ) -> ast.AST:
+        self.generic_visit(node)  # nested functions first
+        bindings = binding_counts(node)
+        aliased = aliased_names(node)
+        arguments = {
+            arg.arg
+            for arg in ast.walk(node.args)
+            if isinstance(arg, ast.arg) and bindings.get(arg.arg, 0) == 2
+        } - aliased
+        self.variables = arguments | {
+            name
+            for stmt in walk_evaluated(node.body)
+            for name in assigned_names(stmt)
+            if bindings[name] == 1 and name not in aliased
+        }
+        node.body = self.block(node.body, arguments)
+        return node
+
+    def block(self, stmts: List[ast.stmt], bound: Set[str]) -> List[ast.stmt]:
+        """Share the conversions repeated in a list of statements.
+
+        ``bound`` are the variables bound when the first statement is run.
+        """
+        # first statement always evaluating each conversion
+        first: Dict[Tuple[str, str], int] = {}
+        bound = set(bound)
+        bound_at: List[Set[str]] = []
+        for i, stmt in enumerate(stmts):
+            bound_at.append(set(bound))
+            if not isinstance(stmt, DEFERRED):
+                for chain in conversion_chains(unconditional_nodes(stmt)):
+                    base, _, _ = decompose(chain)
+                    if isinstance(base, ast.Name) and base.id in bound:
+                        first.setdefault((base.id, ast.dump(chain)), i)
+            bound |= assigned_names(stmt) & self.variables
+
+        # all their occurrences in the following statements
+        occurrences: Dict[Tuple[str, str], List[ast.BinOp]] = {}
+        for (name, key), i in first.items():
+            for chain in conversion_chains(walk_evaluated(stmts[i:])):
+                if ast.dump(chain) == key:
+                    occurrences.setdefault((name, key), []).append(chain)
+
+        assignments: Dict[int, List[ast.stmt]] = {}
+        shared: Dict[ast.AST, str] = {}
+        for (name, key), chains in occurrences.items():
+            i = first[(name, key)]
+            if len(chains) < 2 or not only_used_in_arithmetic(stmts[i:], name):
+                continue
+            temporary = f"__impunity_{name}_{next(self.temporaries)}__"
+            assignment = ast.Assign(
+                targets=[ast.Name(id=temporary, ctx=ast.Store())],
+                value=chains[0],
+            )
+            ast.copy_location(assignment, chains[0])
+            assignments.setdefault(i, []).append(assignment)
+            shared.update((chain, temporary) for chain in chains)
+            count(saved=len(chains) - 1)
+
+        def substitute(child: ast.AST) -> Optional[ast.AST]:
+            if (temporary := shared.get(child, None)) is None:
+                return None
+            name = ast.Name(id=temporary, ctx=ast.Load())
+            return ast.copy_location(name, child)
+
+        result: List[ast.stmt] = []
+        for i, stmt in enumerate(stmts):
+            result += assignments.get(i, [])
+            if isinstance(stmt, DEFERRED):
+                result.append(stmt)
+                continue
+            if shared:
+                replace(stmt, substitute)
+
+            # nested blocks
+            inner = bound_at[i]
+            for field in BLOCKS:
+                body = getattr(stmt, field, None)
+                if isinstance(body, list) and body:
+                    setattr(stmt, field, self.block(body, inner))
+            for handler in getattr(stmt, "handlers", []):
+                handler.body = self.block(handler.body, inner)
+            for case in getattr(stmt, "cases", []):
+                case.body = self.block(case.body, inner)
+            result.append(stmt)
+        return result
+
+
+def replace(
+    node: ast.AST,
+    substitute: Callable[[ast.AST], Optional[ast.AST]],
+    field: Optional[str] = None,
+) -> None:
+    """Replace the descendants of ``node`` (in ``field`` only, if provided)
+    for which ``substitute`` returns a node, without entering nested
+    functions, classes, lambdas or generators."""
+    fields = ast.iter_fields(node)
+    if field is not None:
+        fields = iter([(field, getattr(node, field))])
+    for field, value in fields:
+        values = value if isinstance(value, list) else [value]
+        for i, child in enumerate(values):
+            if not isinstance(child, ast.AST):
+                continue
+            if (new_child := substitute(child)) is not None:
+                values[i] = new_child
+                if not isinstance(value, list):
+                    setattr(node, field, new_child)
+            elif not isinstance(child, DEFERRED):
+                replace(child, substitute)
+
+
+def is_fresh(node: Optional[ast.AST]) -> bool:
+    """Check whether an expression always produces a new object, e.g. the
+    result of an arithmetic operation, which nothing else refers to."""
+    if isinstance(node, ast.UnaryOp):
+        return not isinstance(node.op, ast.Not)
+    return isinstance(node, ast.BinOp)
+
+
+def last_uses(
+    node: Union[ast.FunctionDef, ast.AsyncFunctionDef],
+) -> Set[ast.AST]:
+    """Find the reads of local variables which the function owns, after
+    which the value of the variable is never used again.
+
+    A variable is owned if it is only assigned new objects (see
+    :func:`is_fresh`) and only used in arithmetic, or returned: no other
+    variable or object can refer to its value. A read is the last use of the
+    variable if it is the only read in its statement, if the statement is
+    not repeated in a loop, and if no read comes after the statement.
+    """
+    # names whose value is shared with the caller or with other scopes
+    excluded = {
+        arg.arg for arg in ast.walk(node.args) if isinstance(arg, ast.arg)
+    }
+    for child in ast.walk(node):
+        if isinstance(child, (ast.Global, ast.Nonlocal)):
+            excluded.update(child.names)
+        elif child is not node and isinstance(child, DEFERRED):
+            excluded.update(
+                name.id
+                for name in ast.walk(child)
+                if isinstance(name, ast.Name)
+            )
+
+    # innermost statement of each name, and whether it is repeated
+    location: Dict[ast.Name, Tuple[ast.stmt, bool]] = {}
+
+    def visit_block(stmts: List[ast.stmt], repeated: bool) -> None:
+        for stmt in stmts:
+            if isinstance(stmt, DEFERRED):
+                continue
+            headers = header_nodes(stmt)
+            in_comprehension = {
+                inner
+                for child in walk_evaluated(headers)
+                if isinstance(child, COMPREHENSIONS)
+                for inner in walk_evaluated([child])
+            }
+            for child in walk_evaluated(headers):
+                if isinstance(child, ast.Name):
+                    location[child] = (
+                        stmt,
+                        repeated
+                        or isinstance(stmt, ast.While)
+                        or child in in_comprehension,
+                    )
+            loop = isinstance(stmt, (ast.For, ast.AsyncFor, ast.While))
+            visit_block(getattr(stmt, "body", []), repeated or loop)
+            visit_block(getattr(stmt, "orelse", []), repeated)
+            visit_block(getattr(stmt, "finalbody", []), repeated)
+            for handler in getattr(stmt, "handlers", []):
+                visit_block(handler.body, repeated)
+            for case in getattr(stmt, "cases", []):
+                visit_block(case.body, repeated)
+
+    visit_block(node.body, False)
+    parents = parent_links([node])
+
+    occurrences: Dict[str, List[ast.Name]] = {}
+    for variable in location:
+        occurrences.setdefault(variable.id, []).append(variable)
+
+    result: Set[ast.AST] = set()
+    for name, names in occurrences.items():
+        if name in excluded:
+            continue
+        owned = True
+        for occurrence in names:
+            parent = parents.get(occurrence, None)
+            if isinstance(occurrence.ctx, ast.Load):
+                owned = isinstance(parent, ast.Return) or used_in_arithmetic(
+                    occurrence, parents
+                )
+            elif isinstance(parent, ast.Assign):
+                owned = parent.targets == [occurrence] and is_fresh(
+                    parent.value
+                )
+            elif isinstance(parent, ast.AnnAssign):
+                owned = parent.target is occurrence and is_fresh(parent.value)
+            else:
+                owned = isinstance(parent, ast.AugAssign)
+            if not owned:
+                break
+        if not owned:
+            continue
+
+        reads = [n for n in names if isinstance(n.ctx, ast.Load)]
+        for read in reads:
+            stmt, repeated = location[read]
+            end = (
+                getattr(stmt, "end_lineno", None),
+                getattr(stmt, "end_col_offset", None),
+            )
+            if repeated or None in end:
+                continue
+            if all(
+                other is read
+                or (
+                    location[other][0] is not stmt
+                    and (other.lineno, other.col_offset) < end
+                )
+                for other in reads
+            ):
+                result.add(read)
+    return result
+
+
+class InplaceConversions(ast.NodeTransformer):
+    """Convert values owned by the function in place.
+
+    Applied with ``@impunity(inplace=True)``: conversions of temporary
+    results (e.g. ``(a - b) * 1000``) and of local variables which are
+    not used afterwards call :func:`impunity.runtime.convert`, which
+    multiplies (and shifts) NumPy arrays of floats in place instead of
+    allocating new arrays. Conversions of the arguments of the function,
+    which belong to the caller, still produce new arrays.
+    """
+
+    def __init__(self) -> None:
+        # last uses of owned variables in the functions being visited
+        self.scopes: List[Set[ast.AST]] = []
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.AST:
+        return self.visit_function(node)
+
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> ast.AST:
+        return self.visit_function(node)
+
+    def visit_function(
+        self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]
+    ) -> ast.AST:
+        self.scopes.append(last_uses(node))
+        result = self.generic_visit(node)
+        self.scopes.pop()
+        return result
+
+    def visit_Lambda(self, node: ast.Lambda) -> ast.AST:
+        self.scopes.append(set())
+        result = self.generic_visit(node)
+        self.scopes.pop()
+        return result
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        if not is_conversion_chain(node):
+            return self.generic_visit(node)
+        base, scale, offset = decompose(node)
+        owned = is_fresh(base) or (
+            bool(self.scopes) and base in self.scopes[-1]
+        )
+        if not owned:
+            return self.generic_visit(node)
+
+        args = [self.visit(base), ast.Constant(scale)]
+        if offset != 0:
+            args.append(ast.Constant(offset))
+        call = ast.Call(
+            func=ast.Name(id=CONVERT_NAME, ctx=ast.Load()),
+            args=args,
+            keywords=[],
+        )
+        return ast.copy_location(call, node)
+
+
+class AffineKernels(ast.NodeTransformer):
+    """Compute affine conversions in a single pass.
+
+    Conversions of arrays with both a scale and an offset, e.g.
+    ``x * 1.8 + 32`` from degC to degF, call
+    :func:`impunity.runtime.affine`, which converts large NumPy arrays
+    block by block without an intermediate array. The call costs more than
+    the two operations on scalars: values not known to be arrays (from the
+    type in their annotation, see :func:`mark_kind`) keep the operations.
+    """
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        if not is_conversion_chain(node):
+            return self.generic_visit(node)
+        base, scale, offset = decompose(node)
+        if (
+            isclose(scale, 1, rel_tol=1e-12)
+            or offset == 0
+            or getattr(base, "impunity_kind", None) != "array"
+        ):
+            return self.generic_visit(node)
+        call = ast.Call(
+            func=ast.Name(id=AFFINE_NAME, ctx=ast.Load()),
+            args=[self.visit(base), ast.Constant(scale), ast.Constant(offset)],
+            keywords=[],
+        )
+        return ast.copy_location(call, node)
+
+
+# optimisation passes applied to the rewritten AST, in order
+# (InplaceConversions is only applied with ``inplace``)
+PASSES: List[Callable[[], ast.NodeTransformer]] = [
+    ConversionFolder,
+    ConversionSharing,
+    ConversionHoister,
+    InplaceConversions,
+    AffineKernels,
+]
+
+
+def optimize(tree: ast.AST, inplace: bool = False) -> ast.AST:
+    """Apply the optimisation passes to a rewritten AST.
+
+    With ``inplace``, conversions of the values owned by the functions are
+    also made in place (see :class:`InplaceConversions`).
+    """
+    # one numbering for all the passes, so that their variables differ
+    temporaries = itertools.count()
+    for optimization in PASSES:
+        if optimization is InplaceConversions and not inplace:
+            continue
+        transformer = optimization()
+        if isinstance(transformer, (ConversionSharing, ConversionHoister)):
+            transformer.temporaries = temporaries
+        tree = transformer.visit(tree)
+    return tree
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import ast
-from typing import Optional, TypeVar
+from typing import TypeVar, Union
 
-Unit = Optional[str]
+from . import units
+
+Unit = Union[str, units.Unit, None]
+# types of the units of quantities (not of tuples, lists, etc.)
+UNIT_TYPES = (str, units.Unit)
 N = TypeVar("N", bound=ast.expr, covariant=True)
 
 
@@ -13,8 +17,9 @@ class QuantityNode:
     Attributes:
         node : TypeVar("N", bound=Optional[ast.expr], covariant=True)
             Any type of expression found within an ast.
-        unit : Optional[str]
-            Optional string representing a UoM.
+        unit : str | units.Unit | None
+            Optional string representing a UoM, or an interned unit for
+            units derived in arithmetic operations.
     """
 
     def __init__(self, node: None | N, unit: None | Unit = None) -> None:
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import threading
+from importlib import metadata
+from typing import TYPE_CHECKING, Any, Optional
+
+from .stats import phase
+
+if TYPE_CHECKING:
+    from pint import UnitRegistry
+
+_registry: Optional[UnitRegistry[Any]] = None
+_custom = False
+_cache_folder: Optional[str] = None
+_fingerprint: Optional[tuple[int, int, str]] = None
+_lock = threading.Lock()
+
+
+def get_registry() -> UnitRegistry[Any]:
+    """Return the unit registry used by impunity, building it on first use.
+
+    pint is only imported at this point: processes which never analyse any
+    code (e.g. because all rewritten functions are found in the cache) do
+    not pay for parsing the definition file.
+
+    If a cache folder was configured with :func:`set_registry`, or with the
+    ``IMPUNITY_REGISTRY_CACHE`` environment variable, pint stores a
+    snapshot of the parsed definitions in this folder and loads it on the
+    next runs instead of parsing the definition file again. The special
+    value ":auto:" selects a default user cache folder.
+    """
+    global _registry
+    if _registry is None:
+        with _lock:
+            if _registry is None:
+                with phase("registry"):
+                    from pint import UnitRegistry
+
+                    cache_folder = _cache_folder or os.environ.get(
+                        "IMPUNITY_REGISTRY_CACHE", None
+                    )
+                    _registry = UnitRegistry(cache_folder=cache_folder or None)
+    return _registry
+
+
+def set_registry(
+    ureg: Optional[UnitRegistry[Any]] = None,
+    *,
+    cache_folder: Optional[str] = None,
+) -> None:
+    """Configure the unit registry used by impunity.
+
+    Parameters:
+        - ureg : pint.UnitRegistry, optional
+            A custom registry (e.g. with additional definitions). If None,
+            the default registry is built lazily on first use.
+        - cache_folder : str, optional
+            Folder where pint stores a snapshot of the parsed definitions
+            for the default registry (":auto:" for a user cache folder).
+    """
+    from .conversion import clear_cache
+
+    global _registry, _custom, _cache_folder, _fingerprint
+    with _lock:
+        _registry = ureg
+        _custom = ureg is not None
+        _cache_folder = cache_folder
+        _fingerprint = None
+    clear_cache()
+
+
+@functools.lru_cache(maxsize=None)
+def pint_version() -> str:
+    """Version of pint, read once per process from the package metadata."""
+    return metadata.version("pint")
+
+
+def registry_fingerprint() -> str:
+    """Identify the unit definitions without building the default registry.
+
+    The default registry only depends on the version of pint. Custom
+    registries are identified by a hash of their unit definitions.
+    """
+    global _fingerprint
+    if not _custom or _registry is None:
+        return f"pint-{pint_version()}"
+    units: dict[str, Any] = getattr(_registry, "_units", {})
+    if _fingerprint is None or _fingerprint[:2] != (id(_registry), len(units)):
+        definitions = sorted(f"{k}={v!r}" for k, v in units.items())
+        digest = hashlib.sha256("\n".join(definitions).encode()).hexdigest()
+        _fingerprint = (id(_registry), len(units), f"custom-{digest}")
+    return _fingerprint[2]
+
+
+class LazyRegistry:
+    """Descriptor giving access to the registry from the Visitor class."""
+
+    def __get__(self, obj: Any, objtype: Any = None) -> UnitRegistry[Any]:
+        return get_registry()
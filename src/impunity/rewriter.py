@@ -0,0 +1,275 @@
+from __future__ import annotations
+import __future__
+
+import ast
+import copy
+import inspect
+import os
+import sys
+import textwrap
+import types
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union, cast
+
+from .cache import (
+    cache_enabled,
+    cache_key,
+    load,
+    record_warnings,
+    replay_warnings,
+    store,
+)
+from .inline import INLINE_MAX_SIZE, inline_calls, register_inlinable
+from .optimizer import optimize
+from .runtime import provide
+from .stats import phase, recording
+from .visitor import Visitor
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def swap_code(origin: Callable[..., Any], new_code: types.CodeType) -> None:
+    """Replace the code of ``origin`` with ``new_code``.
+
+    The name of the original code object is kept, so that the function keeps
+    its identity in tracebacks and profiles.
+    """
+    code = origin.__code__
+    if sys.version_info >= (3, 11):
+        new_code = new_code.replace(
+            co_name=code.co_name, co_qualname=code.co_qualname
+        )
+    else:
+        new_code = new_code.replace(co_name=code.co_name)
+    origin.__code__ = new_code
+
+
+def install(fun: Any, codes: dict[str, types.CodeType]) -> None:
+    """Install rewritten code objects on a function or on class methods."""
+    provide(fun)
+    if isinstance(fun, type):
+        for name, new_code in codes.items():
+            method = getattr(fun, name, None)
+            # staticmethod and classmethod objects
+            method = getattr(method, "__func__", method)
+            if isinstance(method, types.FunctionType):
+                swap_code(method, new_code)
+    else:
+        swap_code(fun, codes[""])
+
+
+def find_code(code: types.CodeType, name: str) -> Optional[types.CodeType]:
+    """Find the code object of a definition nested in ``code``."""
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType) and const.co_name == name:
+            return const
+    return None
+
+
+def generate_code(
+    fun: Any, definition: ast.stmt, filename: str
+) -> dict[str, types.CodeType]:
+    """Compile the rewritten definition of a function or of a class.
+
+    The AST is compiled directly, without executing the definition: code
+    objects are taken from the constants of the compiled module. Returns
+    code objects indexed by method name for classes and by the empty string
+    for functions.
+    """
+    # decorators are kept (they are not executed) so that co_firstlineno
+    # still points to the first decorator
+    freevars = getattr(getattr(fun, "__code__", None), "co_freevars", ())
+    body: ast.stmt = definition
+    if freevars:
+        # defining the free variables in an enclosing function produces a
+        # code object with the same free variables as the original function
+        body = ast.FunctionDef(
+            name="__impunity_closure__",
+            args=ast.arguments(
+                posonlyargs=[],
+                args=[],
+                kwonlyargs=[],
+                kw_defaults=[],
+                defaults=[],
+            ),
+            body=[
+                ast.Assign(
+                    targets=[ast.Name(id=var, ctx=ast.Store())],
+                    value=ast.Constant(None),
+                )
+                for var in freevars
+            ]
+            + [definition],
+            decorator_list=[],
+        )
+        body = ast.copy_location(body, definition)
+
+    tree = ast.fix_missing_locations(ast.Module(body=[body], type_ignores=[]))
+    fun_globals = sys.modules[fun.__module__].__dict__
+    flags = 0
+    if fun_globals.get("annotations", None) is __future__.annotations:
+        flags = __future__.annotations.compiler_flag
+    code: Optional[types.CodeType] = compile(
+        tree, filename, "exec", flags=flags, dont_inherit=True
+    )
+    if freevars:
+        code = find_code(code, "__impunity_closure__")  # type: ignore
+    code = find_code(code, fun.__name__)  # type: ignore
+    assert code is not None
+
+    if not isinstance(fun, type):
+        return {"": code}
+
+    codes: dict[str, types.CodeType] = {}
+    for const in code.co_consts:
+        if (
+            isinstance(const, types.CodeType)
+            and const.co_name.isidentifier()
+            and not const.co_name.startswith("__")
+        ):
+            codes[const.co_name] = const
+    return codes
+
+
+def register(fun: Any) -> None:
+    """Register a function or class methods in the visitor when the analysis
+    is skipped, so that calls to them are checked in functions decorated
+    afterwards."""
+    if isinstance(fun, type):
+        if (
+            init := getattr(fun, "__init__")
+        ).__class__.__name__ != "wrapper_descriptor":
+            Visitor.add_func(init)
+        for name in dir(fun):
+            method = getattr(fun, name)
+            if callable(method) and not name.startswith("__"):
+                Visitor.add_func(method)
+    else:
+        Visitor.add_func(fun)
+
+
+def rewrite_object(
+    fun: F,
+    *,
+    rewrite: Union[bool, str] = True,
+    ignore_warnings: Union[bool, str] = False,
+    ignore_methods: Union[bool, str] = False,
+    cache: Optional[bool] = None,
+    inplace: bool = False,
+    inline: Union[bool, int] = False,
+    fun_tree: Optional[ast.Module] = None,
+    firstlineno: int = 1,
+    module_vars: Optional[Dict[str, Any]] = None,
+    trees: Optional[List[ast.AST]] = None,
+) -> F:
+    """Check and rewrite a function or a class.
+
+    This is the work done by the :func:`impunity.impunity` decorator.
+    ``fun_tree`` (with line numbers relative to ``firstlineno``) and
+    ``module_vars`` let the caller provide the AST of the object and the
+    annotations of its module when they are already known.
+    If ``trees`` is provided, the rewritten AST is appended to it, with the
+    line numbers of the source file.
+    ``inline`` enables the inlining of calls to small decorated functions
+    (an integer sets the maximal size of the inlined expressions).
+    """
+    with recording(fun):
+        return _rewrite_object(
+            fun,
+            rewrite=rewrite,
+            ignore_warnings=ignore_warnings,
+            ignore_methods=ignore_methods,
+            cache=cache,
+            inplace=inplace,
+            inline=inline,
+            fun_tree=fun_tree,
+            firstlineno=firstlineno,
+            module_vars=module_vars,
+            trees=trees,
+        )
+
+
+def _rewrite_object(
+    fun: F,
+    *,
+    rewrite: Union[bool, str],
+    ignore_warnings: Union[bool, str],
+    ignore_methods: Union[bool, str],
+    cache: Optional[bool],
+    inplace: bool,
+    inline: Union[bool, int],
+    fun_tree: Optional[ast.Module],
+    firstlineno: int,
+    module_vars: Optional[Dict[str, Any]],
+    trees: Optional[List[ast.AST]],
+) -> F:
+
+    # the cache key does not cover the body of inlined functions
+    use_cache = (
+        rewrite is True
+        and inline is False
+        and (cache if cache is not None else cache_enabled())
+    )
+    key = None
+    if use_cache:
+        with phase("cache"):
+            key = cache_key(fun, ignore_warnings, ignore_methods, inplace)
+            entry = load(fun, key) if key is not None else None
+        if entry is not None:
+            replay_warnings(entry.messages)
+            register(fun)
+            with phase("install"):
+                install(fun, entry.codes)
+            return fun
+
+    if fun_tree is None:
+        # dedent for nested methods
+        with phase("getsource"):
+            lines, firstlineno = inspect.getsourcelines(fun)
+        with phase("parse"):
+            fun_tree = ast.parse(textwrap.dedent("".join(lines)))
+    firstlineno = max(firstlineno, 1)
+
+    with record_warnings() as messages:
+        with phase("infer"):
+            visitor = Visitor(fun, ignore_warnings, ignore_methods, module_vars)
+        new_tree = cast(ast.Module, visitor.visit(fun_tree))
+    register_inlinable(fun, new_tree.body[0])
+    with phase("optimize"):
+        if inline is not False:
+            max_size = INLINE_MAX_SIZE if inline is True else int(inline)
+            new_tree = cast(ast.Module, inline_calls(new_tree, fun, max_size))
+        new_tree = cast(ast.Module, optimize(new_tree, inplace))
+
+    # line numbers of the original file
+    ast.fix_missing_locations(new_tree)
+    ast.increment_lineno(new_tree, firstlineno - 1)
+    if not rewrite:
+        return fun
+
+    if trees is not None:
+        trees.append(new_tree)
+
+    definition = new_tree.body[0]
+    if isinstance(rewrite, str):
+        import astor
+
+        path = Path(rewrite)
+        if not path.is_absolute():
+            origin_path = Path(os.path.abspath(inspect.getfile(fun))).parents[0]
+            path = origin_path.joinpath(path)
+        undecorated = copy.copy(definition)
+        undecorated.decorator_list = []  # type: ignore
+        with open(path, "w") as f:
+            f.write(astor.to_source(undecorated))
+            f.write("\n")
+
+    with phase("compile"):
+        filename = inspect.getsourcefile(fun) or inspect.getfile(fun)
+        codes = generate_code(fun, definition, filename)
+
+    with phase("install"):
+        install(fun, codes)
+    if key is not None:
+        store(fun, key, codes, messages)
+    return fun
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+# names of the functions called by the rewritten code, in its globals
+CONVERT_NAME = "__impunity_convert__"
+AFFINE_NAME = "__impunity_affine__"
+
+# number of elements processed at once by the affine kernel: blocks of
+# float64 fit in the L2 cache, so that each element is loaded from memory
+# only once
+BLOCK_SIZE = 1 << 15
+# smallest array converted by the affine kernel into a new array: NumPy
+# reuses the intermediate array of ``value * scale + offset``, which is as
+# fast as long as both arrays mostly fit in the caches
+FUSED_MIN_SIZE = 1 << 24
+
+
+def _numpy() -> Any:
+    # numpy is not imported by impunity: values can only be arrays if numpy
+    # has already been imported
+    return sys.modules.get("numpy", None)
+
+
+def _affine_kernel(
+    numpy: Any, value: Any, scale: float, offset: float, out: Any
+) -> None:
+    """Compute ``value * scale + offset`` into ``out``, block by block.
+
+    ``value`` and ``out`` are C-contiguous arrays of the same shape (possibly
+    the same array).
+    """
+    source = value.reshape(-1)
+    target = out.reshape(-1)
+    for start in range(0, source.size, BLOCK_SIZE):
+        block = slice(start, start + BLOCK_SIZE)
+        numpy.multiply(source[block], scale, out=target[block])
+        if offset != 0:
+            numpy.add(target[block], offset, out=target[block])
+
+
+def affine(value: Any, scale: float, offset: float) -> Any:
+    """Return ``value * scale + offset``.
+
+    Affine conversions (e.g. degC to degF) of large NumPy arrays are
+    computed in a single pass over memory, without an intermediate array.
+    The result has the dtype of the expression form. Small arrays, scalars
+    and other values are converted with the expression form.
+    """
+    numpy = _numpy()
+    if (
+        numpy is not None
+        and type(value) is numpy.ndarray
+        and value.dtype.kind in "biuf"
+        and value.flags.c_contiguous
+        and value.size >= FUSED_MIN_SIZE
+    ):
+        dtype = numpy.result_type(value, scale, offset)
+        out = numpy.empty(value.shape, dtype=dtype)
+        _affine_kernel(numpy, value, scale, offset, out)
+        return out
+    return value * scale + offset
+
+
+def convert(value: Any, scale: float, offset: float = 0) -> Any:
+    """Convert ``value`` (i.e. return ``value * scale + offset``), in place
+    when ``value`` is a writable NumPy array of floating point numbers.
+
+    Functions decorated with ``@impunity(inplace=True)`` call this function
+    on the values they own (temporary results, local variables no longer
+    used afterwards). Other values are converted into a new object.
+    """
+    numpy = _numpy()
+    if (
+        numpy is not None
+        and type(value) is numpy.ndarray
+        and value.dtype.kind in "fc"
+        and value.flags.writeable
+    ):
+        if scale != 1 and offset != 0 and value.flags.c_contiguous:
+            _affine_kernel(numpy, value, scale, offset, value)
+            return value
+        if scale != 1:
+            numpy.multiply(value, scale, out=value)
+        if offset != 0:
+            numpy.add(value, offset, out=value)
+        return value
+    if offset != 0:
+        return affine(value, scale, offset)
+    return value * scale
+
+
+def provide(fun: Any) -> None:
+    """Make the functions called by the rewritten code available to the
+    code of ``fun``."""
+    module = sys.modules.get(fun.__module__, None)
+    if module is not None:
+        module.__dict__.setdefault(CONVERT_NAME, convert)
+        module.__dict__.setdefault(AFFINE_NAME, affine)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+PHASES = (
+    "cache",
+    "getsource",
+    "parse",
+    "link",
+    "infer",
+    "registry",
+    "optimize",
+    "compile",
+    "install",
+)
+
+
+class FunctionStats(NamedTuple):
+    """Time spent decorating a function, phase by phase.
+
+    Attributes:
+        name : str
+            Module and qualified name of the function (or class)
+        phases : dict[str, float]
+            Wall time (in seconds) spent in each phase: cache lookup,
+            getsource, parse, link (parent links in the AST), infer (unit
+            inference and rewriting), registry (building the unit
+            registry), optimize (optimisation passes), compile and install
+            (code swap)
+        pint_calls : int
+            Number of calls to pint (parsing units, computing conversions)
+        conversions : int
+            Number of conversions inserted in the code
+        saved : int
+            Number of conversions removed by the optimisation passes, as
+            the value was already converted to the same unit
+        decorations : int
+            Number of times the function was decorated
+    """
+
+    name: str
+    phases: Dict[str, float]
+    pint_calls: int
+    conversions: int
+    saved: int
+    decorations: int
+
+    @property
+    def total(self) -> float:
+        return sum(self.phases.values())
+
+
+class _Record:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.phases: Dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.pint_calls = 0
+        self.conversions = 0
+        self.saved = 0
+        self.decorations = 0
+        # phases being measured, innermost last: time is only attributed to
+        # the innermost phase, and to the outermost block of each phase
+        self.active: List[str] = []
+        self.start = 0.0
+
+    def switch(self) -> None:
+        now = time.perf_counter()
+        if self.active:
+            self.phases[self.active[-1]] += now - self.start
+        self.start = now
+
+
+_enabled = os.environ.get("IMPUNITY_STATS", "") not in ("", "0")
+_records: Dict[str, _Record] = {}
+_lock = threading.Lock()
+_current: contextvars.ContextVar[Optional[_Record]] = contextvars.ContextVar(
+    "impunity_stats", default=None
+)
+
+
+def stats(enable: Optional[bool] = None) -> Dict[str, FunctionStats]:
+    """Report the time spent decorating each function.
+
+    Recording is off by default: call ``stats(True)`` (or set the
+    ``IMPUNITY_STATS=1`` environment variable) before the decorated
+    functions are defined, and ``stats()`` afterwards to get the report.
+    ``stats(False)`` stops the recording and discards the report.
+
+    .. code-block:: python
+
+        import impunity
+
+        impunity.stats(True)
+        import my_package.models
+
+        for name, s in impunity.stats().items():
+            print(f"{name}: {s.total:.3f}s {s.phases}")
+
+    The ``python -m impunity profile <module>`` command prints the same
+    report, sorted by cost.
+    """
+    global _enabled
+    with _lock:
+        if enable is not None:
+            _enabled = enable
+            if not enable:
+                _records.clear()
+        return {
+            name: FunctionStats(
+                name,
+                dict(record.phases),
+                record.pint_calls,
+                record.conversions,
+                record.saved,
+                record.decorations,
+            )
+            for name, record in _records.items()
+        }
+
+
+@contextlib.contextmanager
+def recording(fun: Any) -> Iterator[None]:
+    """Attribute the phases and counts recorded in the block to ``fun``."""
+    if not _enabled:
+        yield
+        return
+    name = f"{fun.__module__}.{fun.__qualname__}"
+    with _lock:
+        record = _records.get(name, None)
+        if record is None:
+            record = _records[name] = _Record(name)
+        record.decorations += 1
+    token = _current.set(record)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+@contextlib.contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Measure the wall time of the block as part of a phase.
+
+    Phases nested in the block are measured separately, and not counted in
+    the time of the block.
+    """
+    record = _current.get()
+    if record is None or name in record.active:
+        yield
+        return
+    record.switch()
+    record.active.append(name)
+    try:
+        yield
+    finally:
+        record.switch()
+        record.active.pop()
+
+
+def count(pint_calls: int = 0, conversions: int = 0, saved: int = 0) -> None:
+    """Count calls to pint, inserted conversions and saved conversions."""
+    record = _current.get()
+    if record is not None:
+        record.pint_calls += pint_calls
+        record.conversions += conversions
+        record.saved += saved
@@ -0,0 +1,1738 @@
+# Generated by scripts/unit_table.py with pint 0.25.3.
+# Do not edit: run the script again instead.
+
+# base dimensions, in the order of the exponents of the units
+DIMENSIONS = (
+    "[length]",
+    "[mass]",
+    "[time]",
+    "[temperature]",
+    "[current]",
+    "[substance]",
+    "[luminosity]",
+)
+
+# unit: (scale, 1 / scale, offset, exponents of the dimensions)
+UNITS = {
+    "dimensionless": (1.0, 1.0, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "percent": (0.01, 100.0, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "ppm": (1e-06, 1000000.0, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "ft": (0.30479999999999996, 3.2808398950131235, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "foot": (
+        0.30479999999999996,
+        3.2808398950131235,
+        0.0,
+        (1, 0, 0, 0, 0, 0, 0),
+    ),
+    "feet": (
+        0.30479999999999996,
+        3.2808398950131235,
+        0.0,
+        (1, 0, 0, 0, 0, 0, 0),
+    ),
+    "in": (0.0254, 39.37007874015748, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "inch": (0.0254, 39.37007874015748, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "yd": (0.9144, 1.0936132983377078, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "yard": (0.9144, 1.0936132983377078, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "mi": (1609.344, 0.0006213711922373339, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "mile": (1609.344, 0.0006213711922373339, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "nmi": (1852.0, 0.0005399568034557236, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "nautical_mile": (
+        1852.0,
+        0.0005399568034557236,
+        0.0,
+        (1, 0, 0, 0, 0, 0, 0),
+    ),
+    "au": (149597870700.0, 6.684587122268445e-12, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "ly": (
+        9460730472580800.0,
+        1.0570008340246153e-16,
+        0.0,
+        (1, 0, 0, 0, 0, 0, 0),
+    ),
+    "t": (1000000.0, 1e-06, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "tonne": (1000000.0, 1e-06, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "metric_ton": (1000000.0, 1e-06, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "lb": (453.5923700000001, 0.002204622621848776, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "pound": (
+        453.5923700000001,
+        0.002204622621848776,
+        0.0,
+        (0, 1, 0, 0, 0, 0, 0),
+    ),
+    "oz": (
+        28.349523125000005,
+        0.035273961949580414,
+        0.0,
+        (0, 1, 0, 0, 0, 0, 0),
+    ),
+    "ounce": (
+        28.349523125000005,
+        0.035273961949580414,
+        0.0,
+        (0, 1, 0, 0, 0, 0, 0),
+    ),
+    "slug": (
+        14593.902937206369,
+        6.852176585679175e-05,
+        0.0,
+        (0, 1, 0, 0, 0, 0, 0),
+    ),
+    "min": (60.0, 0.016666666666666666, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "minute": (60.0, 0.016666666666666666, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "h": (3600.0, 0.0002777777777777778, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "hr": (3600.0, 0.0002777777777777778, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "hour": (3600.0, 0.0002777777777777778, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "d": (86400.0, 1.1574074074074073e-05, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "day": (86400.0, 1.1574074074074073e-05, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "week": (604800.0, 1.6534391534391533e-06, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "year": (31557600.0, 3.168808781402895e-08, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "degC": (1.0, 1.0, 273.15, (0, 0, 0, 1, 0, 0, 0)),
+    "celsius": (1.0, 1.0, 273.15, (0, 0, 0, 1, 0, 0, 0)),
+    "degree_Celsius": (1.0, 1.0, 273.15, (0, 0, 0, 1, 0, 0, 0)),
+    "°C": (1.0, 1.0, 273.15, (0, 0, 0, 1, 0, 0, 0)),
+    "degF": (
+        0.5555555555555556,
+        1.7999999999999998,
+        255.37222222222223,
+        (0, 0, 0, 1, 0, 0, 0),
+    ),
+    "fahrenheit": (
+        0.5555555555555556,
+        1.7999999999999998,
+        255.37222222222223,
+        (0, 0, 0, 1, 0, 0, 0),
+    ),
+    "degree_Fahrenheit": (
+        0.5555555555555556,
+        1.7999999999999998,
+        255.37222222222223,
+        (0, 0, 0, 1, 0, 0, 0),
+    ),
+    "°F": (
+        0.5555555555555556,
+        1.7999999999999998,
+        255.37222222222223,
+        (0, 0, 0, 1, 0, 0, 0),
+    ),
+    "degR": (
+        0.5555555555555556,
+        1.7999999999999998,
+        0.0,
+        (0, 0, 0, 1, 0, 0, 0),
+    ),
+    "rankine": (
+        0.5555555555555556,
+        1.7999999999999998,
+        0.0,
+        (0, 0, 0, 1, 0, 0, 0),
+    ),
+    "degree_Rankine": (
+        0.5555555555555556,
+        1.7999999999999998,
+        0.0,
+        (0, 0, 0, 1, 0, 0, 0),
+    ),
+    "°R": (0.5555555555555556, 1.7999999999999998, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "kt": (0.5144444444444445, 1.9438444924406049, 0.0, (1, 0, -1, 0, 0, 0, 0)),
+    "kts": (
+        0.5144444444444445,
+        1.9438444924406049,
+        0.0,
+        (1, 0, -1, 0, 0, 0, 0),
+    ),
+    "knot": (
+        0.5144444444444445,
+        1.9438444924406049,
+        0.0,
+        (1, 0, -1, 0, 0, 0, 0),
+    ),
+    "knots": (
+        0.5144444444444445,
+        1.9438444924406049,
+        0.0,
+        (1, 0, -1, 0, 0, 0, 0),
+    ),
+    "mph": (0.44704, 2.2369362920544025, 0.0, (1, 0, -1, 0, 0, 0, 0)),
+    "kph": (0.2777777777777778, 3.6, 0.0, (1, 0, -1, 0, 0, 0, 0)),
+    "fps": (
+        0.30479999999999996,
+        3.2808398950131235,
+        0.0,
+        (1, 0, -1, 0, 0, 0, 0),
+    ),
+    "lbf": (
+        4448.221615260501,
+        0.00022480894309971047,
+        0.0,
+        (1, 1, -2, 0, 0, 0, 0),
+    ),
+    "kgf": (9806.65, 0.00010197162129779284, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "dyn": (0.01, 100.0, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "atm": (101325000.0, 9.86923266716013e-09, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "psi": (
+        6894757.293168363,
+        1.4503773773020921e-07,
+        0.0,
+        (-1, 1, -2, 0, 0, 0, 0),
+    ),
+    "inHg": (
+        3386388.6403409997,
+        2.9529983301010095e-07,
+        0.0,
+        (-1, 1, -2, 0, 0, 0, 0),
+    ),
+    "mmHg": (
+        133322.387415,
+        7.500615758456564e-06,
+        0.0,
+        (-1, 1, -2, 0, 0, 0, 0),
+    ),
+    "torr": (
+        133322.36842105264,
+        7.5006168270416986e-06,
+        0.0,
+        (-1, 1, -2, 0, 0, 0, 0),
+    ),
+    "cal": (4184.0, 0.0002390057361376673, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "calorie": (4184.0, 0.0002390057361376673, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "kcal": (4184000.0, 2.3900573613766727e-07, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "BTU": (1055056.0, 9.478169879134378e-07, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "erg": (0.0001, 10000.0, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "hp": (
+        745699.8715822701,
+        1.341022089595028e-06,
+        0.0,
+        (2, 1, -3, 0, 0, 0, 0),
+    ),
+    "horsepower": (
+        745699.8715822701,
+        1.341022089595028e-06,
+        0.0,
+        (2, 1, -3, 0, 0, 0, 0),
+    ),
+    "deg": (
+        0.017453292519943295,
+        57.29577951308232,
+        0.0,
+        (0, 0, 0, 0, 0, 0, 0),
+    ),
+    "degree": (
+        0.017453292519943295,
+        57.29577951308232,
+        0.0,
+        (0, 0, 0, 0, 0, 0, 0),
+    ),
+    "degrees": (
+        0.017453292519943295,
+        57.29577951308232,
+        0.0,
+        (0, 0, 0, 0, 0, 0, 0),
+    ),
+    "radian": (1.0, 1.0, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "radians": (1.0, 1.0, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "arcmin": (
+        0.00029088820866572163,
+        3437.7467707849396,
+        0.0,
+        (0, 0, 0, 0, 0, 0, 0),
+    ),
+    "arcsec": (
+        4.84813681109536e-06,
+        206264.80624709636,
+        0.0,
+        (0, 0, 0, 0, 0, 0, 0),
+    ),
+    "sr": (1.0, 1.0, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "steradian": (1.0, 1.0, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "rpm": (
+        0.10471975511965977,
+        9.549296585513721,
+        0.0,
+        (0, 0, -1, 0, 0, 0, 0),
+    ),
+    "revolution": (
+        6.283185307179586,
+        0.15915494309189535,
+        0.0,
+        (0, 0, 0, 0, 0, 0, 0),
+    ),
+    "turn": (
+        6.283185307179586,
+        0.15915494309189535,
+        0.0,
+        (0, 0, 0, 0, 0, 0, 0),
+    ),
+    "gal": (
+        0.0037854117839999993,
+        264.1720523581485,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "gallon": (
+        0.0037854117839999993,
+        264.1720523581485,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "m": (1.0, 1.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "g": (1.0, 1.0, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "s": (1.0, 1.0, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "A": (1.0, 1.0, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "K": (1.0, 1.0, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "mol": (1.0, 1.0, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "cd": (1.0, 1.0, 0.0, (0, 0, 0, 0, 0, 0, 1)),
+    "N": (1000.0, 0.001, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "Pa": (1000.0, 0.001, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "J": (1000.0, 0.001, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "W": (1000.0, 0.001, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "Wh": (3600000.0, 2.7777777777777776e-07, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "Hz": (1.0, 1.0, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "V": (1000.0, 0.001, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "C": (1.0, 1.0, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "F": (0.001, 1000.0, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "T": (1000.0, 0.001, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "Wb": (1000.0, 0.001, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "ohm": (1000.0, 0.001, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "Ω": (1000.0, 0.001, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "L": (0.0010000000000000002, 999.9999999999999, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "l": (0.0010000000000000002, 999.9999999999999, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "bar": (100000000.0, 1e-08, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "eV": (1.602176634e-16, 6241509074460763.0, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "rad": (1.0, 1.0, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "meter": (1.0, 1.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "metre": (1.0, 1.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "gram": (1.0, 1.0, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "second": (1.0, 1.0, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "ampere": (1.0, 1.0, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "kelvin": (1.0, 1.0, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "mole": (1.0, 1.0, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "newton": (1000.0, 0.001, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "pascal": (1000.0, 0.001, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "joule": (1000.0, 0.001, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "watt": (1000.0, 0.001, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "hertz": (1.0, 1.0, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "volt": (1000.0, 0.001, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "coulomb": (1.0, 1.0, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "farad": (0.001, 1000.0, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "tesla": (1000.0, 0.001, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "weber": (1000.0, 0.001, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "liter": (
+        0.0010000000000000002,
+        999.9999999999999,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "litre": (
+        0.0010000000000000002,
+        999.9999999999999,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "meters": (1.0, 1.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "metres": (1.0, 1.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "grams": (1.0, 1.0, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "seconds": (1.0, 1.0, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "amperes": (1.0, 1.0, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "kelvins": (1.0, 1.0, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "moles": (1.0, 1.0, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "newtons": (1000.0, 0.001, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "pascals": (1000.0, 0.001, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "joules": (1000.0, 0.001, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "watts": (1000.0, 0.001, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "hertzs": (1.0, 1.0, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "volts": (1000.0, 0.001, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "coulombs": (1.0, 1.0, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "farads": (0.001, 1000.0, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "teslas": (1000.0, 0.001, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "webers": (1000.0, 0.001, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "liters": (
+        0.0010000000000000002,
+        999.9999999999999,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "litres": (
+        0.0010000000000000002,
+        999.9999999999999,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "Ym": (1e24, 1.0000000000000001e-24, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "Yg": (1e24, 1.0000000000000001e-24, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "Ys": (1e24, 1.0000000000000001e-24, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "YA": (1e24, 1.0000000000000001e-24, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "YK": (1e24, 1.0000000000000001e-24, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "Ymol": (1e24, 1.0000000000000001e-24, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "Ycd": (1e24, 1.0000000000000001e-24, 0.0, (0, 0, 0, 0, 0, 0, 1)),
+    "YN": (1e27, 1.0000000000000002e-27, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "YPa": (1e27, 1.0000000000000002e-27, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "YJ": (1e27, 1.0000000000000002e-27, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "YW": (1e27, 1.0000000000000002e-27, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "YWh": (3.6e30, 2.777777777777778e-31, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "YHz": (1e24, 1.0000000000000001e-24, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "YV": (1e27, 1.0000000000000002e-27, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "YC": (1e24, 1.0000000000000001e-24, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "YF": (1e21, 1.0000000000000001e-21, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "YT": (1e27, 1.0000000000000002e-27, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "YWb": (1e27, 1.0000000000000002e-27, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "Yohm": (1e27, 1.0000000000000002e-27, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "YΩ": (1e27, 1.0000000000000002e-27, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "YL": (1.0000000000000003e21, 1e-21, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "Yl": (1.0000000000000003e21, 1e-21, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "Ybar": (
+        9.999999999999999e31,
+        1.0000000000000002e-32,
+        0.0,
+        (-1, 1, -2, 0, 0, 0, 0),
+    ),
+    "YeV": (
+        160217663.39999998,
+        6.241509074460764e-09,
+        0.0,
+        (2, 1, -2, 0, 0, 0, 0),
+    ),
+    "Yrad": (1e24, 1.0000000000000001e-24, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "Zm": (1e21, 1e-21, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "Zg": (1e21, 1e-21, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "Zs": (1e21, 1e-21, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "ZA": (1e21, 1e-21, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "ZK": (1e21, 1e-21, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "Zmol": (1e21, 1e-21, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "Zcd": (1e21, 1e-21, 0.0, (0, 0, 0, 0, 0, 0, 1)),
+    "ZN": (1e24, 1e-24, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "ZPa": (1e24, 1e-24, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "ZJ": (1e24, 1e-24, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "ZW": (1e24, 1e-24, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "ZWh": (3.6e27, 2.7777777777777777e-28, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "ZHz": (1e21, 1e-21, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "ZV": (1e24, 1e-24, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "ZC": (1e21, 1e-21, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "ZF": (1e18, 9.999999999999999e-19, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "ZT": (1e24, 1e-24, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "ZWb": (1e24, 1e-24, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "Zohm": (1e24, 1e-24, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "ZΩ": (1e24, 1e-24, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "ZL": (
+        1.0000000000000003e18,
+        9.999999999999999e-19,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "Zl": (
+        1.0000000000000003e18,
+        9.999999999999999e-19,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "Zbar": (
+        1.0000000000000001e29,
+        1.0000000000000001e-29,
+        0.0,
+        (-1, 1, -2, 0, 0, 0, 0),
+    ),
+    "ZeV": (160217.6634, 6.241509074460762e-06, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "Zrad": (1e21, 1e-21, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "Em": (1e18, 1e-18, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "Eg": (1e18, 1e-18, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "Es": (1e18, 1e-18, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "EA": (1e18, 1e-18, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "EK": (1e18, 1e-18, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "Emol": (1e18, 1e-18, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "Ecd": (1e18, 1e-18, 0.0, (0, 0, 0, 0, 0, 0, 1)),
+    "EN": (1e21, 1.0000000000000001e-21, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "EPa": (1e21, 1.0000000000000001e-21, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "EJ": (1e21, 1.0000000000000001e-21, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "EW": (1e21, 1.0000000000000001e-21, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "EWh": (3.6e24, 2.777777777777778e-25, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "EHz": (1e18, 1e-18, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "EV": (1e21, 1.0000000000000001e-21, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "EC": (1e18, 1e-18, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "EF": (1000000000000000.0, 1e-15, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "ET": (1e21, 1.0000000000000001e-21, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "EWb": (1e21, 1.0000000000000001e-21, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "Eohm": (1e21, 1.0000000000000001e-21, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "EΩ": (1e21, 1.0000000000000001e-21, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "EL": (
+        1000000000000000.2,
+        9.999999999999999e-16,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "El": (
+        1000000000000000.2,
+        9.999999999999999e-16,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "Ebar": (
+        9.999999999999999e25,
+        1.0000000000000002e-26,
+        0.0,
+        (-1, 1, -2, 0, 0, 0, 0),
+    ),
+    "EeV": (160.2176634, 0.006241509074460764, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "Erad": (1e18, 1e-18, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "Pm": (1000000000000000.0, 1e-15, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "Pg": (1000000000000000.0, 1e-15, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "Ps": (1000000000000000.0, 1e-15, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "PA": (1000000000000000.0, 1e-15, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "PK": (1000000000000000.0, 1e-15, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "Pmol": (1000000000000000.0, 1e-15, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "Pcd": (1000000000000000.0, 1e-15, 0.0, (0, 0, 0, 0, 0, 0, 1)),
+    "PN": (1e18, 1e-18, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "PPa": (1e18, 1e-18, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "PJ": (1e18, 1e-18, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "PW": (1e18, 1e-18, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "PWh": (3.6e21, 2.777777777777778e-22, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "PHz": (1000000000000000.0, 1e-15, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "PV": (1e18, 1e-18, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "PC": (1000000000000000.0, 1e-15, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "PF": (1000000000000.0, 1e-12, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "PT": (1e18, 1e-18, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "PWb": (1e18, 1e-18, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "Pohm": (1e18, 1e-18, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "PΩ": (1e18, 1e-18, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "PL": (1000000000000.0002, 1e-12, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "Pl": (1000000000000.0002, 1e-12, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "Pbar": (1e23, 1.0000000000000001e-23, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "PeV": (0.1602176634, 6.2415090744607635, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "Prad": (1000000000000000.0, 1e-15, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "Tm": (1000000000000.0, 1e-12, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "Tg": (1000000000000.0, 1e-12, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "Ts": (1000000000000.0, 1e-12, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "TA": (1000000000000.0, 1e-12, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "TK": (1000000000000.0, 1e-12, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "Tmol": (1000000000000.0, 1e-12, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "Tcd": (1000000000000.0, 1e-12, 0.0, (0, 0, 0, 0, 0, 0, 1)),
+    "TN": (1000000000000000.0, 1e-15, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "TPa": (1000000000000000.0, 1e-15, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "TJ": (1000000000000000.0, 1e-15, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "TW": (1000000000000000.0, 1e-15, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "TWh": (3.6e18, 2.777777777777778e-19, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "THz": (1000000000000.0, 1e-12, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "TV": (1000000000000000.0, 1e-15, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "TC": (1000000000000.0, 1e-12, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "TF": (1000000000.0, 1e-09, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "TT": (1000000000000000.0, 1e-15, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "TWb": (1000000000000000.0, 1e-15, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "Tohm": (1000000000000000.0, 1e-15, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "TΩ": (1000000000000000.0, 1e-15, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "TL": (
+        1000000000.0000002,
+        9.999999999999999e-10,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "Tl": (
+        1000000000.0000002,
+        9.999999999999999e-10,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "Tbar": (1e20, 1.0000000000000001e-20, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "TeV": (0.0001602176634, 6241.509074460762, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "Trad": (1000000000000.0, 1e-12, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "Gm": (1000000000.0, 1e-09, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "Gg": (1000000000.0, 1e-09, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "Gs": (1000000000.0, 1e-09, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "GA": (1000000000.0, 1e-09, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "GK": (1000000000.0, 1e-09, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "Gmol": (1000000000.0, 1e-09, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "Gcd": (1000000000.0, 1e-09, 0.0, (0, 0, 0, 0, 0, 0, 1)),
+    "GN": (
+        1000000000000.0,
+        1.0000000000000002e-12,
+        0.0,
+        (1, 1, -2, 0, 0, 0, 0),
+    ),
+    "GPa": (
+        1000000000000.0,
+        1.0000000000000002e-12,
+        0.0,
+        (-1, 1, -2, 0, 0, 0, 0),
+    ),
+    "GJ": (
+        1000000000000.0,
+        1.0000000000000002e-12,
+        0.0,
+        (2, 1, -2, 0, 0, 0, 0),
+    ),
+    "GW": (
+        1000000000000.0,
+        1.0000000000000002e-12,
+        0.0,
+        (2, 1, -3, 0, 0, 0, 0),
+    ),
+    "GWh": (
+        3600000000000000.0,
+        2.7777777777777785e-16,
+        0.0,
+        (2, 1, -2, 0, 0, 0, 0),
+    ),
+    "GHz": (1000000000.0, 1e-09, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "GV": (
+        1000000000000.0,
+        1.0000000000000002e-12,
+        0.0,
+        (2, 1, -3, 0, -1, 0, 0),
+    ),
+    "GC": (1000000000.0, 1e-09, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "GF": (1000000.0, 1.0000000000000002e-06, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "GT": (
+        1000000000000.0,
+        1.0000000000000002e-12,
+        0.0,
+        (0, 1, -2, 0, -1, 0, 0),
+    ),
+    "GWb": (
+        1000000000000.0,
+        1.0000000000000002e-12,
+        0.0,
+        (2, 1, -2, 0, -1, 0, 0),
+    ),
+    "Gohm": (
+        1000000000000.0,
+        1.0000000000000002e-12,
+        0.0,
+        (2, 1, -3, 0, -2, 0, 0),
+    ),
+    "GΩ": (
+        1000000000000.0,
+        1.0000000000000002e-12,
+        0.0,
+        (2, 1, -3, 0, -2, 0, 0),
+    ),
+    "GL": (1000000.0000000002, 1e-06, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "Gl": (1000000.0000000002, 1e-06, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "Gbar": (1e17, 1.0000000000000002e-17, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "GeV": (1.602176634e-07, 6241509.074460764, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "Grad": (1000000000.0, 1e-09, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "Mm": (1000000.0, 1e-06, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "Mg": (1000000.0, 1e-06, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "Ms": (1000000.0, 1e-06, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "MA": (1000000.0, 1e-06, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "MK": (1000000.0, 1e-06, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "Mmol": (1000000.0, 1e-06, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "Mcd": (1000000.0, 1e-06, 0.0, (0, 0, 0, 0, 0, 0, 1)),
+    "MN": (1000000000.0, 1e-09, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "MPa": (1000000000.0, 1e-09, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "MJ": (1000000000.0, 1e-09, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "MW": (1000000000.0, 1e-09, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "MWh": (
+        3600000000000.0,
+        2.777777777777778e-13,
+        0.0,
+        (2, 1, -2, 0, 0, 0, 0),
+    ),
+    "MHz": (1000000.0, 1e-06, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "MV": (1000000000.0, 1e-09, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "MC": (1000000.0, 1e-06, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "MF": (1000.0, 0.001, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "MT": (1000000000.0, 1e-09, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "MWb": (1000000000.0, 1e-09, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "Mohm": (1000000000.0, 1e-09, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "MΩ": (1000000000.0, 1e-09, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "ML": (
+        1000.0000000000002,
+        0.0009999999999999998,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "Ml": (
+        1000.0000000000002,
+        0.0009999999999999998,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "Mbar": (
+        100000000000000.0,
+        1.0000000000000002e-14,
+        0.0,
+        (-1, 1, -2, 0, 0, 0, 0),
+    ),
+    "MeV": (
+        1.6021766339999998e-10,
+        6241509074.460763,
+        0.0,
+        (2, 1, -2, 0, 0, 0, 0),
+    ),
+    "Mrad": (1000000.0, 1e-06, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "km": (1000.0, 0.001, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "kg": (1000.0, 0.001, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "ks": (1000.0, 0.001, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "kA": (1000.0, 0.001, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "kK": (1000.0, 0.001, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "kmol": (1000.0, 0.001, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "kcd": (1000.0, 0.001, 0.0, (0, 0, 0, 0, 0, 0, 1)),
+    "kN": (1000000.0, 1e-06, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "kPa": (1000000.0, 1e-06, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "kJ": (1000000.0, 1e-06, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "kW": (1000000.0, 1e-06, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "kWh": (3600000000.0, 2.7777777777777777e-10, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "kHz": (1000.0, 0.001, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "kV": (1000000.0, 1e-06, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "kC": (1000.0, 0.001, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "kF": (1.0, 1.0, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "kT": (1000000.0, 1e-06, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "kWb": (1000000.0, 1e-06, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "kohm": (1000000.0, 1e-06, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "kΩ": (1000000.0, 1e-06, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "kL": (1.0000000000000002, 0.9999999999999999, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "kl": (1.0000000000000002, 0.9999999999999999, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "kbar": (
+        100000000000.0,
+        1.0000000000000001e-11,
+        0.0,
+        (-1, 1, -2, 0, 0, 0, 0),
+    ),
+    "keV": (
+        1.6021766339999998e-13,
+        6241509074460.763,
+        0.0,
+        (2, 1, -2, 0, 0, 0, 0),
+    ),
+    "krad": (1000.0, 0.001, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "hm": (100.0, 0.01, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "hg": (100.0, 0.01, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "hs": (100.0, 0.01, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "hA": (100.0, 0.01, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "hK": (100.0, 0.01, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "hmol": (100.0, 0.01, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "hcd": (100.0, 0.01, 0.0, (0, 0, 0, 0, 0, 0, 1)),
+    "hN": (100000.0, 1e-05, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "hPa": (100000.0, 1e-05, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "hJ": (100000.0, 1e-05, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "hW": (100000.0, 1e-05, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "hWh": (360000000.0, 2.777777777777778e-09, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "hHz": (100.0, 0.01, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "hV": (100000.0, 1e-05, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "hC": (100.0, 0.01, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "hF": (0.1, 10.0, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "hT": (100000.0, 1e-05, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "hWb": (100000.0, 1e-05, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "hohm": (100000.0, 1e-05, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "hΩ": (100000.0, 1e-05, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "hL": (0.10000000000000002, 9.999999999999998, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "hl": (0.10000000000000002, 9.999999999999998, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "hbar": (
+        1.0545718176461565e-31,
+        9.482521562467289e30,
+        0.0,
+        (2, 1, -1, 0, 0, 0, 0),
+    ),
+    "heV": (
+        1.6021766339999998e-14,
+        62415090744607.63,
+        0.0,
+        (2, 1, -2, 0, 0, 0, 0),
+    ),
+    "hrad": (100.0, 0.01, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "dam": (10.0, 0.1, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "dag": (10.0, 0.1, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "das": (10.0, 0.1, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "daA": (10.0, 0.1, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "daK": (10.0, 0.1, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "damol": (10.0, 0.1, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "dacd": (10.0, 0.1, 0.0, (0, 0, 0, 0, 0, 0, 1)),
+    "daN": (10000.0, 0.0001, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "daPa": (10000.0, 0.0001, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "daJ": (10000.0, 0.0001, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "daW": (10000.0, 0.0001, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "daWh": (36000000.0, 2.777777777777778e-08, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "daHz": (10.0, 0.1, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "daV": (10000.0, 0.0001, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "daC": (10.0, 0.1, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "daF": (0.01, 100.0, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "daT": (10000.0, 0.0001, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "daWb": (10000.0, 0.0001, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "daohm": (10000.0, 0.0001, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "daΩ": (10000.0, 0.0001, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "daL": (0.010000000000000002, 100.0, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "dal": (0.010000000000000002, 100.0, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "dabar": (
+        1000000000.0,
+        1.0000000000000003e-09,
+        0.0,
+        (-1, 1, -2, 0, 0, 0, 0),
+    ),
+    "daeV": (1.602176634e-15, 624150907446076.2, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "darad": (10.0, 0.1, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "dm": (0.1, 10.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "dg": (0.1, 10.0, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "ds": (0.1, 10.0, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "dA": (0.1, 10.0, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "dK": (0.1, 10.0, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "dmol": (0.1, 10.0, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "dcd": (0.1, 10.0, 0.0, (0, 0, 0, 0, 0, 0, 1)),
+    "dN": (100.0, 0.01, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "dPa": (100.0, 0.01, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "dJ": (100.0, 0.01, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "dW": (100.0, 0.01, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "dWh": (360000.0, 2.777777777777778e-06, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "dHz": (0.1, 10.0, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "dV": (100.0, 0.01, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "dC": (0.1, 10.0, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "dF": (0.0001, 10000.0, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "dT": (100.0, 0.01, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "dWb": (100.0, 0.01, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "dohm": (100.0, 0.01, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "dΩ": (100.0, 0.01, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "dL": (
+        0.00010000000000000002,
+        9999.999999999998,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "dl": (
+        0.00010000000000000002,
+        9999.999999999998,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "dbar": (10000000.0, 1.0000000000000001e-07, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "deV": (1.602176634e-17, 6.241509074460763e16, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "drad": (0.1, 10.0, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "cm": (0.01, 100.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "cg": (0.01, 100.0, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "cs": (0.01, 100.0, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "cA": (0.01, 100.0, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "cK": (0.01, 100.0, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "cmol": (0.01, 100.0, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "ccd": (0.01, 100.0, 0.0, (0, 0, 0, 0, 0, 0, 1)),
+    "cN": (10.0, 0.1, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "cPa": (10.0, 0.1, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "cJ": (10.0, 0.1, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "cW": (10.0, 0.1, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "cWh": (36000.0, 2.777777777777778e-05, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "cHz": (0.01, 100.0, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "cV": (10.0, 0.1, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "cC": (0.01, 100.0, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "cF": (1e-05, 100000.0, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "cT": (10.0, 0.1, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "cWb": (10.0, 0.1, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "cohm": (10.0, 0.1, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "cΩ": (10.0, 0.1, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "cL": (
+        1.0000000000000003e-05,
+        99999.99999999999,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "cl": (
+        1.0000000000000003e-05,
+        99999.99999999999,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "cbar": (1000000.0, 1e-06, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "ceV": (1.602176634e-18, 6.241509074460764e17, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "crad": (0.01, 100.0, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "mm": (0.001, 1000.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "mg": (0.001, 1000.0, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "ms": (0.001, 1000.0, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "mA": (0.001, 1000.0, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "mK": (0.001, 1000.0, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "mmol": (0.001, 1000.0, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "mcd": (0.0864, 11.574074074074073, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "mN": (1.0, 1.0, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "mPa": (1.0, 1.0, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "mJ": (1.0, 1.0, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "mW": (1.0, 1.0, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "mWh": (3600.0, 0.0002777777777777778, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "mHz": (0.001, 1000.0, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "mV": (1.0, 1.0, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "mC": (0.001, 1000.0, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "mF": (1e-06, 1000000.0, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "mT": (1.0, 1.0, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "mWb": (1.0, 1.0, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "mohm": (1.0, 1.0, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "mΩ": (1.0, 1.0, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "mL": (
+        1.0000000000000002e-06,
+        999999.9999999999,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "ml": (
+        1.0000000000000002e-06,
+        999999.9999999999,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "mbar": (100000.0, 1e-05, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "meV": (1.602176634e-19, 6.241509074460763e18, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "mrad": (0.001, 1000.0, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "um": (1e-06, 1000000.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "ug": (1e-06, 1000000.0, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "us": (1e-06, 1000000.0, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "uA": (1e-06, 1000000.0, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "uK": (1e-06, 1000000.0, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "umol": (1e-06, 1000000.0, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "ucd": (1e-06, 1000000.0, 0.0, (0, 0, 0, 0, 0, 0, 1)),
+    "uN": (0.001, 1000.0, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "uPa": (0.001, 1000.0, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "uJ": (0.001, 1000.0, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "uW": (0.001, 1000.0, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "uWh": (3.6, 0.2777777777777778, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "uHz": (1e-06, 1000000.0, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "uV": (0.001, 1000.0, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "uC": (1e-06, 1000000.0, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "uF": (1e-09, 1000000000.0, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "uT": (0.001, 1000.0, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "uWb": (0.001, 1000.0, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "uohm": (0.001, 1000.0, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "uΩ": (0.001, 1000.0, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "uL": (
+        1.0000000000000003e-09,
+        999999999.9999999,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "ul": (
+        1.0000000000000003e-09,
+        999999999.9999999,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "ubar": (99.99999999999999, 0.01, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "ueV": (
+        1.6021766339999998e-22,
+        6.241509074460763e21,
+        0.0,
+        (2, 1, -2, 0, 0, 0, 0),
+    ),
+    "urad": (1e-06, 1000000.0, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "µm": (1e-06, 1000000.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "µg": (1e-06, 1000000.0, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "µs": (1e-06, 1000000.0, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "µA": (1e-06, 1000000.0, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "µK": (1e-06, 1000000.0, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "µmol": (1e-06, 1000000.0, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "µcd": (1e-06, 1000000.0, 0.0, (0, 0, 0, 0, 0, 0, 1)),
+    "µN": (0.001, 1000.0, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "µPa": (0.001, 1000.0, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "µJ": (0.001, 1000.0, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "µW": (0.001, 1000.0, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "µWh": (3.6, 0.2777777777777778, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "µHz": (1e-06, 1000000.0, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "µV": (0.001, 1000.0, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "µC": (1e-06, 1000000.0, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "µF": (1e-09, 1000000000.0, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "µT": (0.001, 1000.0, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "µWb": (0.001, 1000.0, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "µohm": (0.001, 1000.0, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "µΩ": (0.001, 1000.0, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "µL": (
+        1.0000000000000003e-09,
+        999999999.9999999,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "µl": (
+        1.0000000000000003e-09,
+        999999999.9999999,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "µbar": (99.99999999999999, 0.01, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "µeV": (
+        1.6021766339999998e-22,
+        6.241509074460763e21,
+        0.0,
+        (2, 1, -2, 0, 0, 0, 0),
+    ),
+    "µrad": (1e-06, 1000000.0, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "nm": (1e-09, 999999999.9999999, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "ng": (1e-09, 999999999.9999999, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "ns": (1e-09, 999999999.9999999, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "nA": (1e-09, 999999999.9999999, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "nK": (1e-09, 999999999.9999999, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "nmol": (1e-09, 999999999.9999999, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "ncd": (1e-09, 999999999.9999999, 0.0, (0, 0, 0, 0, 0, 0, 1)),
+    "nN": (
+        1.0000000000000002e-06,
+        999999.9999999999,
+        0.0,
+        (1, 1, -2, 0, 0, 0, 0),
+    ),
+    "nPa": (
+        1.0000000000000002e-06,
+        999999.9999999999,
+        0.0,
+        (-1, 1, -2, 0, 0, 0, 0),
+    ),
+    "nJ": (
+        1.0000000000000002e-06,
+        999999.9999999999,
+        0.0,
+        (2, 1, -2, 0, 0, 0, 0),
+    ),
+    "nW": (
+        1.0000000000000002e-06,
+        999999.9999999999,
+        0.0,
+        (2, 1, -3, 0, 0, 0, 0),
+    ),
+    "nWh": (
+        0.0036000000000000008,
+        277.77777777777777,
+        0.0,
+        (2, 1, -2, 0, 0, 0, 0),
+    ),
+    "nHz": (1e-09, 999999999.9999999, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "nV": (
+        1.0000000000000002e-06,
+        999999.9999999999,
+        0.0,
+        (2, 1, -3, 0, -1, 0, 0),
+    ),
+    "nC": (1e-09, 999999999.9999999, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "nF": (
+        1.0000000000000002e-12,
+        999999999999.9999,
+        0.0,
+        (-2, -1, 4, 0, 2, 0, 0),
+    ),
+    "nT": (
+        1.0000000000000002e-06,
+        999999.9999999999,
+        0.0,
+        (0, 1, -2, 0, -1, 0, 0),
+    ),
+    "nWb": (
+        1.0000000000000002e-06,
+        999999.9999999999,
+        0.0,
+        (2, 1, -2, 0, -1, 0, 0),
+    ),
+    "nohm": (
+        1.0000000000000002e-06,
+        999999.9999999999,
+        0.0,
+        (2, 1, -3, 0, -2, 0, 0),
+    ),
+    "nΩ": (
+        1.0000000000000002e-06,
+        999999.9999999999,
+        0.0,
+        (2, 1, -3, 0, -2, 0, 0),
+    ),
+    "nL": (
+        1.0000000000000004e-12,
+        999999999999.9998,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "nl": (
+        1.0000000000000004e-12,
+        999999999999.9998,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "nbar": (0.1, 10.0, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "neV": (1.602176634e-25, 6.241509074460762e24, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "nrad": (1e-09, 999999999.9999999, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "pm": (1e-12, 1000000000000.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "pg": (1e-12, 1000000000000.0, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "ps": (1e-12, 1000000000000.0, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "pA": (1e-12, 1000000000000.0, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "pK": (1e-12, 1000000000000.0, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "pmol": (1e-12, 1000000000000.0, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "pcd": (1e-12, 1000000000000.0, 0.0, (0, 0, 0, 0, 0, 0, 1)),
+    "pN": (1e-09, 1000000000.0, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "pPa": (1e-09, 1000000000.0, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "pJ": (1e-09, 1000000000.0, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "pW": (1e-09, 1000000000.0, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "pWh": (
+        3.6000000000000003e-06,
+        277777.77777777775,
+        0.0,
+        (2, 1, -2, 0, 0, 0, 0),
+    ),
+    "pHz": (1e-12, 1000000000000.0, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "pV": (1e-09, 1000000000.0, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "pC": (1e-12, 1000000000000.0, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "pF": (1e-15, 1000000000000000.0, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "pT": (1e-09, 1000000000.0, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "pWb": (1e-09, 1000000000.0, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "pohm": (1e-09, 1000000000.0, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "pΩ": (1e-09, 1000000000.0, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "pL": (
+        1.0000000000000003e-15,
+        999999999999999.9,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "pl": (
+        1.0000000000000003e-15,
+        999999999999999.9,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "pbar": (9.999999999999999e-05, 10000.0, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "peV": (
+        1.6021766339999998e-28,
+        6.241509074460763e27,
+        0.0,
+        (2, 1, -2, 0, 0, 0, 0),
+    ),
+    "prad": (1e-12, 1000000000000.0, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "fm": (1e-15, 999999999999999.9, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "fg": (1e-15, 999999999999999.9, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "fs": (1e-15, 999999999999999.9, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "fA": (1e-15, 999999999999999.9, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "fK": (1e-15, 999999999999999.9, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "fmol": (1e-15, 999999999999999.9, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "fcd": (1e-15, 999999999999999.9, 0.0, (0, 0, 0, 0, 0, 0, 1)),
+    "fN": (1e-12, 999999999999.9999, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "fPa": (1e-12, 999999999999.9999, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "fJ": (1e-12, 999999999999.9999, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "fW": (1e-12, 999999999999.9999, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "fWh": (3.6e-09, 277777777.77777773, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "fHz": (1e-15, 999999999999999.9, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "fV": (1e-12, 999999999999.9999, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "fC": (1e-15, 999999999999999.9, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "fF": (1e-18, 9.999999999999999e17, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "fT": (1e-12, 999999999999.9999, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "fWb": (1e-12, 999999999999.9999, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "fohm": (1e-12, 999999999999.9999, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "fΩ": (1e-12, 999999999999.9999, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "fL": (
+        1.0000000000000003e-18,
+        9.999999999999997e17,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "fl": (
+        1.0000000000000003e-18,
+        9.999999999999997e17,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "fbar": (1.0000000000000001e-07, 10000000.0, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "feV": (
+        1.6021766339999998e-31,
+        6.241509074460762e30,
+        0.0,
+        (2, 1, -2, 0, 0, 0, 0),
+    ),
+    "frad": (1e-15, 999999999999999.9, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "am": (1e-18, 9.999999999999999e17, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "ag": (1e-18, 9.999999999999999e17, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "as": (1e-18, 9.999999999999999e17, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "aA": (1e-18, 9.999999999999999e17, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "aK": (1e-18, 9.999999999999999e17, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "amol": (1e-18, 9.999999999999999e17, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "acd": (1e-18, 9.999999999999999e17, 0.0, (0, 0, 0, 0, 0, 0, 1)),
+    "aN": (1e-15, 999999999999999.9, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "aPa": (1e-15, 999999999999999.9, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "aJ": (1e-15, 999999999999999.9, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "aW": (1e-15, 999999999999999.9, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "aWh": (
+        3.6000000000000004e-12,
+        277777777777.7778,
+        0.0,
+        (2, 1, -2, 0, 0, 0, 0),
+    ),
+    "aHz": (1e-18, 9.999999999999999e17, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "aV": (1e-15, 999999999999999.9, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "aC": (1e-18, 9.999999999999999e17, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "aF": (
+        1.0000000000000001e-21,
+        9.999999999999999e20,
+        0.0,
+        (-2, -1, 4, 0, 2, 0, 0),
+    ),
+    "aT": (1e-15, 999999999999999.9, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "aWb": (1e-15, 999999999999999.9, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "aohm": (1e-15, 999999999999999.9, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "aΩ": (1e-15, 999999999999999.9, 0.0, (2, 1, -3, 0, -2, 0, 0)),
+    "aL": (
+        1.0000000000000003e-21,
+        9.999999999999997e20,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "al": (
+        1.0000000000000003e-21,
+        9.999999999999997e20,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "abar": (1e-10, 10000000000.0, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "aeV": (
+        1.6021766340000001e-34,
+        6.241509074460762e33,
+        0.0,
+        (2, 1, -2, 0, 0, 0, 0),
+    ),
+    "arad": (1e-18, 9.999999999999999e17, 0.0, (0, 0, 0, 0, 0, 0, 0)),
+    "yottameter": (1e24, 1.0000000000000001e-24, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "yottametre": (1e24, 1.0000000000000001e-24, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "yottagram": (1e24, 1.0000000000000001e-24, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "yottasecond": (1e24, 1.0000000000000001e-24, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "yottaampere": (1e24, 1.0000000000000001e-24, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "yottakelvin": (1e24, 1.0000000000000001e-24, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "yottamole": (1e24, 1.0000000000000001e-24, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "yottanewton": (1e27, 1.0000000000000002e-27, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "yottapascal": (1e27, 1.0000000000000002e-27, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "yottajoule": (1e27, 1.0000000000000002e-27, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "yottawatt": (1e27, 1.0000000000000002e-27, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "yottahertz": (1e24, 1.0000000000000001e-24, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "yottavolt": (1e27, 1.0000000000000002e-27, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "yottacoulomb": (1e24, 1.0000000000000001e-24, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "yottafarad": (1e21, 1.0000000000000001e-21, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "yottatesla": (1e27, 1.0000000000000002e-27, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "yottaweber": (1e27, 1.0000000000000002e-27, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "yottaliter": (1.0000000000000003e21, 1e-21, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "yottalitre": (1.0000000000000003e21, 1e-21, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "zettameter": (1e21, 1e-21, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "zettametre": (1e21, 1e-21, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "zettagram": (1e21, 1e-21, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "zettasecond": (1e21, 1e-21, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "zettaampere": (1e21, 1e-21, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "zettakelvin": (1e21, 1e-21, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "zettamole": (1e21, 1e-21, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "zettanewton": (1e24, 1e-24, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "zettapascal": (1e24, 1e-24, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "zettajoule": (1e24, 1e-24, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "zettawatt": (1e24, 1e-24, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "zettahertz": (1e21, 1e-21, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "zettavolt": (1e24, 1e-24, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "zettacoulomb": (1e21, 1e-21, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "zettafarad": (1e18, 9.999999999999999e-19, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "zettatesla": (1e24, 1e-24, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "zettaweber": (1e24, 1e-24, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "zettaliter": (
+        1.0000000000000003e18,
+        9.999999999999999e-19,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "zettalitre": (
+        1.0000000000000003e18,
+        9.999999999999999e-19,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "exameter": (1e18, 1e-18, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "exametre": (1e18, 1e-18, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "exagram": (1e18, 1e-18, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "exasecond": (1e18, 1e-18, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "exaampere": (1e18, 1e-18, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "exakelvin": (1e18, 1e-18, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "examole": (1e18, 1e-18, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "exanewton": (1e21, 1.0000000000000001e-21, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "exapascal": (1e21, 1.0000000000000001e-21, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "exajoule": (1e21, 1.0000000000000001e-21, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "exawatt": (1e21, 1.0000000000000001e-21, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "exahertz": (1e18, 1e-18, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "exavolt": (1e21, 1.0000000000000001e-21, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "exacoulomb": (1e18, 1e-18, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "exafarad": (1000000000000000.0, 1e-15, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "exatesla": (1e21, 1.0000000000000001e-21, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "exaweber": (1e21, 1.0000000000000001e-21, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "exaliter": (
+        1000000000000000.2,
+        9.999999999999999e-16,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "exalitre": (
+        1000000000000000.2,
+        9.999999999999999e-16,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "petameter": (1000000000000000.0, 1e-15, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "petametre": (1000000000000000.0, 1e-15, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "petagram": (1000000000000000.0, 1e-15, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "petasecond": (1000000000000000.0, 1e-15, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "petaampere": (1000000000000000.0, 1e-15, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "petakelvin": (1000000000000000.0, 1e-15, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "petamole": (1000000000000000.0, 1e-15, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "petanewton": (1e18, 1e-18, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "petapascal": (1e18, 1e-18, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "petajoule": (1e18, 1e-18, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "petawatt": (1e18, 1e-18, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "petahertz": (1000000000000000.0, 1e-15, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "petavolt": (1e18, 1e-18, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "petacoulomb": (1000000000000000.0, 1e-15, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "petafarad": (1000000000000.0, 1e-12, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "petatesla": (1e18, 1e-18, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "petaweber": (1e18, 1e-18, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "petaliter": (1000000000000.0002, 1e-12, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "petalitre": (1000000000000.0002, 1e-12, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "terameter": (1000000000000.0, 1e-12, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "terametre": (1000000000000.0, 1e-12, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "teragram": (1000000000000.0, 1e-12, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "terasecond": (1000000000000.0, 1e-12, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "teraampere": (1000000000000.0, 1e-12, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "terakelvin": (1000000000000.0, 1e-12, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "teramole": (1000000000000.0, 1e-12, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "teranewton": (1000000000000000.0, 1e-15, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "terapascal": (1000000000000000.0, 1e-15, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "terajoule": (1000000000000000.0, 1e-15, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "terawatt": (1000000000000000.0, 1e-15, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "terahertz": (1000000000000.0, 1e-12, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "teravolt": (1000000000000000.0, 1e-15, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "teracoulomb": (1000000000000.0, 1e-12, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "terafarad": (1000000000.0, 1e-09, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "teratesla": (1000000000000000.0, 1e-15, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "teraweber": (1000000000000000.0, 1e-15, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "teraliter": (
+        1000000000.0000002,
+        9.999999999999999e-10,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "teralitre": (
+        1000000000.0000002,
+        9.999999999999999e-10,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "gigameter": (1000000000.0, 1e-09, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "gigametre": (1000000000.0, 1e-09, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "gigagram": (1000000000.0, 1e-09, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "gigasecond": (1000000000.0, 1e-09, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "gigaampere": (1000000000.0, 1e-09, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "gigakelvin": (1000000000.0, 1e-09, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "gigamole": (1000000000.0, 1e-09, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "giganewton": (
+        1000000000000.0,
+        1.0000000000000002e-12,
+        0.0,
+        (1, 1, -2, 0, 0, 0, 0),
+    ),
+    "gigapascal": (
+        1000000000000.0,
+        1.0000000000000002e-12,
+        0.0,
+        (-1, 1, -2, 0, 0, 0, 0),
+    ),
+    "gigajoule": (
+        1000000000000.0,
+        1.0000000000000002e-12,
+        0.0,
+        (2, 1, -2, 0, 0, 0, 0),
+    ),
+    "gigawatt": (
+        1000000000000.0,
+        1.0000000000000002e-12,
+        0.0,
+        (2, 1, -3, 0, 0, 0, 0),
+    ),
+    "gigahertz": (1000000000.0, 1e-09, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "gigavolt": (
+        1000000000000.0,
+        1.0000000000000002e-12,
+        0.0,
+        (2, 1, -3, 0, -1, 0, 0),
+    ),
+    "gigacoulomb": (1000000000.0, 1e-09, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "gigafarad": (
+        1000000.0,
+        1.0000000000000002e-06,
+        0.0,
+        (-2, -1, 4, 0, 2, 0, 0),
+    ),
+    "gigatesla": (
+        1000000000000.0,
+        1.0000000000000002e-12,
+        0.0,
+        (0, 1, -2, 0, -1, 0, 0),
+    ),
+    "gigaweber": (
+        1000000000000.0,
+        1.0000000000000002e-12,
+        0.0,
+        (2, 1, -2, 0, -1, 0, 0),
+    ),
+    "gigaliter": (1000000.0000000002, 1e-06, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "gigalitre": (1000000.0000000002, 1e-06, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "megameter": (1000000.0, 1e-06, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "megametre": (1000000.0, 1e-06, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "megagram": (1000000.0, 1e-06, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "megasecond": (1000000.0, 1e-06, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "megaampere": (1000000.0, 1e-06, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "megakelvin": (1000000.0, 1e-06, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "megamole": (1000000.0, 1e-06, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "meganewton": (1000000000.0, 1e-09, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "megapascal": (1000000000.0, 1e-09, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "megajoule": (1000000000.0, 1e-09, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "megawatt": (1000000000.0, 1e-09, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "megahertz": (1000000.0, 1e-06, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "megavolt": (1000000000.0, 1e-09, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "megacoulomb": (1000000.0, 1e-06, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "megafarad": (1000.0, 0.001, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "megatesla": (1000000000.0, 1e-09, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "megaweber": (1000000000.0, 1e-09, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "megaliter": (
+        1000.0000000000002,
+        0.0009999999999999998,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "megalitre": (
+        1000.0000000000002,
+        0.0009999999999999998,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "kilometer": (1000.0, 0.001, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "kilometre": (1000.0, 0.001, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "kilogram": (1000.0, 0.001, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "kilosecond": (1000.0, 0.001, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "kiloampere": (1000.0, 0.001, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "kilokelvin": (1000.0, 0.001, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "kilomole": (1000.0, 0.001, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "kilonewton": (1000000.0, 1e-06, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "kilopascal": (1000000.0, 1e-06, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "kilojoule": (1000000.0, 1e-06, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "kilowatt": (1000000.0, 1e-06, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "kilohertz": (1000.0, 0.001, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "kilovolt": (1000000.0, 1e-06, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "kilocoulomb": (1000.0, 0.001, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "kilofarad": (1.0, 1.0, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "kilotesla": (1000000.0, 1e-06, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "kiloweber": (1000000.0, 1e-06, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "kiloliter": (
+        1.0000000000000002,
+        0.9999999999999999,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "kilolitre": (
+        1.0000000000000002,
+        0.9999999999999999,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "hectometer": (100.0, 0.01, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "hectometre": (100.0, 0.01, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "hectogram": (100.0, 0.01, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "hectosecond": (100.0, 0.01, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "hectoampere": (100.0, 0.01, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "hectokelvin": (100.0, 0.01, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "hectomole": (100.0, 0.01, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "hectonewton": (100000.0, 1e-05, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "hectopascal": (100000.0, 1e-05, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "hectojoule": (100000.0, 1e-05, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "hectowatt": (100000.0, 1e-05, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "hectohertz": (100.0, 0.01, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "hectovolt": (100000.0, 1e-05, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "hectocoulomb": (100.0, 0.01, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "hectofarad": (0.1, 10.0, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "hectotesla": (100000.0, 1e-05, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "hectoweber": (100000.0, 1e-05, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "hectoliter": (
+        0.10000000000000002,
+        9.999999999999998,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "hectolitre": (
+        0.10000000000000002,
+        9.999999999999998,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "decameter": (10.0, 0.1, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "decametre": (10.0, 0.1, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "decagram": (10.0, 0.1, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "decasecond": (10.0, 0.1, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "decaampere": (10.0, 0.1, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "decakelvin": (10.0, 0.1, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "decamole": (10.0, 0.1, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "decanewton": (10000.0, 0.0001, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "decapascal": (10000.0, 0.0001, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "decajoule": (10000.0, 0.0001, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "decawatt": (10000.0, 0.0001, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "decahertz": (10.0, 0.1, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "decavolt": (10000.0, 0.0001, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "decacoulomb": (10.0, 0.1, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "decafarad": (0.01, 100.0, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "decatesla": (10000.0, 0.0001, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "decaweber": (10000.0, 0.0001, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "decaliter": (0.010000000000000002, 100.0, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "decalitre": (0.010000000000000002, 100.0, 0.0, (3, 0, 0, 0, 0, 0, 0)),
+    "decimeter": (0.1, 10.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "decimetre": (0.1, 10.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "decigram": (0.1, 10.0, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "decisecond": (0.1, 10.0, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "deciampere": (0.1, 10.0, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "decikelvin": (0.1, 10.0, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "decimole": (0.1, 10.0, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "decinewton": (100.0, 0.01, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "decipascal": (100.0, 0.01, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "decijoule": (100.0, 0.01, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "deciwatt": (100.0, 0.01, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "decihertz": (0.1, 10.0, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "decivolt": (100.0, 0.01, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "decicoulomb": (0.1, 10.0, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "decifarad": (0.0001, 10000.0, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "decitesla": (100.0, 0.01, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "deciweber": (100.0, 0.01, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "deciliter": (
+        0.00010000000000000002,
+        9999.999999999998,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "decilitre": (
+        0.00010000000000000002,
+        9999.999999999998,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "centimeter": (0.01, 100.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "centimetre": (0.01, 100.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "centigram": (0.01, 100.0, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "centisecond": (0.01, 100.0, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "centiampere": (0.01, 100.0, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "centikelvin": (0.01, 100.0, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "centimole": (0.01, 100.0, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "centinewton": (10.0, 0.1, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "centipascal": (10.0, 0.1, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "centijoule": (10.0, 0.1, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "centiwatt": (10.0, 0.1, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "centihertz": (0.01, 100.0, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "centivolt": (10.0, 0.1, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "centicoulomb": (0.01, 100.0, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "centifarad": (1e-05, 100000.0, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "centitesla": (10.0, 0.1, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "centiweber": (10.0, 0.1, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "centiliter": (
+        1.0000000000000003e-05,
+        99999.99999999999,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "centilitre": (
+        1.0000000000000003e-05,
+        99999.99999999999,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "millimeter": (0.001, 1000.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "millimetre": (0.001, 1000.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "milligram": (0.001, 1000.0, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "millisecond": (0.001, 1000.0, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "milliampere": (0.001, 1000.0, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "millikelvin": (0.001, 1000.0, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "millimole": (0.001, 1000.0, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "millinewton": (1.0, 1.0, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "millipascal": (1.0, 1.0, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "millijoule": (1.0, 1.0, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "milliwatt": (1.0, 1.0, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "millihertz": (0.001, 1000.0, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "millivolt": (1.0, 1.0, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "millicoulomb": (0.001, 1000.0, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "millifarad": (1e-06, 1000000.0, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "millitesla": (1.0, 1.0, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "milliweber": (1.0, 1.0, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "milliliter": (
+        1.0000000000000002e-06,
+        999999.9999999999,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "millilitre": (
+        1.0000000000000002e-06,
+        999999.9999999999,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "micrometer": (1e-06, 1000000.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "micrometre": (1e-06, 1000000.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "microgram": (1e-06, 1000000.0, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "microsecond": (1e-06, 1000000.0, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "microampere": (1e-06, 1000000.0, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "microkelvin": (1e-06, 1000000.0, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "micromole": (1e-06, 1000000.0, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "micronewton": (0.001, 1000.0, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "micropascal": (0.001, 1000.0, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "microjoule": (0.001, 1000.0, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "microwatt": (0.001, 1000.0, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "microhertz": (1e-06, 1000000.0, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "microvolt": (0.001, 1000.0, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "microcoulomb": (1e-06, 1000000.0, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "microfarad": (1e-09, 1000000000.0, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "microtesla": (0.001, 1000.0, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "microweber": (0.001, 1000.0, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "microliter": (
+        1.0000000000000003e-09,
+        999999999.9999999,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "microlitre": (
+        1.0000000000000003e-09,
+        999999999.9999999,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "nanometer": (1e-09, 999999999.9999999, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "nanometre": (1e-09, 999999999.9999999, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "nanogram": (1e-09, 999999999.9999999, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "nanosecond": (1e-09, 999999999.9999999, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "nanoampere": (1e-09, 999999999.9999999, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "nanokelvin": (1e-09, 999999999.9999999, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "nanomole": (1e-09, 999999999.9999999, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "nanonewton": (
+        1.0000000000000002e-06,
+        999999.9999999999,
+        0.0,
+        (1, 1, -2, 0, 0, 0, 0),
+    ),
+    "nanopascal": (
+        1.0000000000000002e-06,
+        999999.9999999999,
+        0.0,
+        (-1, 1, -2, 0, 0, 0, 0),
+    ),
+    "nanojoule": (
+        1.0000000000000002e-06,
+        999999.9999999999,
+        0.0,
+        (2, 1, -2, 0, 0, 0, 0),
+    ),
+    "nanowatt": (
+        1.0000000000000002e-06,
+        999999.9999999999,
+        0.0,
+        (2, 1, -3, 0, 0, 0, 0),
+    ),
+    "nanohertz": (1e-09, 999999999.9999999, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "nanovolt": (
+        1.0000000000000002e-06,
+        999999.9999999999,
+        0.0,
+        (2, 1, -3, 0, -1, 0, 0),
+    ),
+    "nanocoulomb": (1e-09, 999999999.9999999, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "nanofarad": (
+        1.0000000000000002e-12,
+        999999999999.9999,
+        0.0,
+        (-2, -1, 4, 0, 2, 0, 0),
+    ),
+    "nanotesla": (
+        1.0000000000000002e-06,
+        999999.9999999999,
+        0.0,
+        (0, 1, -2, 0, -1, 0, 0),
+    ),
+    "nanoweber": (
+        1.0000000000000002e-06,
+        999999.9999999999,
+        0.0,
+        (2, 1, -2, 0, -1, 0, 0),
+    ),
+    "nanoliter": (
+        1.0000000000000004e-12,
+        999999999999.9998,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "nanolitre": (
+        1.0000000000000004e-12,
+        999999999999.9998,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "picometer": (1e-12, 1000000000000.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "picometre": (1e-12, 1000000000000.0, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "picogram": (1e-12, 1000000000000.0, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "picosecond": (1e-12, 1000000000000.0, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "picoampere": (1e-12, 1000000000000.0, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "picokelvin": (1e-12, 1000000000000.0, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "picomole": (1e-12, 1000000000000.0, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "piconewton": (1e-09, 1000000000.0, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "picopascal": (1e-09, 1000000000.0, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "picojoule": (1e-09, 1000000000.0, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "picowatt": (1e-09, 1000000000.0, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "picohertz": (1e-12, 1000000000000.0, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "picovolt": (1e-09, 1000000000.0, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "picocoulomb": (1e-12, 1000000000000.0, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "picofarad": (1e-15, 1000000000000000.0, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "picotesla": (1e-09, 1000000000.0, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "picoweber": (1e-09, 1000000000.0, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "picoliter": (
+        1.0000000000000003e-15,
+        999999999999999.9,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "picolitre": (
+        1.0000000000000003e-15,
+        999999999999999.9,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "femtometer": (1e-15, 999999999999999.9, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "femtometre": (1e-15, 999999999999999.9, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "femtogram": (1e-15, 999999999999999.9, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "femtosecond": (1e-15, 999999999999999.9, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "femtoampere": (1e-15, 999999999999999.9, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "femtokelvin": (1e-15, 999999999999999.9, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "femtomole": (1e-15, 999999999999999.9, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "femtonewton": (1e-12, 999999999999.9999, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "femtopascal": (1e-12, 999999999999.9999, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "femtojoule": (1e-12, 999999999999.9999, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "femtowatt": (1e-12, 999999999999.9999, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "femtohertz": (1e-15, 999999999999999.9, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "femtovolt": (1e-12, 999999999999.9999, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "femtocoulomb": (1e-15, 999999999999999.9, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "femtofarad": (1e-18, 9.999999999999999e17, 0.0, (-2, -1, 4, 0, 2, 0, 0)),
+    "femtotesla": (1e-12, 999999999999.9999, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "femtoweber": (1e-12, 999999999999.9999, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "femtoliter": (
+        1.0000000000000003e-18,
+        9.999999999999997e17,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "femtolitre": (
+        1.0000000000000003e-18,
+        9.999999999999997e17,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "attometer": (1e-18, 9.999999999999999e17, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "attometre": (1e-18, 9.999999999999999e17, 0.0, (1, 0, 0, 0, 0, 0, 0)),
+    "attogram": (1e-18, 9.999999999999999e17, 0.0, (0, 1, 0, 0, 0, 0, 0)),
+    "attosecond": (1e-18, 9.999999999999999e17, 0.0, (0, 0, 1, 0, 0, 0, 0)),
+    "attoampere": (1e-18, 9.999999999999999e17, 0.0, (0, 0, 0, 0, 1, 0, 0)),
+    "attokelvin": (1e-18, 9.999999999999999e17, 0.0, (0, 0, 0, 1, 0, 0, 0)),
+    "attomole": (1e-18, 9.999999999999999e17, 0.0, (0, 0, 0, 0, 0, 1, 0)),
+    "attonewton": (1e-15, 999999999999999.9, 0.0, (1, 1, -2, 0, 0, 0, 0)),
+    "attopascal": (1e-15, 999999999999999.9, 0.0, (-1, 1, -2, 0, 0, 0, 0)),
+    "attojoule": (1e-15, 999999999999999.9, 0.0, (2, 1, -2, 0, 0, 0, 0)),
+    "attowatt": (1e-15, 999999999999999.9, 0.0, (2, 1, -3, 0, 0, 0, 0)),
+    "attohertz": (1e-18, 9.999999999999999e17, 0.0, (0, 0, -1, 0, 0, 0, 0)),
+    "attovolt": (1e-15, 999999999999999.9, 0.0, (2, 1, -3, 0, -1, 0, 0)),
+    "attocoulomb": (1e-18, 9.999999999999999e17, 0.0, (0, 0, 1, 0, 1, 0, 0)),
+    "attofarad": (
+        1.0000000000000001e-21,
+        9.999999999999999e20,
+        0.0,
+        (-2, -1, 4, 0, 2, 0, 0),
+    ),
+    "attotesla": (1e-15, 999999999999999.9, 0.0, (0, 1, -2, 0, -1, 0, 0)),
+    "attoweber": (1e-15, 999999999999999.9, 0.0, (2, 1, -2, 0, -1, 0, 0)),
+    "attoliter": (
+        1.0000000000000003e-21,
+        9.999999999999997e20,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+    "attolitre": (
+        1.0000000000000003e-21,
+        9.999999999999997e20,
+        0.0,
+        (3, 0, 0, 0, 0, 0, 0),
+    ),
+}
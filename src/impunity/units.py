@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import functools
+import re
+from fractions import Fraction
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .unit_table import DIMENSIONS, UNITS
+
+Exponent = Union[int, Fraction]
+
+# number of entries kept in the cache (least recently used are evicted)
+PARSE_CACHE_SIZE = 1024
+
+TOKEN = re.compile(
+    r"\s*(?:(?P<number>\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)"
+    r"|(?P<name>[^\W\d]\w*|°[CFR]|Ω)"
+    r"|(?P<op>\*\*|[*/^()+-]))"
+)
+NAME = re.compile(r"[^\W\d]\w*|°[CFR]|Ω|\d+")
+
+_interned: Dict[Tuple[Any, ...], Unit] = {}
+
+
+class Unit:
+    """A unit of measure: a value ``x`` in this unit is
+    ``scale * x + offset`` in the root units of pint.
+
+    Units returned by :func:`parse` and :func:`intern` are interned: equal
+    units are the same object, so they are compared and hashed in constant
+    time.
+
+    Attributes:
+        scale : float
+            Value of the unit in the root units
+        inverse : float
+            Value of the root units in the unit (``1 / scale``, computed as
+            pint does)
+        offset : float
+            Origin of the scale of the unit (for temperatures)
+        dimensions : tuple[int | Fraction, ...]
+            Exponents of the base dimensions (length, mass, time,
+            temperature, current, substance, luminosity)
+        name : str
+            Expression of the unit, as understood by pint
+    """
+
+    __slots__ = ("dimensions", "inverse", "name", "offset", "scale")
+
+    def __init__(
+        self,
+        scale: float = 1,
+        inverse: float = 1,
+        offset: float = 0,
+        dimensions: Tuple[Exponent, ...] = (0,) * len(DIMENSIONS),
+        name: str = "dimensionless",
+    ) -> None:
+        self.scale = scale
+        self.inverse = inverse
+        self.offset = offset
+        self.dimensions = dimensions
+        self.name = name
+
+    def __repr__(self) -> str:
+        return (
+            f"Unit({self.scale!r}, {self.inverse!r}, {self.offset!r}, "
+            f"{self.dimensions!r}, {self.name!r})"
+        )
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __mul__(self, other: Unit) -> Unit:
+        return Unit(
+            self.scale * other.scale,
+            self.inverse * other.inverse,
+            0,
+            tuple(a + b for a, b in zip(self.dimensions, other.dimensions)),
+            f"{group(self.name)}*{group(other.name)}",
+        )
+
+    def __truediv__(self, other: Unit) -> Unit:
+        return Unit(
+            self.scale * other.inverse,
+            self.inverse * other.scale,
+            0,
+            tuple(a - b for a, b in zip(self.dimensions, other.dimensions)),
+            f"{group(self.name)}/{group(other.name)}",
+        )
+
+    def __pow__(self, exponent: Exponent) -> Unit:
+        scale, inverse, power = self.scale, self.inverse, float(exponent)
+        if power < 0:
+            scale, inverse, power = inverse, scale, -power
+        return Unit(
+            scale**power,
+            inverse**power,
+            0,
+            tuple(normalize(a * exponent) for a in self.dimensions),
+            f"{group(self.name)}**{group(str(normalize(exponent)))}",
+        )
+
+    def is_compatible_with(self, other: Unit) -> bool:
+        return self.dimensions == other.dimensions
+
+
+def normalize(exponent: Any) -> Exponent:
+    exponent = Fraction(exponent).limit_denominator(1000)
+    return int(exponent) if exponent.denominator == 1 else exponent
+
+
+def group(name: str) -> str:
+    """Parenthesize an expression of unit, unless it is a single name."""
+    return name if NAME.fullmatch(name) else f"({name})"
+
+
+class Parser:
+    """Recursive descent parser for the expressions of units, e.g.
+    ``"kg * m / s^2"`` or ``"(m)^(0.5)"``.
+
+    Raises ValueError for expressions beyond this grammar, for unknown
+    names, and for offset units (e.g. ``degC``) within products.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.tokens: List[Tuple[str, str]] = []
+        position = 0
+        text = text.rstrip()
+        while position < len(text):
+            match = TOKEN.match(text, position)
+            if match is None or match.end() == position:
+                raise ValueError(text)
+            assert match.lastgroup is not None
+            self.tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            position = match.end()
+        self.position = 0
+
+    def peek(self) -> Tuple[str, str]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return ("end", "")
+
+    def take(self) -> Tuple[str, str]:
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def parse(self) -> Unit:
+        unit, offset = self.product()
+        if self.peek()[0] != "end":
+            raise ValueError(self.peek()[1])
+        return unit if offset is None else offset
+
+    def product(self) -> Tuple[Unit, Optional[Unit]]:
+        """Parse a product or a quotient. Returns the unit, and the unit
+        itself if it is a single offset unit."""
+        unit, offset = self.power()
+        while (token := self.peek()) != ("end", "") and token[1] not in ")":
+            if token[1] in ("*", "/"):
+                self.take()
+            elif token[0] not in ("name", "number") and token[1] != "(":
+                raise ValueError(token[1])
+            other, other_offset = self.power()
+            if offset is not None or other_offset is not None:
+                raise ValueError("offset unit in a product")
+            unit = unit / other if token[1] == "/" else unit * other
+        return unit, offset
+
+    def power(self) -> Tuple[Unit, Optional[Unit]]:
+        unit, offset = self.atom()
+        if self.peek()[1] in ("**", "^"):
+            self.take()
+            exponent = self.exponent()
+            if offset is not None and exponent != 1:
+                raise ValueError("offset unit with an exponent")
+            if exponent != 1:
+                return unit**exponent, None
+        return unit, offset
+
+    def exponent(self) -> Exponent:
+        kind, value = self.take()
+        if value == "(":
+            exponent = self.exponent()
+            if self.take()[1] != ")":
+                raise ValueError("unbalanced parentheses")
+            return exponent
+        if value in ("-", "+"):
+            exponent = self.exponent()
+            return -exponent if value == "-" else exponent
+        if kind != "number":
+            raise ValueError(value)
+        return normalize(float(value))
+
+    def atom(self) -> Tuple[Unit, Optional[Unit]]:
+        kind, value = self.take()
+        if value == "(":
+            unit, offset = self.product()
+            if self.take()[1] != ")":
+                raise ValueError("unbalanced parentheses")
+            return unit, offset
+        if kind == "number" and float(value) == 1:
+            return Unit(), None
+        if kind == "name" and value in UNITS:
+            scale, inverse, origin, dimensions = UNITS[value]
+            if origin != 0:
+                # the offset is only meaningful for the unit alone
+                offset = Unit(scale, inverse, origin, dimensions, value)
+                return Unit(scale, inverse, 0, dimensions, value), offset
+            return Unit(scale, inverse, 0, dimensions, value), None
+        raise ValueError(value)
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse(text: Any) -> Optional[Unit]:
+    """Parse a unit with the table of common units (memoized).
+
+    Returns None if the unit cannot be parsed without pint: unknown names,
+    numeric factors, or syntax beyond products, quotients and powers.
+    """
+    if not isinstance(text, str):
+        return None
+    try:
+        unit = Parser(text).parse()
+    except (ValueError, ZeroDivisionError, OverflowError):
+        return None
+    unit.name = text
+    return intern(unit)
+
+
+def intern(unit: Unit) -> Unit:
+    """Return the canonical object of a unit: the first one built with the
+    same dimensions, scale and offset (up to rounding errors)."""
+    key = (
+        unit.dimensions,
+        float(f"{unit.scale:.12g}"),
+        float(f"{unit.offset:.12g}"),
+    )
+    return _interned.setdefault(key, unit)
+
+
+def clear() -> None:
+    """Discard the parsed and interned units."""
+    parse.cache_clear()
+    _interned.clear()
+
+
+def affine(received: Unit, expected: Unit) -> Tuple[float, float]:
+    """Scale and offset of the conversion of values from the received to
+    the expected unit: ``x`` becomes ``scale * x + offset``."""
+    scale = received.scale * expected.inverse
+    offset = (received.offset - expected.offset) * expected.inverse
+    return scale, offset
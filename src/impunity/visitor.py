@@ -3,26 +3,36 @@ from __future__ import annotations
 import ast
 import inspect
 import logging
+import numbers
+import operator
 import sys
+import threading
 import types
 import typing
-from math import isclose
+import weakref
+from itertools import islice
 from typing import (
     Any,
     Callable,
     ClassVar,
     Dict,
+    List,
     Optional,
+    Set,
+    Tuple,
     Union,
     cast,
     overload,
 )
 
-import pint
-from pint import UnitRegistry
 from typing_extensions import Annotated, Protocol, TypedDict, TypeGuard
 
-from .quantityNode import QuantityNode, Unit
+from . import dataflow
+from .conversion import conversion_plan, is_unit, power, product
+from .optimizer import conversion_constant, mark_kind
+from .quantityNode import UNIT_TYPES, QuantityNode, Unit
+from .registry import LazyRegistry
+from .stats import count, phase
 
 # annotation_node = Union[ast.Subscript, ast.Name, ast.Constant]
 
@@ -46,6 +56,229 @@ class VarDict(Dict[str, Any]):
         return None
 
 
+# names of the types of arrays: the conversion of an array traverses all its
+# elements, the conversion of a scalar is a single operation
+ARRAY_TYPES = {"ndarray", "Series", "DataFrame", "Index"}
+
+# operations between constants allowed in exponents, e.g. x ** (1 / 2)
+EXPONENT_OPERATIONS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+
+
+def annotation_kind(hint: Any) -> Optional[str]:
+    """Return "scalar" or "array" according to the type of an annotation
+    (e.g. ``float`` or ``Annotated[np.ndarray, "m"]``), None if unknown."""
+    if is_annotated(hint):
+        hint = hint.__origin__  # type: ignore
+    origin = typing.get_origin(hint) or hint
+    if isinstance(origin, type):
+        if issubclass(origin, numbers.Number):
+            return "scalar"
+        if origin.__name__ in ARRAY_TYPES:
+            return "array"
+    return None
+
+
+def annotation_unit(hint: Any) -> Optional[str]:
+    """Return the unit of an annotation of a global variable, if any."""
+    if is_annotated(hint):
+        return hint.__metadata__[0]
+    if isinstance(hint, str):
+        return hint
+    return None
+
+
+class ModuleIndex:
+    """Units of the annotated globals of a module, and of the annotated
+    globals of the modules it imports.
+
+    The index is built once per module, and updated incrementally when new
+    annotations or new globals (annotated aliases, imported modules) appear,
+    e.g. while the module is being executed. Annotated aliases and imported
+    modules which are rebound, deleted or which gain new annotations trigger
+    a full rebuild.
+
+    Attributes:
+        module : types.ModuleType
+            Indexed module
+        units : VarDict
+            Units of variables, by name
+    """
+
+    def __init__(self, module: types.ModuleType) -> None:
+        self.module = module
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        self.units = VarDict()
+        # number of annotations of the module already indexed
+        self.annotations: Optional[Dict[str, Any]] = None
+        self.indexed_annotations = 0
+        # global names already indexed
+        self.seen: Set[str] = set()
+        # annotated aliases and modules, and their value when indexed
+        self.tracked: Dict[str, Any] = {}
+        # number of annotations of imported modules when indexed
+        self.imported: Dict[str, int] = {}
+        # names defined by globals, which take precedence over annotations
+        self.overridden: Set[str] = set()
+
+    def outdated(self) -> bool:
+        namespace = self.module.__dict__
+        annotations = namespace.get("__annotations__", None)
+        if self.annotations is not None and (
+            annotations is not self.annotations
+            or len(annotations) < self.indexed_annotations
+        ):
+            return True
+        for name, value in self.tracked.items():
+            if namespace.get(name, None) is not value:
+                return True
+        for name, size in self.imported.items():
+            annotations = getattr(self.tracked[name], "__annotations__", {})
+            if len(annotations) != size:
+                return True
+        return False
+
+    def update(self) -> VarDict:
+        """Index new annotations and globals, and return the units."""
+        if self.outdated():
+            self.rebuild()
+        namespace = self.module.__dict__
+
+        # Adding all annotations from own module
+        annotations = namespace.get("__annotations__", None)
+        if annotations is not None:
+            self.annotations = annotations
+            if len(annotations) > self.indexed_annotations:
+                new = islice(
+                    annotations.items(), self.indexed_annotations, None
+                )
+                for name, anno in new:
+                    unit = annotation_unit(anno)
+                    if unit is not None and name not in self.overridden:
+                        self.units[name] = unit
+                self.indexed_annotations = len(annotations)
+
+        # Adding all annotations from imported modules
+        new_names = namespace.keys() - self.seen
+        if len(self.seen) + len(new_names) != len(namespace):
+            # some globals were deleted
+            self.seen &= namespace.keys()
+        if not new_names:
+            return self.units
+        relevant = [
+            name
+            for name in new_names
+            if is_annotated(namespace[name])
+            or isinstance(namespace[name], types.ModuleType)
+        ]
+        if len(relevant) > 1:
+            # in the order of definition, the last definition wins
+            order = {name: i for i, name in enumerate(namespace)}
+            relevant.sort(key=order.__getitem__)
+        for name in relevant:
+            value = namespace[name]
+            self.tracked[name] = value
+            if is_annotated(value):
+                self.units[name] = value.__metadata__[0]
+                self.overridden.add(name)
+            else:
+                annotations = getattr(value, "__annotations__", {})
+                self.imported[name] = len(annotations)
+                for var_name, anno in annotations.items():
+                    if (unit := annotation_unit(anno)) is not None:
+                        self.units[var_name] = unit
+                        self.overridden.add(var_name)
+        self.seen |= new_names
+        return self.units
+
+
+_indexes: Dict[str, ModuleIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+class Signature(typing.NamedTuple):
+    """Evaluated annotations of a function.
+
+    Attributes:
+        source : dict[str, Any]
+            The ``__annotations__`` dict which was evaluated
+        values : tuple[Any, ...]
+            Values of the annotations when evaluated
+        context : Optional[dict[str, Any]]
+            Globals of the module of the calling function, if some string
+            annotations could only be evaluated in this module (None if
+            the evaluation only depends on the callee)
+        annotations : dict[str, Any]
+            Annotations, with string annotations evaluated
+    """
+
+    source: Dict[str, Any]
+    values: typing.Tuple[Any, ...]
+    context: Optional[Dict[str, Any]]
+    annotations: Dict[str, Any]
+
+
+_signatures: weakref.WeakKeyDictionary[Any, Signature] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def evaluate_annotations(
+    fun: Callable[..., Any], context: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """Evaluate the annotations of a function (memoized).
+
+    String annotations are evaluated in the module of the function, and
+    then in ``context``, the globals of the module of the calling function.
+    The result is shared by all the visitors until the annotations of the
+    function change, and must not be modified. Returns None if the function
+    is not annotated.
+    """
+    source = getattr(fun, "__annotations__", None)
+    if not source:
+        return None
+    key = getattr(fun, "__func__", fun)  # methods are recreated on access
+    try:
+        cached = _signatures.get(key, None)
+    except TypeError:  # not weakly referenceable
+        cached = key = None
+    if (
+        cached is not None
+        and cached.source is source
+        and len(cached.values) == len(source)
+        and all(a is b for a, b in zip(cached.values, source.values()))
+        and (cached.context is None or cached.context is context)
+    ):
+        return cached.annotations
+
+    fun_globals = fun.__globals__
+    independent = True
+    annotations = {}
+    for name, value in source.items():
+        if isinstance(value, str):
+            try:
+                value = eval(value, fun_globals)
+            except NameError:
+                independent = False
+                value = eval(value, context, fun_globals)
+        annotations[name] = value
+
+    if key is not None:
+        _signatures[key] = Signature(
+            source,
+            tuple(source.values()),
+            None if independent else context,
+            annotations,
+        )
+    return annotations
+
+
 class PrefixSuffix(TypedDict):
     prefix: str
     suffix: str
@@ -67,6 +300,41 @@ def split_attribute(node: ast.Attribute) -> PrefixSuffix:
     return dict(prefix=prefix, suffix=suffix)
 
 
+class Scope:
+    """A function or a class being visited.
+
+    Attributes:
+        node : ast.FunctionDef | ast.ClassDef
+            Definition of the function or class
+        fun : Optional[Any]
+            The object defined by node, None for nested functions which do
+            not exist before the enclosing function is called
+        vars : VarDict
+            Units of the variables known in the scope
+        kinds : dict[str, str]
+            Kinds ("scalar" or "array") of the variables known in the scope
+        functions : dict[str, ast.FunctionDef]
+            Functions defined in the scope
+        protected : list[dict[str, Any]]
+            Units of the variables expected by the exception handlers of the
+            enclosing ``try`` statements, innermost last
+    """
+
+    def __init__(
+        self,
+        node: Union[ast.FunctionDef, ast.ClassDef],
+        fun: Optional[Any],
+        vars: VarDict,
+        kinds: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.node = node
+        self.fun = fun
+        self.vars = vars
+        self.kinds: Dict[str, str] = kinds if kinds is not None else {}
+        self.functions: Dict[str, ast.FunctionDef] = {}
+        self.protected: List[dataflow.Units] = []
+
+
 class Visitor(ast.NodeTransformer):
     """Impunity AST visitor class checking for Annotations
     to transform the code if necessary
@@ -76,13 +344,12 @@ class Visitor(ast.NodeTransformer):
             Dictionnary of Callables to keep track of functions
             tracked by impunity
         ureg : pint.UnitRegistry
-            Unit Registry from Pint to manage UoMs.
+            Unit Registry from Pint to manage UoMs, built on first access.
     """
 
     # tuple[module_name, function_name]
     impunity_func: ClassVar[dict[tuple[str, str], Callable[..., Any]]] = {}
-    impunity_funcdef: ClassVar[dict[str, ast.FunctionDef]] = {}
-    ureg = UnitRegistry()
+    ureg = LazyRegistry()
     current_module: str = ""
 
     def __init__(
@@ -90,6 +357,7 @@ class Visitor(ast.NodeTransformer):
         fun: Callable[..., Any],
         ignore_warnings: Union[bool, str],
         ignore_methods: Union[bool, str],
+        module_vars: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
         Constructs all the necessary attributes for the visitor using the
@@ -99,25 +367,34 @@ class Visitor(ast.NodeTransformer):
         ----------
             fun : Callable[..., Any]
                 Callable checked by impunity
+            module_vars : Optional[Dict[str, Any]]
+                Annotations of the module of fun, if already loaded
         """
         self.ignore_methods = ignore_methods
         self.ignore_warnings = ignore_warnings
-        self.nested_flag = False
         self.fun = fun
+        self.scopes: List[Scope] = []
         self.fun_globals = sys.modules[self.fun.__module__].__dict__
         x: Dict[str, str] = {}
         self.vars = VarDict(x)
+        self.kinds: Dict[str, str] = {}
         Visitor.current_module = fun.__module__
-        self.module_loading()
+        if module_vars is None:
+            self.module_loading()
+        else:
+            self.vars.update(module_vars)
 
     def fun_header(self, node: ast.AST) -> str:
         lineno = getattr(node, "lineno", 0)
         # coloffset = getattr(node, "coloffset", 0)
-        firstlineno = getattr(self.fun.__code__, "co_firstlineno", 0)
-        filename = getattr(self.fun.__code__, "co_filename")
-        return (
-            f"{filename}:{firstlineno + lineno - 1} (in {self.fun.__name__}) "
-        )
+        fun = self.fun
+        for scope in reversed(self.scopes):
+            if scope.fun is not None and hasattr(scope.fun, "__code__"):
+                fun = scope.fun
+                break
+        firstlineno = getattr(fun.__code__, "co_firstlineno", 0)
+        filename = getattr(fun.__code__, "co_filename")
+        return f"{filename}:{firstlineno + lineno - 1} (in {fun.__name__}) "
 
     def get_annotation_unit(self, node: ast.expr) -> Optional[str]:
         """
@@ -130,7 +407,7 @@ class Visitor(ast.NodeTransformer):
         :rtype: Optional[str]
         """
 
-        unit = None
+        unit: Any = None
 
         if isinstance(node, ast.Constant):
             unit = node.value
@@ -161,6 +438,67 @@ class Visitor(ast.NodeTransformer):
 
         return unit  # type: ignore
 
+    def get_annotation_kind(self, node: ast.expr) -> Optional[str]:
+        """Return the kind ("scalar" or "array") of an annotation node, None
+        if unknown."""
+        if isinstance(node, ast.Constant):
+            return None
+        try:
+            code = compile(ast.Expression(node), "<annotation>", "eval")
+            hint = eval(code, self.fun_globals)
+        except Exception:
+            return None
+        return annotation_kind(hint)
+
+    def set_kind(self, name: str, kind: Optional[str]) -> None:
+        if kind is None:
+            self.kinds.pop(name, None)
+        else:
+            self.kinds[name] = kind
+
+    def node_kind(self, node: Optional[ast.AST]) -> Optional[str]:
+        """Return the kind ("scalar" or "array") of an expression, None if
+        unknown."""
+        if isinstance(node, ast.Constant):
+            return "scalar" if isinstance(node.value, (int, float)) else None
+        if isinstance(node, ast.Name):
+            return self.kinds.get(node.id, None)
+        if isinstance(node, ast.UnaryOp):
+            return self.node_kind(node.operand)
+        if isinstance(node, ast.BinOp):
+            kinds = {self.node_kind(node.left), self.node_kind(node.right)}
+            if "array" in kinds:
+                return "array"
+            if kinds == {"scalar"}:
+                return "scalar"
+        return None
+
+    def scale_product(
+        self, left: ast.expr, op: ast.operator, right: ast.expr, factor: float
+    ) -> ast.expr:
+        """Build ``left op (right * factor)``, with the multiplication by
+        ``factor`` moved to the operand or result with the fewest elements.
+
+        Scalars are scaled rather than arrays. When both operands are
+        arrays, the result is scaled, which lets the conversion be merged
+        with a conversion of the result.
+        """
+        left_kind = self.node_kind(left)
+        right_kind = self.node_kind(right)
+        scale = factor if isinstance(op, ast.Mult) else 1 / factor
+        if right_kind != "scalar":
+            if left_kind == "scalar":
+                scaled = ast.BinOp(left, ast.Mult(), conversion_constant(scale))
+                return ast.BinOp(scaled, op, right)
+            if left_kind == "array" and right_kind == "array":
+                product = ast.BinOp(left, op, right)
+                return ast.BinOp(
+                    product, ast.Mult(), conversion_constant(scale)
+                )
+        return ast.BinOp(
+            left, op, ast.BinOp(right, ast.Mult(), conversion_constant(factor))
+        )
+
     def visit(self, root: ast.AST) -> ast.AST:
         """
         Initiate the visit of the root AST. Returns a checked ast.AST
@@ -172,21 +510,56 @@ class Visitor(ast.NodeTransformer):
         """
 
         # Adding the "parent" attribute to every nodes of the AST
-        for node in ast.walk(root):
-            for child in ast.iter_child_nodes(node):
-                child.parent = node  # type: ignore
+        with phase("link"):
+            for node in ast.walk(root):
+                for child in ast.iter_child_nodes(node):
+                    child.parent = node  # type: ignore
         method = "visit_" + root.__class__.__name__
         visitor = getattr(self, method, self.generic_visit)
-        new_node = visitor(root)
+        with phase("infer"):
+            new_node = visitor(root)
         return new_node
 
     @classmethod
-    def add_func(cls, fun: Callable[..., Any] | ast.FunctionDef) -> None:
+    def add_func(cls, fun: Callable[..., Any]) -> None:
         """Add function to the impunity function dictionnary"""
-        if isinstance(fun, ast.FunctionDef):
-            cls.impunity_funcdef[fun.name] = fun
+        cls.impunity_func[fun.__module__, fun.__name__] = fun
+
+    def enter_scope(self, node: Union[ast.FunctionDef, ast.ClassDef]) -> Scope:
+        """Push the scope of a function or class definition.
+
+        The variables of the enclosing scope remain visible, but the
+        variables defined in the new scope do not leak outside of it.
+        """
+        if not self.scopes:
+            fun = self.fun  # the decorated object
         else:
-            cls.impunity_func[fun.__module__, fun.__name__] = fun
+            enclosing = self.scopes[-1]
+            fun = None
+            if isinstance(enclosing.node, ast.ClassDef):
+                fun = getattr(enclosing.fun, node.name, None)
+                # staticmethod and classmethod objects
+                fun = getattr(fun, "__func__", fun)
+            elif isinstance(node, ast.FunctionDef):
+                enclosing.functions[node.name] = node
+        scope = Scope(node, fun, VarDict(self.vars), dict(self.kinds))
+        self.scopes.append(scope)
+        self.vars = scope.vars
+        self.kinds = scope.kinds
+        return scope
+
+    def exit_scope(self) -> None:
+        self.scopes.pop()
+        if self.scopes:
+            self.vars = self.scopes[-1].vars
+            self.kinds = self.scopes[-1].kinds
+
+    def current_function(self) -> Optional[Scope]:
+        """Return the scope of the innermost function being visited."""
+        for scope in reversed(self.scopes):
+            if isinstance(scope.node, ast.FunctionDef):
+                return scope
+        return None
 
     @overload
     def get_func(self, name: str, module: None) -> None | ast.FunctionDef: ...
@@ -206,7 +579,10 @@ class Visitor(ast.NodeTransformer):
                 if m is not None:
                     result = self.impunity_func.get((m.__name__, name), None)
             return result
-        result = self.impunity_funcdef.get(name, None)
+        # functions defined in the enclosing functions
+        for scope in reversed(self.scopes):
+            if (result := scope.functions.get(name, None)) is not None:
+                return result
         if result is None:
             # If not nested, check if in globals
             fun = self.fun_globals.get(name, None)
@@ -225,8 +601,8 @@ class Visitor(ast.NodeTransformer):
 
     def node_convert(
         self,
-        expected_unit: Optional[str],
-        received_unit: Optional[str],
+        expected_unit: Unit,
+        received_unit: Unit,
         received_node: ast.expr,
     ) -> ast.expr:
         """check if the expected and the received units are coherents with
@@ -254,54 +630,36 @@ class Visitor(ast.NodeTransformer):
                 expected_unit,
             )
             and received_unit is not None
+            and expected_unit is not None
         ):
-            received_pint_unit = pint.Unit(received_unit)
-            expected_pint_unit = pint.Unit(expected_unit)
-            if received_pint_unit.is_compatible_with(expected_pint_unit):
-                Q_ = self.ureg.Quantity
-                r0 = Q_(0, received_unit)
-                r1 = Q_(1, received_unit)
-                r10 = Q_(10, received_unit)
-
-                e0 = r0.to(expected_unit)
-                e1 = r1.to(expected_unit)
-                e10 = r10.to(expected_unit)
-
-                if r0.m == e0.m:
-                    conv_value = expected_pint_unit.from_(received_pint_unit).m
-
-                    if conv_value == 1:
-                        new_node = received_node
-                    else:
-                        new_node = ast.BinOp(
-                            received_node,
-                            ast.Mult(),
-                            ast.Constant(conv_value),
-                        )
-
-                elif (e1.m - e0.m) == 1:
-                    conv_value = (
-                        expected_pint_unit.from_(received_pint_unit).m
-                    ) - 1
+            plan = conversion_plan(received_unit, expected_unit)
+            new_node: ast.expr
+            if plan is not None:
+                count(conversions=plan.kind in ("scale", "offset", "affine"))
+                mark_kind(received_node, self.node_kind(received_node))
+                if plan.kind == "scale":
+                    new_node = ast.BinOp(
+                        received_node,
+                        ast.Mult(),
+                        conversion_constant(plan.scale),
+                    )
 
-                    # if conv_value == 0:
-                    #     new_node = received_node
-                    # else:
+                elif plan.kind == "offset":
                     new_node = ast.BinOp(
                         received_node,
                         ast.Add(),
-                        ast.Constant(conv_value),
+                        conversion_constant(plan.offset),
                     )
 
-                elif isclose(10 * (e1.m - e0.m) + e0.m, e10.m):
+                elif plan.kind == "affine":
                     new_node = ast.BinOp(
                         ast.BinOp(
                             received_node,
                             ast.Mult(),
-                            ast.Constant((e1.m - e0.m)),
+                            conversion_constant(plan.scale),
                         ),
                         ast.Add(),
-                        ast.Constant(e0.m),
+                        conversion_constant(plan.offset),
                     )
                 else:
                     new_node = received_node  # log
@@ -319,29 +677,22 @@ class Visitor(ast.NodeTransformer):
         return new_node
 
     def module_loading(self) -> None:
-        # Adding all annotations from own module
-        annotations = getattr(
-            sys.modules[self.fun.__module__], "__annotations__", None
-        )
-        if annotations is not None:
-            for name, anno in annotations.items():
-                if is_annotated(anno):
-                    self.vars[name] = anno.__metadata__[0]
-                if isinstance(anno, str):
-                    self.vars[name] = anno
+        self.vars.update(self.module_annotations(self.fun.__module__))
 
-        # Adding all annotations from imported modules
-        for var_name, val in self.fun_globals.items():
-            if is_annotated(val):
-                self.vars[var_name] = val.__metadata__[0]
-            if isinstance(val, types.ModuleType):
-                annotations = getattr(val, "__annotations__", {})
-                for name, anno in annotations.items():
-                    if is_annotated(anno):
-                        x = anno.__metadata__[0]
-                        self.vars[name] = x
-                    if isinstance(anno, str):
-                        self.vars[name] = anno
+    @staticmethod
+    def module_annotations(module_name: str) -> VarDict:
+        """Collect the units of annotated globals of a module, and of
+        annotated globals of modules imported in this module.
+
+        The result comes from an index of the module (see
+        :class:`ModuleIndex`) and must not be modified.
+        """
+        module = sys.modules[module_name]
+        with _indexes_lock:
+            index = _indexes.get(module_name, None)
+            if index is None or index.module is not module:
+                index = _indexes[module_name] = ModuleIndex(module)
+            return index.update()
 
     def get_annotations(
         self, name: str, module: None | str = None
@@ -358,31 +709,41 @@ class Visitor(ast.NodeTransformer):
         """
 
         if (fun := self.get_func(name, module)) is not None:
-            if annotations := getattr(fun, "__annotations__", None):
-                globals = list(self.impunity_func.values())[-1].__globals__
-                locals = fun.__globals__  # type: ignore
-                annotations = {
-                    k: v if not isinstance(v, str) else eval(v, globals, locals)
-                    for k, v in annotations.items()
-                }
-                return cast(Dict[str, Any], annotations)
-            # from nested function
-            elif isinstance(fun, ast.FunctionDef):
-                pass
-                # TODO
+            if isinstance(fun, ast.FunctionDef):
+                # from nested function
+                return self.node_annotations(fun)
+            else:
+                return self.function_annotations(fun)
 
         elif callable(name):
-            if annotations := getattr(name, "__annotations__", None):
-                globals = list(self.impunity_func.values())[-1].__globals__
-                locals = name.__globals__  # type: ignore
-                annotations = {
-                    k: v if not isinstance(v, str) else eval(v, globals, locals)
-                    for k, v in annotations.items()
-                }
-                return cast(Dict[str, Any], annotations)
+            return self.function_annotations(name)
 
         return None
 
+    def function_annotations(
+        self, fun: Callable[..., Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Get the annotations of a function, evaluating string annotations.
+        Returns None if the function is not annotated."""
+        return evaluate_annotations(fun, self.fun_globals)
+
+    def node_annotations(self, node: ast.FunctionDef) -> Dict[str, Any]:
+        """Get the units of the arguments (None if they have no unit) and
+        the return unit of a nested function from its definition."""
+        annotations: Dict[str, Any] = {}
+        for arg in node.args.posonlyargs + node.args.args:
+            unit = None
+            if arg.annotation is not None:
+                unit = self.get_annotation_unit(arg.annotation)
+            if unit is not None and not is_unit(unit):
+                unit = None
+            annotations[arg.arg] = unit
+        if node.returns is not None:
+            unit = self.get_annotation_unit(node.returns)
+            if unit is not None and is_unit(unit):
+                annotations["return"] = unit
+        return annotations
+
     def visit_ClassDef(self, node: ast.ClassDef) -> ast.ClassDef:
         """Method called by the visitor if the visited node is
         a class defintion. Is can be the root node in impunity
@@ -391,15 +752,15 @@ class Visitor(ast.NodeTransformer):
             node (ast.ClassDef): Visited Class Definition
 
         """
-        if not self.ignore_methods:
+        scope = self.enter_scope(node)
+        if not self.ignore_methods and (cls := scope.fun) is not None:
             method_list = [
-                getattr(self.fun, func)
-                for func in dir(self.fun)
-                if callable(getattr(self.fun, func))
-                and not func.startswith("__")
+                getattr(cls, func)
+                for func in dir(cls)
+                if callable(getattr(cls, func)) and not func.startswith("__")
             ]
             if (
-                init := self.fun.__init__
+                init := cls.__init__
             ).__class__.__name__ != "wrapper_descriptor":
                 # meaning: does the class have a __init__
                 # (otherwise, it's an empty slot)
@@ -409,6 +770,7 @@ class Visitor(ast.NodeTransformer):
 
         self.class_attr: Dict[str, Unit] = {}
         node = cast(ast.ClassDef, self.generic_visit(node))
+        self.exit_scope()
         return node
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.FunctionDef:
@@ -438,25 +800,22 @@ class Visitor(ast.NodeTransformer):
                                     )
                                     return node
 
-        var_buffer = self.vars
+        scope = self.enter_scope(node)
+        if not hasattr(scope.fun, "__code__"):
+            scope.fun = None
+        if len(self.scopes) == 1:
+            self.add_func(self.fun)
 
         # is a function from a class
         if hasattr(self, "class_attr"):
             self.vars.update(self.class_attr)
-            if not self.nested_flag:
-                fun = getattr(self.fun, node.name)
-                self.fun = fun
-            else:
-                self.add_func(node)
-
-        else:
-            self.add_func(self.fun)
 
         # from function signature
         for arg in node.args.args:
             if arg.annotation is not None:
                 anno_unit = self.get_annotation_unit(arg.annotation)
-                if anno_unit is not None and anno_unit in self.ureg:
+                self.set_kind(arg.arg, self.get_annotation_kind(arg.annotation))
+                if anno_unit is not None and is_unit(anno_unit):
                     self.vars[arg.arg] = anno_unit
                 else:
                     self.vars[arg.arg] = None
@@ -469,9 +828,8 @@ class Visitor(ast.NodeTransformer):
                     # )
 
         # Check units in the return node
-        self.nested_flag = True
         node = cast(ast.FunctionDef, self.generic_visit(node))
-        self.vars = var_buffer
+        self.exit_scope()
         return node
 
     def get_node_unit(self, node: Optional[ast.expr]) -> QuantityNode:
@@ -549,15 +907,16 @@ class Visitor(ast.NodeTransformer):
                     left.unit if left.unit is not None else right.unit,
                 )
 
-            if pint.Unit(left.unit).is_compatible_with(pint.Unit(right.unit)):
-                conv_value = pint.Unit(left.unit).from_(pint.Unit(right.unit)).m
+            if (plan := conversion_plan(right.unit, left.unit)) is not None:
+                conv_value = plan.factor
+                count(conversions=1)
                 new_node = ast.BinOp(
                     left.node,  # type:ignore
                     node.op,
                     ast.BinOp(
                         right.node,  # type:ignore
                         ast.Mult(),
-                        ast.Constant(conv_value),
+                        conversion_constant(conv_value),
                     ),
                 )
                 return QuantityNode(
@@ -592,19 +951,16 @@ class Visitor(ast.NodeTransformer):
             if is_annotated(right.unit):
                 right.unit = right.unit.__metadata__[0]
 
-            if pint.Unit(left.unit).is_compatible_with(pint.Unit(right.unit)):
-                conv_value = pint.Unit(left.unit).from_(pint.Unit(right.unit)).m
-                new_node = ast.BinOp(
+            if (plan := conversion_plan(right.unit, left.unit)) is not None:
+                count(conversions=1)
+                new_node = self.scale_product(  # type: ignore
                     left.node,  # type: ignore
                     node.op,
-                    ast.BinOp(
-                        right.node,  # type: ignore
-                        ast.Mult(),
-                        ast.Constant(conv_value),
-                    ),
+                    right.node,  # type: ignore
+                    plan.factor,
                 )
                 unit = (
-                    f"{left.unit}*{left.unit}"
+                    product(left.unit, left.unit)
                     if isinstance(node.op, ast.Mult)
                     else "dimensionless"
                 )
@@ -612,10 +968,8 @@ class Visitor(ast.NodeTransformer):
 
             else:
                 new_node = ast.BinOp(left.node, node.op, right.node)  # type: ignore
-                unit = (
-                    f"{left.unit}*{right.unit}"
-                    if isinstance(node.op, ast.Mult)
-                    else f"{left.unit}/{right.unit}"
+                unit = product(
+                    left.unit, right.unit, isinstance(node.op, ast.Div)
                 )
                 return QuantityNode(ast.copy_location(new_node, node), unit)
 
@@ -650,46 +1004,35 @@ class Visitor(ast.NodeTransformer):
                 return QuantityNode(node, None)
 
             elif isinstance(right.node, ast.Constant):
-                unit = f"({left.unit})^({right.node.value!r})"
+                unit = power(left.unit, right.node.value)
                 new_node = ast.BinOp(left.node, node.op, right.node)  # type: ignore
                 return QuantityNode(new_node, unit)
 
             elif isinstance(right.node, ast.BinOp):
                 pow_right = right.node.right
                 pow_left = right.node.left
-                if isinstance(pow_left, ast.Constant) and isinstance(
-                    pow_right, ast.Constant
+                operation = EXPONENT_OPERATIONS.get(type(right.node.op))
+                exponent: Any = None
+                if (
+                    operation is not None
+                    and isinstance(pow_left, ast.Constant)
+                    and isinstance(pow_right, ast.Constant)
                 ):
-                    if isinstance(right.node.op, ast.Mult):
-                        unit = (
-                            f"({left.unit})^({pow_left.value!r}"
-                            + f"*{pow_right.value!r})"
-                        )
-                    elif isinstance(right.node.op, ast.Div):
-                        unit = (
-                            f"({left.unit})^({pow_left.value!r}"
-                            + f"/{pow_right.value!r})"
-                        )
-                    elif isinstance(right.node.op, ast.Add):
-                        unit = (
-                            f"({left.unit})^({pow_left.value!r}"
-                            + f"+{pow_right.value!r})"
+                    try:
+                        exponent = operation(pow_left.value, pow_right.value)
+                    except (TypeError, ZeroDivisionError):
+                        pass
+                if exponent is None:
+                    if not self.ignore_warnings:
+                        _log.warning(
+                            self.fun_header(node)
+                            + "The exponent cannot be "
+                            + "statically evaluated or "
+                            + "is not dimensionless."
                         )
-                    elif isinstance(right.node.op, ast.Sub):
-                        unit = (
-                            f"({left.unit})^({pow_left.value!r}"
-                            + f"-{pow_right.value!r})"
-                        )
-                    else:
-                        if not self.ignore_warnings:
-                            _log.warning(
-                                self.fun_header(node)
-                                + "The exponent cannot be "
-                                + "statically evaluated or "
-                                + "is not dimensionless."
-                            )
-                        new_node = ast.BinOp(left.node, node.op, right.node)  # type: ignore
-                        return QuantityNode(new_node, None)
+                    new_node = ast.BinOp(left.node, node.op, right.node)  # type: ignore
+                    return QuantityNode(new_node, None)
+                unit = power(left.unit, exponent)
                 new_node = ast.BinOp(left.node, node.op, right.node)  # type: ignore
                 return QuantityNode(new_node, unit)
 
@@ -793,7 +1136,7 @@ class Visitor(ast.NodeTransformer):
                     )
 
                     if (received := self.get_node_unit(arg)).unit is None:
-                        if expected is not inspect._empty:
+                        if expected not in (inspect._empty, None):
                             if not self.ignore_warnings:
                                 _log.warning(msg)
                         new_args.append(arg)
@@ -892,7 +1235,7 @@ class Visitor(ast.NodeTransformer):
                             expected = x
                         if not (
                             isinstance(expected, str)
-                            and isinstance(received.unit, str)
+                            and isinstance(received.unit, UNIT_TYPES)
                         ):
                             # TODO To avoid annoying typing for now
                             return node
@@ -933,6 +1276,10 @@ class Visitor(ast.NodeTransformer):
 
         """
 
+        if isinstance(node.target, ast.Name):
+            kind = self.get_annotation_kind(node.annotation)
+            self.set_kind(node.target.id, kind or self.node_kind(node.value))
+
         value = self.get_node_unit(node.value)
 
         if value.node is None:
@@ -978,17 +1325,245 @@ class Visitor(ast.NodeTransformer):
 
         return ast.copy_location(new_node, node)
 
+    def visit_block(self, stmts: List[ast.stmt]) -> List[ast.stmt]:
+        """Visit a list of statements, as the generic visit does.
+
+        In the body of a ``try`` statement, the variables are converted back
+        to the units expected by the exception handlers after each
+        statement (see :meth:`protect`).
+        """
+        result: List[ast.stmt] = []
+        for stmt in stmts:
+            new = self.visit(stmt)
+            if isinstance(new, list):
+                result.extend(new)
+            elif new is not None:
+                result.append(cast(ast.stmt, new))
+            if self.scopes and self.scopes[-1].protected:
+                self.protect(result, self.scopes[-1].protected[-1], stmt)
+        return result
+
+    def protect(
+        self, stmts: List[ast.stmt], expected: dataflow.Units, location: ast.AST
+    ) -> None:
+        """Convert the variables whose unit changed in the body of a ``try``
+        statement back to the units ``expected`` by its exception handlers,
+        which may run after any statement of the body.
+
+        Variables assigned for the first time keep their first unit. The
+        unit of a variable which cannot be converted back is unknown in the
+        handlers.
+        """
+        conversions = {}
+        for name, unit in self.vars.items():
+            if name not in expected:
+                expected[name] = unit
+            elif unit != expected[name] and expected[name] is not None:
+                if self.compatible(unit, expected[name]):
+                    conversions[name] = (unit, expected[name])
+                else:
+                    expected[name] = None
+        if conversions and not dataflow.terminates(stmts):
+            self.path_conversions(stmts, conversions, location)
+            self.vars.update(
+                (name, unit) for name, (_, unit) in conversions.items()
+            )
+
+    def set_units(self, units: dataflow.Units) -> None:
+        # in place: the scopes refer to the same dictionary
+        self.vars.clear()
+        self.vars.update(units)
+
+    def compatible(self, unit: Any, other: Any) -> bool:
+        return (
+            isinstance(unit, UNIT_TYPES)
+            and isinstance(other, UNIT_TYPES)
+            and conversion_plan(unit, other) is not None
+        )
+
+    def path_conversions(
+        self,
+        stmts: List[ast.stmt],
+        conversions: Dict[str, Tuple[Any, Any]],
+        location: ast.AST,
+    ) -> None:
+        """Append the conversions of variables at the end of a path."""
+        for name, (received, expected) in conversions.items():
+            value = self.node_convert(
+                expected, received, ast.Name(id=name, ctx=ast.Load())
+            )
+            assign = ast.Assign(
+                targets=[ast.Name(id=name, ctx=ast.Store())], value=value
+            )
+            stmts.append(
+                ast.copy_location(assign, stmts[-1] if stmts else location)
+            )
+
+    def join(
+        self,
+        paths: List[Tuple[List[ast.stmt], dataflow.Units]],
+        before: dataflow.Units,
+        location: ast.AST,
+    ) -> None:
+        """Merge the units of the paths which do not terminate, after
+        converting the variables with different units on these paths."""
+        paths = [
+            (stmts, units)
+            for stmts, units in paths
+            if not dataflow.terminates(stmts)
+        ]
+        if not paths:
+            return
+        merged, conversions, incompatible = dataflow.merge(
+            [units for _, units in paths], self.compatible, before
+        )
+        for (stmts, _), path in zip(paths, conversions):
+            self.path_conversions(stmts, path, location)
+        if incompatible and not self.ignore_warnings:
+            _log.warning(
+                self.fun_header(location)
+                + "Incompatible units on different paths for "
+                + ", ".join(incompatible)
+            )
+        self.set_units(merged)
+
+    def visit_If(self, node: ast.If) -> ast.If:
+        """Method called by the visitor if the visited node is an if node.
+
+        Each branch is visited with the units known before the statement.
+        Variables with different units at the end of the branches are
+        converted at the end of the branches (possibly in a new ``else``
+        branch) to a single unit.
+
+        Args:
+            node (ast.If): input node
+
+        """
+        node.test = cast(ast.expr, self.visit(node.test))
+        before = dict(self.vars)
+        node.body = self.visit_block(node.body)
+        body = dict(self.vars)
+        self.set_units(dataflow.restart(before, body))
+        node.orelse = self.visit_block(node.orelse)
+        paths = [(node.body, body), (node.orelse, dict(self.vars))]
+        self.join(paths, before, node)
+        return node
+
+    def visit_With(
+        self, node: Union[ast.With, ast.AsyncWith]
+    ) -> Union[ast.With, ast.AsyncWith]:
+        """Method called by the visitor if the visited node is a with node.
+
+        The body is visited as a block, like the bodies of other compound
+        statements.
+
+        Args:
+            node (ast.With): input node
+
+        """
+        for item in node.items:
+            item.context_expr = cast(ast.expr, self.visit(item.context_expr))
+            if item.optional_vars is not None:
+                item.optional_vars = cast(
+                    ast.expr, self.visit(item.optional_vars)
+                )
+        node.body = self.visit_block(node.body)
+        return node
+
+    visit_AsyncWith = visit_With
+
+    def visit_loop(self, node: Union[ast.For, ast.While]) -> None:
+        """Visit the body of a loop, and convert the variables back to their
+        units at the start of the loop at the end of the body."""
+        before = dict(self.vars)
+        node.body = self.visit_block(node.body)
+        if next(dataflow.loop_jumps(node.body), None) is not None:
+            # break and continue: units of the body, as if visited once
+            node.orelse = self.visit_block(node.orelse)
+            return
+        conversions = {
+            name: (unit, expected)
+            for name, (unit, expected) in dataflow.loop_back(
+                before, self.vars
+            ).items()
+            if self.compatible(unit, expected)
+        }
+        if not dataflow.terminates(node.body):
+            self.path_conversions(node.body, conversions, node)
+        units = dataflow.restart(before, self.vars)
+        for name in dataflow.loop_back(before, self.vars):
+            if name not in conversions:
+                units[name] = None
+        self.set_units(units)
+        node.orelse = self.visit_block(node.orelse)
+
     def visit_For(self, node: ast.For) -> ast.For:
         """Method called by the visitor if the visited node is a for loop node.
         Checks the units in the node and returns it eventually modified.
 
+        The elements of a variable with a unit (e.g. an array) have the same
+        unit. Variables keep their units from one iteration to the next.
+
         Args:
             node (ast.For): input node
 
         """
+        node.iter = cast(ast.expr, self.visit(node.iter))
+        node.target = cast(ast.expr, self.visit(node.target))
         if isinstance(node.target, ast.Name):
-            self.vars[node.target.id] = None
-        self.generic_visit(node)
+            unit = None
+            if isinstance(node.iter, ast.Name):
+                unit = self.vars[node.iter.id]
+            self.vars[node.target.id] = unit
+            self.set_kind(node.target.id, None)
+        self.visit_loop(node)
+        return node
+
+    def visit_While(self, node: ast.While) -> ast.While:
+        """Method called by the visitor if the visited node is a while loop
+        node. Variables keep their units from one iteration to the next.
+
+        Args:
+            node (ast.While): input node
+
+        """
+        node.test = cast(ast.expr, self.visit(node.test))
+        self.visit_loop(node)
+        return node
+
+    def visit_Try(self, node: ast.Try) -> ast.Try:
+        """Method called by the visitor if the visited node is a try node.
+
+        An exception may be raised after any statement of the body: the
+        variables of the body are kept in their units from before the
+        statement (see :meth:`protect`), with which the exception handlers
+        are visited. Variables with different units at the end of the body
+        (or of the ``else`` branch) and of the handlers are converted to a
+        single unit before the ``finally`` branch.
+
+        Args:
+            node (ast.Try): input node
+
+        """
+        before = dict(self.vars)
+        handlers = dict(before)
+        if self.scopes:
+            self.scopes[-1].protected.append(handlers)
+        try:
+            node.body = self.visit_block(node.body)
+        finally:
+            if self.scopes:
+                self.scopes[-1].protected.pop()
+        node.orelse = self.visit_block(node.orelse)
+        paths = [(node.orelse or node.body, dict(self.vars))]
+        for handler in node.handlers:
+            self.set_units(handlers)
+            if handler.type is not None:
+                handler.type = cast(ast.expr, self.visit(handler.type))
+            handler.body = self.visit_block(handler.body)
+            paths.append((handler.body, dict(self.vars)))
+        self.join(paths, before, node)
+        node.finalbody = self.visit_block(node.finalbody)
         return node
 
     def visit_ListComp(self, node: ast.ListComp) -> ast.ListComp:
@@ -1030,6 +1605,10 @@ class Visitor(ast.NodeTransformer):
             node (ast.Assign): input node
 
         """
+        for target in node.targets:
+            if isinstance(target, ast.Name):
+                self.set_kind(target.id, self.node_kind(node.value))
+
         value = self.get_node_unit(node.value)
 
         if value.unit is None:
@@ -1049,7 +1628,7 @@ class Visitor(ast.NodeTransformer):
 
         for target in node.targets:
             if isinstance(target, ast.Tuple):
-                received = (
+                received: Any = (
                     [
                         arg.__metadata__[0] if is_annotated(arg) else arg
                         for arg in value.unit.__args__
@@ -1060,7 +1639,7 @@ class Visitor(ast.NodeTransformer):
                 for i, elem in enumerate(target.elts):
                     if isinstance(elem, ast.Name):
                         if isinstance(received[i], typing.ForwardRef):
-                            self.vars[elem.id] = received[i].__forward_arg__  # type: ignore
+                            self.vars[elem.id] = received[i].__forward_arg__
                         else:
                             self.vars[elem.id] = received[i]
 
@@ -1094,12 +1673,13 @@ class Visitor(ast.NodeTransformer):
 
         """
 
-        for frameinfo in inspect.stack():
-            if frameinfo.function == "visit_FunctionDef":
-                fun = frameinfo.frame.f_locals["node"].name
-                break
-
-        return_annotation = self.get_annotations(fun, self.current_module)
+        scope = self.current_function()
+        assert scope is not None
+        if scope.fun is not None:
+            return_annotation = self.function_annotations(scope.fun)
+        else:
+            node_def = cast(ast.FunctionDef, scope.node)
+            return_annotation = self.node_annotations(node_def)
         received = self.get_node_unit(node.value)
 
         if received.node != node.value:
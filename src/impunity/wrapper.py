@@ -1,19 +1,12 @@
 from __future__ import annotations
 
-import ast
-import inspect
-import os
-import sys
-import textwrap
-import types
-from pathlib import Path
-
 # from typing_extensions import ParamSpec
 from typing import Any, Callable, Optional, TypeVar, Union, overload
 
-import astor
-
-from .visitor import Visitor
+from .lazy import defer
+from .module import defer_to_module, is_batch_module, is_precompiled
+from .rewriter import register, rewrite_object
+from .runtime import provide
 
 # P = ParamSpec("P")
 # T = TypeVar("T")
@@ -36,6 +29,10 @@ def impunity(
     rewrite: Union[bool, str] = True,
     ignore_warnings: Union[bool, str] = False,
     ignore_methods: Union[bool, str] = False,
+    cache: Optional[bool] = None,
+    lazy: bool = False,
+    inplace: bool = False,
+    inline: Union[bool, int] = False,
 ) -> Callable[[F], F]: ...
 
 
@@ -46,6 +43,10 @@ def impunity(
     rewrite: Union[bool, str] = True,
     ignore_warnings: Union[bool, str] = False,
     ignore_methods: Union[bool, str] = False,
+    cache: Optional[bool] = None,
+    lazy: bool = False,
+    inplace: bool = False,
+    inline: Union[bool, int] = False,
 ) -> Union[F, Callable[[F], F]]:
     """Decorator function to check units based on annotations
 
@@ -111,151 +112,126 @@ def impunity(
 
     These rewritten functions can be further utilized in your codebase,
     allowing you to work with coherent units seamlessly.
+
+    - **cache** : Optional[bool]
+
+    The `cache` parameter stores the rewritten code in a `__pycache__`
+    folder next to the source file, so that the next imports skip the
+    analysis and only install the cached bytecode. Entries are keyed by the
+    content of the source file, the versions of impunity and Python, and
+    the unit registry: stale entries are ignored and overwritten.
+    Warnings emitted during the analysis are replayed on a cache hit.
+
+    When left to None, the cache is enabled by the `IMPUNITY_CACHE`
+    environment variable, or by `IMPUNITY_CACHE_DIR` which also sets the
+    folder where cache files are written. Hit and miss counts are
+    available with :func:`impunity.cache_info`.
+
+    .. code-block:: python
+
+        from impunity import impunity
+
+        @impunity(cache=True)
+        def calculate_velocity(distance: "m", time: "s") -> "km/h":
+            return distance / time
+
+    - **lazy** : bool
+
+    With the `lazy` parameter, the analysis and the rewriting of a function
+    are deferred until its first call, so that functions which are never
+    called in a process do not cost anything at import time. The decorator
+    returns a light trampoline which is replaced by the rewritten code after
+    the first call.
+    Classes and closures are always analysed at definition time.
+    Statistics are available with :func:`impunity.lazy_info`.
+
+    .. code-block:: python
+
+        from impunity import impunity
+
+        @impunity(lazy=True)
+        def calculate_velocity(distance: "m", time: "s") -> "km/h":
+            return distance / time
+
+    - **inplace** : bool
+
+    With the `inplace` parameter, conversions of NumPy arrays owned by the
+    function (results of arithmetic operations, local variables which are
+    not used after their conversion) are done in place, with
+    `np.multiply(..., out=...)` and `np.add(..., out=...)`, instead of
+    allocating new arrays. Arguments are owned by the caller: their
+    conversions still produce new arrays. Arrays of integers, read-only
+    arrays and other values are converted as usual.
+
+    .. code-block:: python
+
+        from impunity import impunity
+
+        @impunity(inplace=True)
+        def altitude_gain(
+            start: Annotated[np.ndarray, "ft"], end: Annotated[np.ndarray, "ft"]
+        ) -> Annotated[np.ndarray, "m"]:
+            return end - start  # (end - start) converted in place
+
+    - **inline** : Union[bool, int]
+
+    With the `inline` parameter, calls to small functions decorated with
+    `@impunity` are replaced by the expression they return, so that their
+    conversions are merged with the conversions of the caller. Inlined
+    functions must be decorated (and analysed) before the caller, and only
+    consist of assignments to local variables followed by a return
+    statement. An integer sets the maximal size (number of AST nodes) of
+    the inlined expressions. Inlined calls are listed by
+    :func:`impunity.inline_info`; functions using this option are not
+    cached on disk.
+
+    .. code-block:: python
+
+        from impunity import impunity
+
+        @impunity
+        def temperature(h: Annotated[float, "m"]) -> Annotated[float, "K"]:
+            return 288.15 - 0.0065 * h
+
+        @impunity(inline=True)
+        def temperature_ft(h: Annotated[float, "ft"]) -> Annotated[float, "K"]:
+            return temperature(h)  # 288.15 - 0.0065 * (h * 0.3048)
     """
 
+    options = dict(
+        rewrite=rewrite,
+        ignore_warnings=ignore_warnings,
+        ignore_methods=ignore_methods,
+        cache=cache,
+        inplace=inplace,
+        inline=inline,
+    )
+
+    def rewrite_f(fun: F) -> F:
+        return rewrite_object(fun, **options)  # type: ignore
+
     def deco_f(fun: F) -> F:
         if ignore:
             return fun
 
-        # dedent for nested methods
-        fun_tree = ast.parse(textwrap.dedent(inspect.getsource(fun)))
-
-        visitor = Visitor(fun, ignore_warnings, ignore_methods)
-        if "forward" in fun.__name__:
-            pass
-        fun_tree = visitor.visit(fun_tree)  # type: ignore
+        # functions called by the rewritten code (also needed for modules
+        # rewritten by the import hook)
+        provide(fun)
 
-        # get the string of the transformed function
-        f_str = astor.to_source(fun_tree)
-        if not rewrite:
+        if is_precompiled(fun):
+            register(fun)
             return fun
 
-        if isinstance(rewrite, str):
-            path = Path(rewrite)
-            if not path.is_absolute():
-                origin_path = Path(
-                    os.path.abspath(inspect.getfile(fun))
-                ).parents[0]
-                path = origin_path.joinpath(path)
-            with open(path, "w") as f:
-                idx = f_str.find("\n") + 1
-                f.write(f_str[idx:])
-                f.write("\n")
-
-        idx = f_str.find("\n") + 1
-        d: dict[str, Any] = {}
-        if f_str[0:9] == "@impunity":
-            exec(f_str[idx:], visitor.fun_globals, d)
-        else:
-            # if impunity is called without the decorator synthax
-            exec(f_str, visitor.fun_globals, d)
-
-        new_fun = d[fun.__name__]
-
-        if isinstance(new_fun, type):
-            method_list = [
-                getattr(new_fun, func)
-                for func in dir(new_fun)
-                if callable(getattr(new_fun, func))
-                and not func.startswith("__")
-            ]
-            for new_method in method_list:
-                origin_method = getattr(fun, new_method.__name__)
-                co_consts = new_method.__code__.co_consts
-                co_lnotab = new_method.__code__.co_lnotab
-                for const in origin_method.__code__.co_consts:
-                    if const not in co_consts:
-                        co_consts = (*co_consts, const)
-
-                if sys.version_info >= (3, 11):
-                    origin_method.__code__ = types.CodeType(
-                        origin_method.__code__.co_argcount,
-                        origin_method.__code__.co_posonlyargcount,
-                        origin_method.__code__.co_kwonlyargcount,
-                        origin_method.__code__.co_nlocals,
-                        origin_method.__code__.co_stacksize,
-                        origin_method.__code__.co_flags,
-                        new_method.__code__.co_code,
-                        co_consts,
-                        origin_method.__code__.co_names,
-                        origin_method.__code__.co_varnames,
-                        origin_method.__code__.co_filename,
-                        origin_method.__code__.co_name,
-                        origin_method.__code__.co_qualname,
-                        origin_method.__code__.co_firstlineno,
-                        new_method.__code__.co_linetable,
-                        origin_method.__code__.co_exceptiontable,
-                        origin_method.__code__.co_freevars,
-                        origin_method.__code__.co_cellvars,
-                    )
-                else:
-                    origin_method.__code__ = types.CodeType(
-                        origin_method.__code__.co_argcount,
-                        origin_method.__code__.co_posonlyargcount,
-                        origin_method.__code__.co_kwonlyargcount,
-                        origin_method.__code__.co_nlocals,
-                        origin_method.__code__.co_stacksize,
-                        origin_method.__code__.co_flags,
-                        new_method.__code__.co_code,
-                        co_consts,
-                        origin_method.__code__.co_names,
-                        origin_method.__code__.co_varnames,
-                        origin_method.__code__.co_filename,
-                        origin_method.__code__.co_name,
-                        origin_method.__code__.co_firstlineno,
-                        co_lnotab,
-                        origin_method.__code__.co_freevars,
-                        origin_method.__code__.co_cellvars,
-                    )
-
-        else:
-            co_consts = new_fun.__code__.co_consts
-            co_lnotab = new_fun.__code__.co_lnotab
-            for const in fun.__code__.co_consts:
-                if const not in co_consts:
-                    co_consts = (*co_consts, const)
-
-            if sys.version_info >= (3, 11):
-                fun.__code__ = types.CodeType(
-                    fun.__code__.co_argcount,
-                    fun.__code__.co_posonlyargcount,
-                    fun.__code__.co_kwonlyargcount,
-                    fun.__code__.co_nlocals,
-                    fun.__code__.co_stacksize,
-                    fun.__code__.co_flags,
-                    new_fun.__code__.co_code,
-                    co_consts,
-                    new_fun.__code__.co_names,
-                    fun.__code__.co_varnames,
-                    fun.__code__.co_filename,
-                    fun.__code__.co_name,
-                    fun.__code__.co_qualname,
-                    fun.__code__.co_firstlineno,
-                    new_fun.__code__.co_linetable,
-                    fun.__code__.co_exceptiontable,
-                    fun.__code__.co_freevars,
-                    fun.__code__.co_cellvars,
-                )
-            else:
-                fun.__code__ = types.CodeType(
-                    fun.__code__.co_argcount,
-                    fun.__code__.co_posonlyargcount,
-                    fun.__code__.co_kwonlyargcount,
-                    fun.__code__.co_nlocals,
-                    fun.__code__.co_stacksize,
-                    fun.__code__.co_flags,
-                    new_fun.__code__.co_code,
-                    co_consts,
-                    new_fun.__code__.co_names,
-                    fun.__code__.co_varnames,
-                    fun.__code__.co_filename,
-                    fun.__code__.co_name,
-                    fun.__code__.co_firstlineno,
-                    new_fun.__code__.co_lnotab,
-                    fun.__code__.co_freevars,
-                    fun.__code__.co_cellvars,
-                )
-        return fun
+        if is_batch_module(fun):
+            register(fun)
+            return defer_to_module(fun, options)
+
+        # closures can only be rewritten at definition time
+        if lazy and getattr(fun, "__closure__", True) is None:
+            register(fun)
+            return defer(fun, rewrite_f)
+
+        return rewrite_f(fun)
 
     if __func is not None:
         return deco_f(__func)
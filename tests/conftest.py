@@ -0,0 +1,84 @@
+import importlib
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from typing import Any
+
+ALIASES = """
+m = Annotated[Any, "m"]
+ft = Annotated[Any, "ft"]
+"""
+
+SOURCE = """
+from typing import Any
+
+from typing_extensions import Annotated
+
+from impunity import impunity
+{header}
+
+{decorator}
+def to_ft(h: "m") -> "ft":
+    return h
+
+
+{decorator}
+def caller(h: "m") -> "m":
+    alt: "ft" = to_ft(h)
+    return alt
+
+
+{decorator}
+class Aircraft:
+    def altitude(self, h: "ft") -> "m":
+        return h
+{footer}"""
+
+
+def module_source(
+    decorator: str = "@impunity", header: str = ALIASES, footer: str = ""
+) -> str:
+    """Source of a module with decorated functions and a decorated class.
+
+    ``header`` comes after the imports (by default, the definitions of the
+    ``m`` and ``ft`` aliases), and ``footer`` at the end of the module.
+    """
+    return SOURCE.format(decorator=decorator, header=header, footer=footer)
+
+
+class ModuleTestCase(unittest.TestCase):
+    """Tests writing modules in a temporary folder, which is in sys.path."""
+
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name)
+        sys.path.insert(0, tmp.name)
+        self.addCleanup(sys.path.remove, tmp.name)
+
+    def write(self, filename: str, source: str) -> Path:
+        path = self.path / filename
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(textwrap.dedent(source))
+        return path
+
+    def unload(self, name: str) -> None:
+        for module in list(sys.modules):
+            if module == name or module.startswith(name + "."):
+                del sys.modules[module]
+
+    def load(self, name: str) -> Any:
+        """Import a module again, from its current source."""
+        self.unload(name)
+        self.addCleanup(self.unload, name)
+        importlib.invalidate_caches()
+        return importlib.import_module(name)
+
+    def check(self, module: Any) -> None:
+        """Check the results of the objects of :func:`module_source`."""
+        self.assertAlmostEqual(module.to_ft(1000), 3280.84, delta=1e-2)
+        self.assertAlmostEqual(module.caller(1000), 1000, delta=1e-2)
+        aircraft = module.Aircraft()
+        self.assertAlmostEqual(aircraft.altitude(1000), 304.8, delta=1e-2)
@@ -0,0 +1,79 @@
+import contextlib
+import importlib
+import io
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from impunity import precompile, uninstall_import_hook
+from impunity.__main__ import main
+from impunity.hook import bytecode_path
+from impunity.visitor import Visitor
+
+from .conftest import ModuleTestCase, module_source
+
+
+class Build(ModuleTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.package = self.path / "built_package"
+        self.write("built_package/__init__.py", "")
+        self.write("built_package/sub/__init__.py", "")
+        self.write("built_package/models.py", module_source())
+        self.write("built_package/sub/other.py", module_source())
+        self.write("built_package/broken.py", "import does_not_exist\n")
+
+    def compile(self, *args: str) -> str:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            main(["compile", str(self.package), "-j", "2", *args])
+        return output.getvalue()
+
+    def test_compile(self) -> None:
+        output = self.compile()
+        self.assertIn("built_package.models", output)
+        self.assertIn("built_package.sub.other", output)
+        self.assertIn("5 modules compiled", output)
+        self.assertIn("ModuleNotFoundError", output)
+
+        models = Path(bytecode_path(str(self.package / "models.py")))
+        other = Path(bytecode_path(str(self.package / "sub" / "other.py")))
+        self.assertTrue(models.exists())
+        self.assertTrue(other.exists())
+
+        content = models.read_bytes()
+        self.compile("--force")
+        self.assertEqual(content, models.read_bytes())
+
+    def test_precompile(self) -> None:
+        self.addCleanup(self.unload, "built_package")
+        self.addCleanup(uninstall_import_hook)
+        importlib.invalidate_caches()
+
+        results = precompile("built_package", workers=2)
+        self.assertEqual(
+            [result.module for result in results],
+            [
+                "built_package",
+                "built_package.broken",
+                "built_package.models",
+                "built_package.sub",
+                "built_package.sub.other",
+            ],
+        )
+        self.assertEqual(
+            [result.module for result in results if result.error],
+            ["built_package.broken"],
+        )
+
+        # the rewritten code comes from the workers
+        with mock.patch.object(Visitor, "visit", side_effect=AssertionError):
+            models = importlib.import_module("built_package.models")
+            other = importlib.import_module("built_package.sub.other")
+        self.assertTrue(models.__impunity_precompiled__)
+        self.check(models)
+        self.check(other)
+
+
+if __name__ == "__main__":
+    unittest.main()
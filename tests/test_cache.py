@@ -0,0 +1,100 @@
+import os
+import unittest
+
+from impunity import cache_info
+from impunity.cache import impunity_version
+from impunity.registry import pint_version
+
+from .conftest import ModuleTestCase, module_source
+
+SOURCE = module_source("@impunity(cache=True)")
+
+
+class Cache(ModuleTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.write("cached_module.py", SOURCE)
+
+    def test_hit_and_miss(self) -> None:
+        before = cache_info()
+        self.check(self.load("cached_module"))
+        after_miss = cache_info()
+        self.assertEqual(after_miss.misses - before.misses, 3)
+        self.assertEqual(after_miss.stores - before.stores, 3)
+        self.assertTrue(list((self.path / "__pycache__").glob("*.impunity-*")))
+
+        self.check(self.load("cached_module"))
+        after_hit = cache_info()
+        self.assertEqual(after_hit.hits - after_miss.hits, 3)
+        self.assertEqual(after_hit.misses, after_miss.misses)
+
+    def test_invalidation(self) -> None:
+        self.check(self.load("cached_module"))
+        source = SOURCE.replace(
+            'def to_ft(h: "m") -> "ft"', 'def to_ft(h: "m") -> "m"'
+        )
+        # a different size makes the change visible whatever the mtime
+        self.write("cached_module.py", source + "\n\n")
+        before = cache_info()
+        module = self.load("cached_module")
+        after = cache_info()
+        self.assertEqual(after.invalidations - before.invalidations, 3)
+        self.assertAlmostEqual(module.to_ft(1000), 1000, delta=1e-2)
+
+    def test_imported_module(self) -> None:
+        helper = """
+            from typing import Any
+
+            from typing_extensions import Annotated
+
+            from impunity import impunity
+
+            @impunity
+            def f(h: Annotated[Any, "ft"]) -> Annotated[Any, "ft"]:
+                return h
+            """
+        self.write("helpmod.py", helper)
+        self.write(
+            "cached_module.py",
+            """
+            from typing import Any
+
+            from typing_extensions import Annotated
+
+            import helpmod
+            from impunity import impunity
+
+            @impunity(cache=True)
+            def caller(h) -> Annotated[Any, "m"]:
+                return helpmod.f(h)
+            """,
+        )
+        self.load("helpmod")
+        self.assertAlmostEqual(self.load("cached_module").caller(100), 30.48)
+
+        # only the signature of the function in the other module changes
+        self.write("helpmod.py", helper.replace('"ft"', '"km"') + "\n\n")
+        self.load("helpmod")
+        module = self.load("cached_module")
+        self.assertAlmostEqual(module.caller(100), 100000.0)
+
+    def test_versions_read_once(self) -> None:
+        self.check(self.load("cached_module"))
+        self.check(self.load("cached_module"))
+        # reading the metadata of packages is slower than a cache hit
+        self.assertLessEqual(impunity_version.cache_info().misses, 1)
+        self.assertLessEqual(pint_version.cache_info().misses, 1)
+
+    def test_cache_dir(self) -> None:
+        cache_dir = self.path / "impunity_cache"
+        os.environ["IMPUNITY_CACHE_DIR"] = str(cache_dir)
+        try:
+            self.check(self.load("cached_module"))
+            self.check(self.load("cached_module"))
+        finally:
+            del os.environ["IMPUNITY_CACHE_DIR"]
+        self.assertEqual(len(list(cache_dir.glob("cached_module.*"))), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from typing import Any
+
+from typing_extensions import Annotated
+
+from impunity import impunity, set_registry
+from impunity.conversion import conversion_plan, parse_unit
+
+
+class ConversionPlan(unittest.TestCase):
+    def tearDown(self) -> None:
+        set_registry()
+
+    def test_kinds(self) -> None:
+        self.assertEqual(conversion_plan("m", "meter").kind, "identity")  # type: ignore
+
+        plan = conversion_plan("km", "m")
+        assert plan is not None
+        self.assertEqual((plan.kind, plan.scale), ("scale", 1000))
+
+        plan = conversion_plan("degC", "K")
+        assert plan is not None
+        self.assertEqual(plan.kind, "offset")
+        self.assertAlmostEqual(plan.offset, 273.15)
+
+        plan = conversion_plan("degC", "degF")
+        assert plan is not None
+        self.assertEqual(plan.kind, "affine")
+        self.assertAlmostEqual(plan.scale, 1.8)
+        self.assertAlmostEqual(plan.offset, 32)
+
+        self.assertIsNone(conversion_plan("m", "s"))
+
+    def test_shared_between_functions(self) -> None:
+        @impunity
+        def first(h: Annotated[Any, "furlong"]) -> Annotated[Any, "m"]:
+            return h
+
+        misses = conversion_plan.cache_info().misses
+        hits = conversion_plan.cache_info().hits
+
+        @impunity
+        def second(h: Annotated[Any, "furlong"]) -> Annotated[Any, "m"]:
+            return h
+
+        self.assertEqual(conversion_plan.cache_info().misses, misses)
+        self.assertGreater(conversion_plan.cache_info().hits, hits)
+        self.assertAlmostEqual(first(1), second(1))
+
+    def test_registry_change(self) -> None:
+        from pint import UnitRegistry
+
+        parse_unit("m")
+        set_registry(UnitRegistry())
+        self.assertEqual(parse_unit.cache_info().currsize, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
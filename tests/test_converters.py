@@ -0,0 +1,95 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from impunity import batch_convert, converter
+
+
+class Converter(unittest.TestCase):
+    def test_scalars(self) -> None:
+        self.assertAlmostEqual(converter("km/h", "kts")(100), 53.9957, places=4)
+        self.assertAlmostEqual(converter("degC", "degF")(100), 212)
+        self.assertAlmostEqual(converter("degC", "K")(0), 273.15)
+        self.assertEqual(converter("m", "meter")(3), 3)
+        self.assertIs(converter("ft", "m"), converter("ft", "m"))
+
+    def test_arrays(self) -> None:
+        values = np.array([0, 100], dtype=np.float32)
+        result = converter("degC", "degF")(values)
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, [32, 212])
+        self.assertEqual(values.tolist(), [0, 100])
+
+        integers = np.array([1, 2])
+        result = converter("km", "m")(integers)
+        self.assertEqual(result.tolist(), [1000, 2000])
+
+    def test_out(self) -> None:
+        values = np.array([0.0, 100.0])
+        to_fahrenheit = converter("degC", "degF")
+        self.assertIs(to_fahrenheit(values, out=values), values)
+        np.testing.assert_allclose(values, [32, 212])
+
+        out = np.empty((2, 3))
+        converter("km", "m")(np.ones((2, 3)), out=out[:, :])
+        np.testing.assert_allclose(out, 1000)
+        converter("km", "m")(np.ones((3, 2)).T, out=out)
+        np.testing.assert_allclose(out, 1000)
+
+    def test_memmap(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            path = Path(folder) / "values.dat"
+            values = np.memmap(path, np.float32, mode="w+", shape=(100_000,))
+            values[:] = np.arange(values.size)
+            result = converter("ft", "m")(values)
+            self.assertNotIsInstance(result, np.memmap)
+            self.assertEqual(result.dtype, np.float32)
+            np.testing.assert_allclose(result, values * 0.3048, rtol=1e-6)
+
+            converter("ft", "m")(values, out=values)
+            values.flush()
+            del values
+            stored = np.fromfile(path, np.float32)
+            np.testing.assert_allclose(stored[-1], 99_999 * 0.3048, rtol=1e-6)
+
+    def test_errors(self) -> None:
+        with self.assertRaises(ValueError):
+            converter("m", "s")
+        with self.assertRaises(TypeError):
+            converter("m", "km")(1.0, out=[0.0])  # type: ignore
+
+
+class BatchConversion(unittest.TestCase):
+    def test_columns(self) -> None:
+        telemetry = np.array([[1000, 100, 0], [2000, 200, 100]], np.float32)
+        result = batch_convert(
+            telemetry, ["ft", "kts", "degC"], ["m", "m/s", "K"]
+        )
+        self.assertEqual(result.dtype, np.float32)
+        expected = [[304.8, 51.444, 273.15], [609.6, 102.889, 373.15]]
+        np.testing.assert_allclose(result, expected, rtol=1e-4)
+        self.assertEqual(telemetry[0].tolist(), [1000, 100, 0])
+
+        rows = batch_convert(
+            telemetry.T, ["ft", "kts", "degC"], ["m", "m/s", "K"], axis=0
+        )
+        np.testing.assert_allclose(rows, np.transpose(expected), rtol=1e-4)
+
+    def test_inplace(self) -> None:
+        values = np.ones((100_000, 2))
+        result = batch_convert(values, ["km", "h"], ["m", "s"], out=values)
+        self.assertIs(result, values)
+        self.assertEqual(values[-1].tolist(), [1000, 3600])
+
+    def test_errors(self) -> None:
+        with self.assertRaises(ValueError):
+            batch_convert(np.ones((2, 2)), ["m", "s"], ["m", "m"])
+        with self.assertRaises(ValueError):
+            batch_convert(np.ones((2, 3)), ["m", "s"], ["m", "s"])
+        with self.assertRaises(ValueError):
+            batch_convert(np.ones((2, 2)), ["m", "s"], ["m"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+from typing import Any
+
+from typing_extensions import Annotated
+
+import numpy as np
+from impunity import impunity
+
+
+@impunity
+def redeclared(h: Annotated[Any, "m"], flag: bool) -> Annotated[Any, "m"]:
+    x: Annotated[Any, "m"] = h
+    if flag:
+        x: Annotated[Any, "km"] = h  # type: ignore
+    return x
+
+
+@impunity
+def branches(
+    a: Annotated[Any, "m"], b: Annotated[Any, "ft"], flag: bool
+) -> Annotated[Any, "m"]:
+    if flag:
+        x: Annotated[Any, "ft"] = a
+    elif b > 0:
+        x: Annotated[Any, "m"] = b  # type: ignore
+    else:
+        return 0
+    return x
+
+
+@impunity
+def accumulate(step: Annotated[Any, "m"], n: int) -> Annotated[Any, "m"]:
+    total: Annotated[Any, "m"] = 0
+    i = 0
+    while i < n:
+        total: Annotated[Any, "km"] = total + step  # type: ignore
+        i += 1
+    return total
+
+
+@impunity
+def elements(values: Annotated[np.ndarray, "m"]) -> Annotated[Any, "km"]:
+    total: Annotated[Any, "km"] = 0
+    for value in values:
+        converted: Annotated[Any, "km"] = value
+        total = total + converted
+    return total
+
+
+@impunity
+def fallback(text: str, h: Annotated[Any, "m"]) -> Annotated[Any, "m"]:
+    x: Annotated[Any, "m"] = h
+    try:
+        x: Annotated[Any, "ft"] = float(text) * h  # type: ignore
+    except ValueError:
+        pass
+    return x
+
+
+def risky(fail: bool) -> None:
+    if fail:
+        raise ValueError
+
+
+@impunity
+def raised(h: Annotated[Any, "m"], fail: bool) -> Annotated[Any, "m"]:
+    x: Annotated[Any, "m"] = h
+    try:
+        x: Annotated[Any, "ft"] = h  # type: ignore
+        risky(fail)
+    except ValueError:
+        pass
+    return x
+
+
+class Dataflow(unittest.TestCase):
+    def test_if(self) -> None:
+        self.assertAlmostEqual(redeclared(1000, True), 1000)
+        self.assertAlmostEqual(redeclared(1000, False), 1000)
+
+    def test_branches(self) -> None:
+        self.assertAlmostEqual(branches(1, 1, True), 1)
+        self.assertAlmostEqual(branches(1, 1, False), 0.3048)
+        self.assertEqual(branches(1, -1, False), 0)
+
+    def test_loop(self) -> None:
+        self.assertAlmostEqual(accumulate(10, 3), 30)
+        self.assertAlmostEqual(accumulate(10, 0), 0)
+
+    def test_for_target(self) -> None:
+        self.assertAlmostEqual(elements(np.array([1000.0, 2000.0])), 3)
+
+    def test_try(self) -> None:
+        self.assertAlmostEqual(fallback("2", 3), 2 * 3)
+        self.assertAlmostEqual(fallback("x", 3), 3)
+        # raised after the variable is converted
+        self.assertAlmostEqual(raised(1000, True), 1000)
+        self.assertAlmostEqual(raised(1000, False), 1000)
+
+    def test_incompatible(self) -> None:
+        def incompatible(flag: bool) -> Annotated[Any, "m"]:
+            if flag:
+                x: Annotated[Any, "m"] = 1
+            else:
+                x: Annotated[Any, "s"] = 1  # type: ignore
+            return x
+
+        with self.assertLogs("impunity.visitor", level="WARNING") as cm:
+            impunity(incompatible)
+        self.assertIn(
+            "Incompatible units on different paths for x", cm.output[0]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -228,6 +228,43 @@ class Functions(unittest.TestCase):
         result = speed_with_annotated_to_test(altitudes, duration)
         self.assertAlmostEqual(result[3], 0.05, delta=1e-2)
 
+    def test_nested_function(self) -> None:
+        @impunity
+        def outer(h: "m") -> "m":
+            def inner(h: "ft") -> "m":
+                return h
+
+            return inner(h)
+
+        self.assertAlmostEqual(outer(1000), 1000, delta=1e-2)
+
+        @impunity
+        def unitless(h: "m") -> "ft":
+            def inner(n, h: "ft") -> "ft":
+                return n * h
+
+            return inner(2, h)
+
+        self.assertAlmostEqual(unitless(1000), 6561.68, delta=1e-2)
+
+    def test_nested_same_name(self) -> None:
+        @impunity
+        def in_meters(h: "m") -> "m":
+            def convert(h: "ft") -> "m":
+                return h
+
+            return convert(h)
+
+        @impunity
+        def in_feet(h: "m") -> "ft":
+            def convert(h: "m") -> "ft":
+                return h
+
+            return convert(h)
+
+        self.assertAlmostEqual(in_meters(1000), 1000, delta=1e-2)
+        self.assertAlmostEqual(in_feet(1000), 3280.84, delta=1e-2)
+
 
 if __name__ == "__main__":
     unittest.main()
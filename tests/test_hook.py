@@ -0,0 +1,161 @@
+import importlib
+import os
+import sys
+import textwrap
+import unittest
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+from impunity import install_import_hook, uninstall_import_hook
+from impunity.hook import _memory, bytecode_path, module_dependencies
+from impunity.visitor import Visitor
+
+from .conftest import ALIASES, ModuleTestCase, module_source
+
+UNITS = (
+    """
+from typing import Any
+
+from typing_extensions import Annotated
+"""
+    + ALIASES
+)
+
+SOURCE = module_source(header="\nfrom .units import ft, m\n")
+
+
+class ImportHook(ModuleTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.package = self.path / "hooked_package"
+        self.write("hooked_package/__init__.py", "")
+        self.write("hooked_package/units.py", UNITS)
+        self.write("hooked_package/models.py", SOURCE)
+        install_import_hook("hooked_package")
+        self.addCleanup(uninstall_import_hook)
+        patcher = mock.patch.object(sys, "dont_write_bytecode", False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def load(self, name: str = "hooked_package.models") -> Any:
+        self.unload("hooked_package")
+        return super().load(name)
+
+    def test_import_hook(self) -> None:
+        self.check(self.load())
+        pyc = list((self.package / "__pycache__").glob("models.*"))
+        self.assertIn("opt-impunity", " ".join(p.name for p in pyc))
+
+        with mock.patch.object(Visitor, "visit") as visit:
+            module = self.load()
+        visit.assert_not_called()
+        self.assertTrue(module.__impunity_precompiled__)
+        self.check(module)
+
+    def test_invalidation(self) -> None:
+        self.check(self.load())
+        source = SOURCE.replace(
+            'def to_ft(h: "m") -> "ft"', 'def to_ft(h: "m")'
+        )
+        self.write("hooked_package/models.py", source)
+        module = self.load()
+        self.assertFalse(hasattr(module, "__impunity_precompiled__"))
+        self.assertEqual(module.to_ft(1000), 1000)
+
+    def test_dependencies(self) -> None:
+        self.check(self.load())
+        units = UNITS.replace('ft = Annotated[Any, "ft"]', 'ft = "km"')
+        self.write("hooked_package/units.py", units + "\n")
+        module = self.load()
+        self.assertFalse(hasattr(module, "__impunity_precompiled__"))
+
+    def test_import_order(self) -> None:
+        self.write("hooked_package/other.py", SOURCE)
+        models = self.package / "models.py"
+        pyc = Path(bytecode_path(str(models)))
+
+        self.load()
+        content = pyc.read_bytes()
+        pyc.unlink()
+        _memory.clear()
+        self.load("hooked_package.other")
+        importlib.import_module("hooked_package.models")
+        # the dependencies do not include the other modules of the package
+        self.assertEqual(content, pyc.read_bytes())
+
+    def test_not_rewritten(self) -> None:
+        source = SOURCE + textwrap.dedent(
+            """
+            @impunity(rewrite=False)
+            def unchanged(h: "m") -> "ft":
+                return h
+            """
+        )
+        self.write("hooked_package/models.py", source)
+        self.assertEqual(self.load().unchanged(1), 1)
+        module = self.load()
+        self.assertTrue(module.__impunity_precompiled__)
+        self.assertEqual(module.unchanged(1), 1)
+
+    def test_nested_definition(self) -> None:
+        # not replaced in the cached module: still rewritten by the decorator
+        source = SOURCE.replace(
+            "@impunity\ndef to_ft", "if True:\n  @impunity\n  def to_ft"
+        )
+        self.write("hooked_package/models.py", source)
+        self.check(self.load())
+        module = self.load()
+        self.assertNotIn("to_ft", module.__impunity_precompiled__)
+        self.check(module)
+
+    def test_factory(self) -> None:
+        source = SOURCE + textwrap.dedent(
+            """
+            def make():
+                @impunity
+                def inner(h: "m") -> "ft":
+                    return h
+
+                return inner
+            """
+        )
+        self.write("hooked_package/models.py", source)
+        self.assertAlmostEqual(self.load().make()(1000), 3280.84, delta=1e-2)
+        module = self.load()
+        self.assertTrue(module.__impunity_precompiled__)
+        self.assertAlmostEqual(module.make()(1000), 3280.84, delta=1e-2)
+
+    def test_call_at_import(self) -> None:
+        self.write("hooked_package/models.py", SOURCE + "\nALT = to_ft(1000)\n")
+        self.assertAlmostEqual(self.load().ALT, 3280.84, delta=1e-2)
+        self.assertAlmostEqual(self.load().ALT, 3280.84, delta=1e-2)
+
+        _memory.clear()
+        for pyc in (self.package / "__pycache__").glob("*.opt-impunity.pyc"):
+            pyc.unlink()
+        with mock.patch.object(sys, "dont_write_bytecode", True):
+            module = self.load()
+        self.assertAlmostEqual(module.ALT, 3280.84, delta=1e-2)
+        self.check(module)
+
+    def test_module_dependencies(self) -> None:
+        # a module outside the hooked package, without module annotations
+        self.write(
+            "helpmod.py",
+            """
+            from impunity import impunity
+
+            @impunity
+            def f(h):
+                return h
+            """,
+        )
+        module = self.load()
+        module.helpmod = super().load("helpmod")
+        filenames = [name for name, _ in module_dependencies(module)]
+        self.assertIn(os.path.join("..", "helpmod.py"), filenames)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import sys
+import types
+import unittest
+from typing import Any
+
+from typing_extensions import Annotated
+
+from impunity.visitor import Visitor, evaluate_annotations
+
+m = Annotated[Any, "m"]
+
+
+class ModuleIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.imported = types.ModuleType("impunity_test_imported")
+        self.imported.__annotations__ = {"speed": Annotated[Any, "kts"]}
+        self.module = types.ModuleType("impunity_test_indexed")
+        self.module.__annotations__ = {"altitude": Annotated[Any, "ft"]}
+        self.module.Meters = Annotated[Any, "m"]  # type: ignore
+        self.module.imported = self.imported  # type: ignore
+        sys.modules[self.module.__name__] = self.module
+
+    def tearDown(self) -> None:
+        del sys.modules[self.module.__name__]
+
+    def units(self) -> Any:
+        return dict(Visitor.module_annotations(self.module.__name__))
+
+    def test_index(self) -> None:
+        self.assertEqual(
+            self.units(), {"altitude": "ft", "Meters": "m", "speed": "kts"}
+        )
+        self.assertIs(
+            Visitor.module_annotations(self.module.__name__),
+            Visitor.module_annotations(self.module.__name__),
+        )
+
+    def test_incremental(self) -> None:
+        self.units()
+        self.module.__annotations__["duration"] = "s"
+        self.module.Feet = Annotated[Any, "ft"]  # type: ignore
+        self.assertEqual(
+            self.units(),
+            {
+                "altitude": "ft",
+                "Meters": "m",
+                "speed": "kts",
+                "duration": "s",
+                "Feet": "ft",
+            },
+        )
+
+    def test_rebuild(self) -> None:
+        self.units()
+        self.module.Meters = Annotated[Any, "km"]  # type: ignore
+        self.imported.__annotations__["distance"] = "nmi"
+        units = self.units()
+        self.assertEqual(units["Meters"], "km")
+        self.assertEqual(units["distance"], "nmi")
+
+        del self.module.imported  # type: ignore
+        self.assertNotIn("speed", self.units())
+
+    def test_globals_take_precedence(self) -> None:
+        self.units()
+        # the global alias wins over the annotation, as in a full scan
+        self.module.__annotations__["Meters"] = "cm"
+        self.assertEqual(self.units()["Meters"], "m")
+
+
+class Signatures(unittest.TestCase):
+    def test_memoized(self) -> None:
+        def speed(distance: "m") -> Annotated[Any, "km/h"]:
+            return distance
+
+        annotations = evaluate_annotations(speed, globals())
+        assert annotations is not None
+        self.assertEqual(annotations["distance"].__metadata__, ("m",))
+        self.assertIs(evaluate_annotations(speed, globals()), annotations)
+
+        # e.g. after the function is decorated by another library
+        speed.__annotations__["distance"] = Annotated[Any, "ft"]
+        self.assertIsNot(evaluate_annotations(speed, globals()), annotations)
+
+    def test_context(self) -> None:
+        def speed(distance: "nmi_alias") -> Any:  # noqa: F821
+            return distance
+
+        context = {"nmi_alias": Annotated[Any, "nmi"]}
+        annotations = evaluate_annotations(speed, context)
+        assert annotations is not None
+        self.assertEqual(annotations["distance"].__metadata__, ("nmi",))
+
+        other = {"nmi_alias": Annotated[Any, "km"]}
+        annotations = evaluate_annotations(speed, other)
+        assert annotations is not None
+        self.assertEqual(annotations["distance"].__metadata__, ("km",))
+
+
+if __name__ == "__main__":
+    unittest.main()
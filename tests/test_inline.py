@@ -0,0 +1,107 @@
+import ast
+import unittest
+from typing import Any, Callable, List
+
+from typing_extensions import Annotated
+
+from impunity import impunity, inline_info
+from impunity.rewriter import rewrite_object
+
+
+def rewritten(fun: Callable[..., Any], inline: Any = True) -> str:
+    trees: List[ast.AST] = []
+    rewrite_object(fun, cache=False, inline=inline, trees=trees)
+    return ast.unparse(trees[0])
+
+
+@impunity
+def temperature(h: Annotated[Any, "m"]) -> Annotated[Any, "K"]:
+    """Temperature in the troposphere."""
+    temp: Annotated[Any, "K"] = 288.15 - 0.0065 * h
+    return temp
+
+
+@impunity
+def altitude(h: Annotated[Any, "ft"]) -> Annotated[Any, "m"]:
+    return h
+
+
+@impunity
+def distance(
+    speed: Annotated[Any, "m/s"], duration: Annotated[Any, "s"]
+) -> Annotated[Any, "m"]:
+    return speed * duration
+
+
+@impunity
+def logged(h: Annotated[Any, "m"]) -> Annotated[Any, "m"]:
+    print(h)
+    return h
+
+
+@impunity
+def twice(h: Annotated[Any, "m"]) -> Annotated[Any, "m"]:
+    return h + h
+
+
+@impunity(inline=True)
+def temperature_ft(h: Annotated[Any, "ft"]) -> Annotated[Any, "K"]:
+    return temperature(h)
+
+
+@impunity(inline=True)
+def round_trip(h: Annotated[Any, "m"]) -> Annotated[Any, "m"]:
+    return altitude(h)
+
+
+class Inlining(unittest.TestCase):
+    def test_inlined(self) -> None:
+        self.assertAlmostEqual(temperature_ft(1000), 288.15 - 1.9812)
+        self.assertEqual(
+            inline_info()[f"{__name__}.temperature_ft"],
+            [f"{__name__}.temperature"],
+        )
+        self.assertNotIn("temperature", temperature_ft.__code__.co_names)
+
+    def test_folded(self) -> None:
+        # conversions of the caller and of the callee cancel out
+        self.assertIn("return h\n", rewritten(round_trip) + "\n")
+        self.assertEqual(round_trip(2), 2)
+
+    def test_arguments(self) -> None:
+        def travel(
+            speed: Annotated[Any, "km/h"], duration: Annotated[Any, "min"]
+        ) -> Annotated[Any, "km"]:
+            return distance(speed, duration * 2)
+
+        source = rewritten(travel)
+        self.assertNotIn("distance", source)
+        self.assertIn("duration * 2", source)
+
+        def impure(h: Annotated[Any, "m"]) -> Annotated[Any, "m"]:
+            return twice(abs(h))
+
+        self.assertIn("twice(abs(h))", rewritten(impure))
+
+    def test_not_inlined(self) -> None:
+        def side_effect(h: Annotated[Any, "m"]) -> Annotated[Any, "m"]:
+            return logged(h)
+
+        self.assertIn("logged(h)", rewritten(side_effect))
+
+        def too_large(h: Annotated[Any, "ft"]) -> Annotated[Any, "K"]:
+            return temperature(h)
+
+        self.assertIn("temperature(h", rewritten(too_large, inline=3))
+        self.assertNotIn("temperature(h", rewritten(too_large, inline=20))
+
+    def test_shadowed(self) -> None:
+        def shadowed(h: Annotated[Any, "ft"]) -> Annotated[Any, "m"]:
+            altitude = abs
+            return altitude(h)
+
+        self.assertIn("altitude(h", rewritten(shadowed))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import ast
+import unittest
+from typing import Any, Callable, List
+
+from typing_extensions import Annotated
+
+import numpy as np
+from impunity import impunity
+from impunity.rewriter import rewrite_object
+from impunity.runtime import convert
+
+
+def rewritten(fun: Callable[..., Any]) -> str:
+    trees: List[ast.AST] = []
+    impunity(inplace=True)(fun)
+    rewrite_object(fun, cache=False, inplace=True, trees=trees)
+    return ast.unparse(trees[0])
+
+
+@impunity(inplace=True)
+def climb(
+    start: Annotated[np.ndarray, "ft"], end: Annotated[np.ndarray, "ft"]
+) -> Annotated[np.ndarray, "m"]:
+    return end - start
+
+
+@impunity(inplace=True)
+def temperature(
+    celsius: Annotated[np.ndarray, "degC"],
+) -> Annotated[np.ndarray, "degF"]:
+    return celsius
+
+
+@impunity(inplace=True)
+def mean_speed(
+    distance: Annotated[np.ndarray, "km"], duration: Annotated[float, "h"]
+) -> Annotated[np.ndarray, "m/s"]:
+    speed: Annotated[np.ndarray, "km/h"] = distance / duration
+    return speed
+
+
+class InplaceConversion(unittest.TestCase):
+    def test_convert(self) -> None:
+        values = np.array([1.0, 2.0])
+        self.assertIs(convert(values, 2, 1), values)
+        self.assertEqual(values.tolist(), [3, 5])
+
+        integers = np.array([1, 2])
+        result = convert(integers, 0.5)
+        self.assertIsNot(result, integers)
+        self.assertEqual(result.tolist(), [0.5, 1])
+        self.assertEqual(convert(2, 3, 1), 7)
+
+        values.flags.writeable = False
+        self.assertIsNot(convert(values, 2), values)
+
+    def test_decorated(self) -> None:
+        start, end = np.zeros(3), np.full(3, 1000.0)
+        np.testing.assert_allclose(climb(start, end), 304.8)
+        np.testing.assert_allclose(mean_speed(end, 2.0), 500 / 3.6)
+        self.assertEqual(end.tolist(), [1000] * 3)
+
+    def test_arguments(self) -> None:
+        celsius = np.array([0.0, 100.0])
+        np.testing.assert_allclose(temperature(celsius), [32, 212])
+        self.assertEqual(celsius.tolist(), [0, 100])
+
+    def test_last_use(self) -> None:
+        def last(
+            start: Annotated[np.ndarray, "ft"], end: Annotated[np.ndarray, "ft"]
+        ) -> Annotated[np.ndarray, "m"]:
+            gain: Annotated[np.ndarray, "ft"] = end - start
+            result: Annotated[np.ndarray, "m"] = gain
+            return result
+
+        self.assertIn("= __impunity_convert__(gain, 0.3", rewritten(last))
+
+        def reused(
+            start: Annotated[np.ndarray, "ft"], end: Annotated[np.ndarray, "ft"]
+        ) -> Annotated[np.ndarray, "ft"]:
+            gain: Annotated[np.ndarray, "ft"] = end - start
+            result: Annotated[np.ndarray, "m"] = gain
+            return gain + result
+
+        self.assertIn(
+            "result: Annotated[np.ndarray, 'm'] = gain * 0.3", rewritten(reused)
+        )
+
+    def test_aliased(self) -> None:
+        def aliased(
+            start: Annotated[np.ndarray, "ft"], end: Annotated[np.ndarray, "ft"]
+        ) -> Annotated[np.ndarray, "m"]:
+            gain: Annotated[np.ndarray, "ft"] = end - start
+            print(gain)  # may keep a reference
+            result: Annotated[np.ndarray, "m"] = gain
+            return result
+
+        self.assertNotIn("__impunity_convert__(gain", rewritten(aliased))
+
+    def test_loop(self) -> None:
+        def loop(
+            start: Annotated[np.ndarray, "ft"], n: int
+        ) -> Annotated[np.ndarray, "m"]:
+            gain: Annotated[np.ndarray, "ft"] = start * 2
+            for _ in range(n):
+                result: Annotated[np.ndarray, "m"] = gain
+            return result
+
+        self.assertNotIn("__impunity_convert__(gain", rewritten(loop))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import threading
+import unittest
+from typing import Any, List
+
+from typing_extensions import Annotated
+
+from impunity import impunity, lazy_info
+
+m = Annotated[Any, "m"]
+ft = Annotated[Any, "ft"]
+
+
+@impunity(lazy=True)
+def lazy_ft(h: "m", offset: "ft" = 0) -> "ft":
+    return h + offset
+
+
+@impunity(lazy=True)
+def lazy_threads(h: "m") -> "ft":
+    return h
+
+
+@impunity
+def eager_caller(h: "ft") -> "m":
+    result: "m" = lazy_ft(h)
+    return result
+
+
+class Lazy(unittest.TestCase):
+    def test_deferred(self) -> None:
+        @impunity(lazy=True)
+        def never_called(h: "m") -> "ft":
+            return h
+
+        before = lazy_info()
+        trampoline = never_called.__code__
+
+        @impunity(lazy=True)
+        def called(h: "m") -> "ft":
+            return h
+
+        after = lazy_info()
+        self.assertEqual(after.deferred - before.deferred, 1)
+        self.assertEqual(after.compiled, before.compiled)
+        self.assertIs(called.__code__, trampoline)
+
+        self.assertAlmostEqual(called(1000), 3280.84, delta=1e-2)
+        self.assertEqual(lazy_info().compiled - after.compiled, 1)
+        self.assertIsNot(called.__code__, trampoline)
+        self.assertAlmostEqual(called(1000), 3280.84, delta=1e-2)
+        self.assertEqual(called.__name__, "called")
+
+    def test_defaults(self) -> None:
+        self.assertAlmostEqual(lazy_ft(1000), 3280.84, delta=1e-2)
+        self.assertAlmostEqual(lazy_ft(1000, 10), 3290.84, delta=1e-2)
+        self.assertAlmostEqual(lazy_ft(1000, offset=10), 3290.84, delta=1e-2)
+
+    def test_caller(self) -> None:
+        self.assertAlmostEqual(eager_caller(1000), 304.8, delta=1e-2)
+
+    def test_threads(self) -> None:
+        before = lazy_info()
+        results: List[Any] = []
+        barrier = threading.Barrier(8)
+
+        def worker() -> None:
+            barrier.wait()
+            results.append(lazy_threads(1000))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), 8)
+        for result in results:
+            self.assertAlmostEqual(result, 3280.84, delta=1e-2)
+        self.assertEqual(lazy_info().compiled - before.compiled, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
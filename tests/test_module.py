@@ -0,0 +1,75 @@
+import ast
+import textwrap
+import unittest
+from unittest import mock
+
+from .conftest import ALIASES, ModuleTestCase, module_source
+
+HEADER = (
+    """
+from impunity import rewrite_module
+
+__impunity_batch__ = True
+"""
+    + ALIASES
+)
+
+FOOTER = """
+
+@impunity(ignore=True)
+def ignored(h: "m") -> "ft":
+    return h
+
+
+def before_rewrite(h: "m") -> Any:
+    return to_ft(h)
+
+
+RESULT = before_rewrite(1000)
+
+COUNT = rewrite_module(__name__)
+"""
+
+
+class RewriteModule(ModuleTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.write(
+            "batch_module.py", module_source(header=HEADER, footer=FOOTER)
+        )
+
+    def test_rewrite_module(self) -> None:
+        module = self.load("batch_module")
+        # to_ft is rewritten on its first call, before rewrite_module, and
+        # the class when it is decorated
+        self.assertAlmostEqual(module.RESULT, 3280.84, delta=1e-2)
+        self.assertEqual(module.COUNT, 1)
+        self.check(module)
+        self.assertEqual(module.ignored(1000), 1000)
+
+    def test_after_rewrite(self) -> None:
+        footer = FOOTER + textwrap.dedent(
+            """
+            def make():
+                @impunity
+                def inner(h: "m") -> "ft":
+                    return h
+
+                return inner
+            """
+        )
+        self.write(
+            "batch_module.py", module_source(header=HEADER, footer=footer)
+        )
+        module = self.load("batch_module")
+        self.assertAlmostEqual(module.make()(1000), 3280.84, delta=1e-2)
+        self.assertFalse(module.__impunity_batch__)
+
+    def test_parse_once(self) -> None:
+        with mock.patch("ast.parse", wraps=ast.parse) as parse:
+            self.load("batch_module")
+        self.assertEqual(parse.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
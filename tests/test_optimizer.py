@@ -0,0 +1,328 @@
+import ast
+import unittest
+from typing import Any, Callable, List
+
+from typing_extensions import Annotated
+
+import numpy as np
+from impunity import impunity, stats
+from impunity.optimizer import (
+    ConversionFolder,
+    ConversionHoister,
+    ConversionSharing,
+    conversion_constant,
+)
+from impunity.rewriter import rewrite_object
+
+
+def fold(tree: ast.AST) -> str:
+    tree = ConversionFolder().visit(tree)
+    return ast.unparse(ast.fix_missing_locations(tree))
+
+
+def chain(node: ast.expr, *operations: Any) -> ast.expr:
+    for op, value in operations:
+        node = ast.BinOp(node, op, conversion_constant(value))
+    return node
+
+
+def parse(source: str) -> ast.AST:
+    """Parse ``source``, where conversions are written ``C(x)`` (i.e.
+    ``x * 2``)."""
+
+    class Convert(ast.NodeTransformer):
+        def visit_Call(self, node: ast.Call) -> ast.AST:
+            self.generic_visit(node)
+            if isinstance(node.func, ast.Name) and node.func.id == "C":
+                return chain(node.args[0], (ast.Mult(), 2))
+            return node
+
+    return Convert().visit(ast.parse(source))
+
+
+def hoist(source: str) -> str:
+    tree = ConversionHoister().visit(parse(source))
+    return ast.unparse(ast.fix_missing_locations(tree))
+
+
+def share(source: str) -> str:
+    tree = ConversionSharing().visit(parse(source))
+    return ast.unparse(ast.fix_missing_locations(tree))
+
+
+@impunity
+def to_ft(h: Annotated[Any, "ft"]) -> Annotated[Any, "ft"]:
+    return h
+
+
+@impunity
+def to_km(h: Annotated[Any, "km"]) -> Annotated[Any, "km"]:
+    return h
+
+
+class ConversionFolding(unittest.TestCase):
+    def test_chain(self) -> None:
+        x = ast.Name("x", ast.Load())
+        node = chain(x, (ast.Mult(), 2), (ast.Add(), 3), (ast.Mult(), 10))
+        self.assertEqual(fold(ast.Expression(node)), "x * 20 + 30")
+
+    def test_identity(self) -> None:
+        x = ast.Name("x", ast.Load())
+        node = chain(x, (ast.Mult(), 4), (ast.Mult(), 0.25), (ast.Add(), 0))
+        self.assertEqual(fold(ast.Expression(node)), "x")
+
+    def test_literal(self) -> None:
+        node = chain(ast.Constant(1000), (ast.Mult(), 2), (ast.Add(), 1))
+        self.assertEqual(fold(ast.Expression(node)), "2001")
+
+    def test_user_code(self) -> None:
+        source = "def f(x):\n    return x * 2 * 3 + 0"
+        self.assertEqual(fold(ast.parse(source)), source)
+
+    def test_constant_variable(self) -> None:
+        def scaled(node: ast.expr) -> ast.expr:
+            return chain(node, (ast.Mult(), 2))
+
+        tree = ast.parse("def f():\n    a = 1000\n    return a")
+        ret = tree.body[0].body[1]  # type: ignore
+        ret.value = ast.copy_location(scaled(ret.value), ret.value)
+        self.assertIn("return 2000", fold(tree))
+
+        tree = ast.parse("def f():\n    a = 1000\n    a += 1\n    return a")
+        ret = tree.body[0].body[2]  # type: ignore
+        ret.value = ast.copy_location(scaled(ret.value), ret.value)
+        self.assertIn("return a * 2", fold(tree))
+
+    def test_decorated(self) -> None:
+        @impunity
+        def altitude() -> Annotated[Any, "ft"]:
+            altitude: Annotated[Any, "m"] = 1000
+            return to_ft(altitude)
+
+        self.assertAlmostEqual(altitude(), 3280.84, delta=1e-2)
+        self.assertIn(1000 * 3.2808398950131235, altitude.__code__.co_consts)
+
+
+class ConversionHoisting(unittest.TestCase):
+    def test_loop(self) -> None:
+        source = "def f(h, n):\n    for i in range(n):\n        y = C(h) + C(i)"
+        result = hoist(source)
+        self.assertIn("__impunity_h_0__ = None\n    for", result)
+        self.assertIn(
+            "y = (__impunity_h_0__ if __impunity_h_0__ is not None else "
+            "(__impunity_h_0__ := (h * 2))) + i * 2",
+            result,
+        )
+
+    def test_while(self) -> None:
+        source = "def f(h):\n    x = 0\n    while x < C(h):\n        x += 1"
+        result = hoist(source)
+        self.assertIn("__impunity_h_0__ = None\n    while", result)
+        self.assertIn("while x < (__impunity_h_0__ if", result)
+
+    def test_comprehension(self) -> None:
+        source = "def f(h, n):\n    return [C(h) + i for i in range(n)]"
+        result = hoist(source)
+        self.assertIn("__impunity_h_0__ = None\n    return", result)
+
+    def test_conditional(self) -> None:
+        for source in (
+            "def f(h, n):\n    for i in n:\n        if h:\n"
+            "            y = C(h)",
+            "def f(h, n):\n    for i in n:\n        if i:\n"
+            "            continue\n        y = C(h)",
+            "def f(h, n):\n    return [C(h) for i in n if h]",
+        ):
+            self.assertNotIn("__impunity", hoist(source))
+
+    def test_variant(self) -> None:
+        for body in [
+            "h = i",  # rebound
+            "h[0] = i",  # modified in place
+            "g(h)",  # possibly modified by a function
+        ]:
+            source = (
+                f"def f(h, n):\n    for i in range(n):\n        {body}\n"
+                "        y = C(h)"
+            )
+            self.assertNotIn("__impunity", hoist(source), body)
+
+        # modified in place through an alias bound before the loop
+        source = (
+            "def f(h, n):\n    g = h\n    for i in range(n):\n"
+            "        g += 1\n        y = C(h)"
+        )
+        self.assertNotIn("__impunity", hoist(source))
+
+        # evaluated after the loop
+        source = "def f(h, n):\n    for i in range(n):\n        g(lambda: C(h))"
+        self.assertNotIn("__impunity", hoist(source))
+
+    def test_unbound(self) -> None:
+        source = "def f(n):\n    for i in range(n):\n        y = C(h)"
+        self.assertNotIn("__impunity", hoist(source))
+
+    def test_decorated(self) -> None:
+        @impunity
+        def climb(h: Annotated[Any, "m"], n: int) -> Annotated[Any, "m"]:
+            total: Annotated[Any, "m"] = 0
+            for _ in range(n):
+                total = total + to_ft(h)
+            return total
+
+        self.assertAlmostEqual(climb(1, 3), 3, delta=1e-9)
+        self.assertIn("__impunity_h_0__", climb.__code__.co_varnames)
+
+        @impunity
+        def guarded(h: Annotated[Any, "m"], n: int) -> Annotated[Any, "m"]:
+            total: Annotated[Any, "m"] = 0
+            for _ in range(n):
+                if h is not None:
+                    total = total + to_ft(h)
+            return total
+
+        self.assertEqual(guarded(None, 3), 0)
+        self.assertAlmostEqual(guarded(1, 3), 3, delta=1e-9)
+        # not converted if the loop runs zero times
+        self.assertEqual(climb(None, 0), 0)
+
+
+def rewritten(fun: Callable[..., Any]) -> str:
+    trees: List[ast.AST] = []
+    rewrite_object(fun, cache=False, trees=trees)
+    return ast.unparse(trees[0])
+
+
+class ConversionPlacement(unittest.TestCase):
+    def test_scalar_operand(self) -> None:
+        def area(
+            width: Annotated[float, "m"], length: Annotated[np.ndarray, "ft"]
+        ) -> Annotated[Any, "m**2"]:
+            return width * length
+
+        self.assertIn("return width * 0.3047", rewritten(area))
+        self.assertAlmostEqual(area(2, np.ones(3))[0], 2 * 0.3048)
+
+    def test_scalar_divisor(self) -> None:
+        def ratio(
+            length: Annotated[np.ndarray, "ft"], width: Annotated[float, "m"]
+        ) -> Annotated[Any, "dimensionless"]:
+            return length / width
+
+        self.assertIn("return length / (width * 3.28", rewritten(ratio))
+
+    def test_arrays(self) -> None:
+        def ratio(
+            a: Annotated[np.ndarray, "m"], b: Annotated[np.ndarray, "ft"]
+        ) -> Annotated[Any, "dimensionless"]:
+            return a / b
+
+        self.assertIn("return a / b * 3.28", rewritten(ratio))
+        self.assertAlmostEqual(ratio(np.ones(3), np.ones(3))[0], 1 / 0.3048)
+
+    def test_unknown(self) -> None:
+        def area(
+            width: Annotated[Any, "m"], length: Annotated[Any, "ft"]
+        ) -> Annotated[Any, "m**2"]:
+            return width * length
+
+        self.assertIn("return width * (length * 0.3047", rewritten(area))
+
+
+class SharedConversions(unittest.TestCase):
+    def test_argument(self) -> None:
+        result = share("def f(h):\n    a = C(h) + 1\n    return C(h) * a")
+        self.assertEqual(
+            result.splitlines()[1:],
+            [
+                "    __impunity_h_0__ = h * 2",
+                "    a = __impunity_h_0__ + 1",
+                "    return __impunity_h_0__ * a",
+            ],
+        )
+
+    def test_variable(self) -> None:
+        source = (
+            "def f(h):\n    print(1)\n    x = h + 1\n    return C(x) / C(x)"
+        )
+        result = share(source).splitlines()
+        self.assertEqual(result[3], "    __impunity_x_0__ = x * 2")
+        self.assertIn("return __impunity_x_0__ / __impunity_x_0__", result[4])
+
+    def test_nested_blocks(self) -> None:
+        # the conversions in the loop use the shared variable
+        source = (
+            "def f(h, n):\n    y = C(h)\n    for i in n:\n        y += C(h)"
+        )
+        self.assertIn("y += __impunity_h_0__", share(source))
+        # only evaluated in a branch: converted in the branch
+        source = "def f(h, b):\n    if b:\n        return C(h) + C(h)"
+        result = share(source).splitlines()
+        self.assertEqual(result[2], "        __impunity_h_0__ = h * 2")
+
+    def test_conditional(self) -> None:
+        # not converted when the first conversion may not be evaluated
+        source = "def f(h, b):\n    y = b and C(h)\n    return C(h)"
+        self.assertNotIn("__impunity", share(source))
+        source = "def f(h, b):\n    return C(h) if b else C(h)"
+        self.assertNotIn("__impunity", share(source))
+
+    def test_not_shared(self) -> None:
+        # rebound, or possibly modified in place
+        for source in (
+            "def f(h):\n    a = C(h)\n    h = 1\n    return C(h)",
+            "def f(h):\n    a = C(h)\n    g(h)\n    return C(h)",
+            "def f(h):\n    x = h\n    x = x\n    return C(x) + C(x)",
+            "def f(h):\n    a = C(h)\n    return [C(h) for h in a]",
+            # modified in place through an alias bound before
+            "def f(h):\n    g = h\n    a = C(h)\n    g += 1\n    return C(h)",
+        ):
+            self.assertNotIn("__impunity", share(source))
+
+    def test_decorated(self) -> None:
+        def margin(h: Annotated[Any, "ft"]) -> Annotated[Any, "m"]:
+            height: Annotated[Any, "m"] = h
+            ceiling: Annotated[Any, "km"] = h
+            floor: Annotated[Any, "m"] = h
+            return height - floor + ceiling
+
+        source = rewritten(margin)
+        self.assertEqual(source.count("0.3047"), 1)
+        self.assertAlmostEqual(margin(1000), 304.8)
+
+        stats(True)
+        try:
+            impunity(margin)
+            name = f"{__name__}.{margin.__qualname__}"
+            self.assertEqual(stats()[name].saved, 1)
+        finally:
+            stats(False)
+
+    def test_alias(self) -> None:
+        @impunity
+        def f(h: Annotated[np.ndarray, "m"]) -> Annotated[Any, "ft"]:
+            g = h
+            a: Annotated[Any, "ft"] = h
+            g += 1
+            b: Annotated[Any, "ft"] = h
+            return a + b
+
+        np.testing.assert_allclose(f(np.zeros(2)), 3.28084)
+
+    def test_hoisted(self) -> None:
+        # the variables of the conversions shared and hoisted differ
+        @impunity
+        def f(h: Annotated[Any, "m"], n: int) -> Annotated[Any, "ft"]:
+            a: Annotated[Any, "ft"] = h
+            b: Annotated[Any, "ft"] = h
+            total: Annotated[Any, "km"] = 0
+            for _ in range(n):
+                total = total + to_km(h)
+            c: Annotated[Any, "ft"] = h
+            return a + b + c
+
+        self.assertAlmostEqual(f(1.0, 3), 9.8425, places=4)
+
+
+if __name__ == "__main__":
+    unittest.main()
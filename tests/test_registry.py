@@ -0,0 +1,45 @@
+import subprocess
+import sys
+import tempfile
+import unittest
+from typing import Any
+
+from typing_extensions import Annotated
+
+from impunity import get_registry, impunity, set_registry
+
+
+class Registry(unittest.TestCase):
+    def tearDown(self) -> None:
+        set_registry()
+
+    def test_lazy_import(self) -> None:
+        code = "import sys, impunity; print('pint' in sys.modules)"
+        out = subprocess.check_output([sys.executable, "-c", code])
+        self.assertEqual(out.decode().strip(), "False")
+
+    def test_custom_registry(self) -> None:
+        from pint import UnitRegistry
+
+        ureg = UnitRegistry()
+        ureg.define("smoot = 1.7018 * meter")
+        set_registry(ureg)
+        self.assertIs(get_registry(), ureg)
+
+        @impunity
+        def bridge(length: Annotated[Any, "smoot"]) -> Any:
+            result: Annotated[Any, "m"] = length
+            return result
+
+        self.assertAlmostEqual(bridge(364.4), 620.14, delta=1e-2)
+
+    def test_registry_snapshot(self) -> None:
+        with tempfile.TemporaryDirectory() as folder:
+            set_registry(cache_folder=folder)
+            self.assertTrue(get_registry().Unit("ft").is_compatible_with("m"))
+            set_registry(cache_folder=folder)
+            self.assertTrue(get_registry().Unit("ft").is_compatible_with("m"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+from typing import Any
+from unittest import mock
+
+from typing_extensions import Annotated
+
+import numpy as np
+from impunity import impunity, runtime
+from impunity.runtime import affine
+
+
+@impunity
+def to_fahrenheit(
+    celsius: Annotated[np.ndarray, "degC"],
+) -> Annotated[np.ndarray, "degF"]:
+    return celsius
+
+
+@impunity
+def scalar_to_fahrenheit(
+    celsius: Annotated[Any, "degC"],
+) -> Annotated[Any, "degF"]:
+    return celsius
+
+
+class AffineKernel(unittest.TestCase):
+    def setUp(self) -> None:
+        # small blocks and arrays, to go through the kernel
+        patcher = mock.patch.multiple(runtime, BLOCK_SIZE=7, FUSED_MIN_SIZE=10)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_values(self) -> None:
+        values = np.linspace(-50, 50, 101).reshape(1, 101)
+        result = affine(values, 1.8, 32)
+        np.testing.assert_allclose(result, values * 1.8 + 32)
+        self.assertEqual(result.shape, values.shape)
+
+    def test_dtype(self) -> None:
+        for dtype in (np.float32, np.float64, np.int64):
+            values = np.arange(100, dtype=dtype)
+            expected = values * 1.8 + 32
+            result = affine(values, 1.8, 32)
+            self.assertEqual(result.dtype, expected.dtype)
+            np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+    def test_fallback(self) -> None:
+        self.assertAlmostEqual(affine(100, 1.8, 32), 212)
+        # not contiguous
+        values = np.arange(100.0)[::2]
+        np.testing.assert_allclose(affine(values, 1.8, 32), values * 1.8 + 32)
+
+    def test_decorated(self) -> None:
+        self.assertIn("__impunity_affine__", to_fahrenheit.__code__.co_names)
+        self.assertAlmostEqual(to_fahrenheit(100), 212)
+        values = np.arange(100.0)
+        np.testing.assert_allclose(to_fahrenheit(values), values * 1.8 + 32)
+
+    def test_scalars(self) -> None:
+        # calling the kernel is slower than the two operations on scalars
+        names = scalar_to_fahrenheit.__code__.co_names
+        self.assertNotIn("__impunity_affine__", names)
+        self.assertAlmostEqual(scalar_to_fahrenheit(100), 212)
+
+
+if __name__ == "__main__":
+    unittest.main()
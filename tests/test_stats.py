@@ -0,0 +1,88 @@
+import contextlib
+import io
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from typing import Any
+
+from typing_extensions import Annotated
+
+from impunity import impunity, stats
+from impunity.__main__ import main
+from impunity.stats import PHASES
+
+SOURCE = """
+from typing import Any
+
+from typing_extensions import Annotated
+
+from impunity import impunity
+
+
+@impunity
+def to_ft(h: Annotated[Any, "m"]) -> Annotated[Any, "ft"]:
+    return h
+
+
+@impunity
+def identity(h: Annotated[Any, "m"]) -> Annotated[Any, "m"]:
+    return h
+"""
+
+
+class Stats(unittest.TestCase):
+    def setUp(self) -> None:
+        stats(True)
+
+    def tearDown(self) -> None:
+        stats(False)
+
+    def test_stats(self) -> None:
+        @impunity
+        def to_km(h: Annotated[Any, "m"]) -> Annotated[Any, "km"]:
+            result: Annotated[Any, "ft"] = h
+            return result
+
+        name = f"{__name__}.{to_km.__qualname__}"
+        report = stats()[name]
+        self.assertEqual(set(report.phases), set(PHASES))
+        self.assertGreater(report.phases["infer"], 0)
+        self.assertGreater(report.total, 0)
+        self.assertEqual(report.conversions, 2)
+        self.assertEqual(report.decorations, 1)
+
+        stats(False)
+        self.assertEqual(stats(), {})
+
+    def test_disabled(self) -> None:
+        stats(False)
+
+        @impunity
+        def to_km(h: Annotated[Any, "m"]) -> Annotated[Any, "km"]:
+            return h
+
+        self.assertEqual(stats(), {})
+
+    def test_profile_command(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "profiled_module.py"
+            path.write_text(textwrap.dedent(SOURCE))
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                main(["profile", str(path)])
+            sys.path.remove(tmp)
+            del sys.modules["profiled_module"]
+
+        lines = output.getvalue().splitlines()
+        self.assertTrue(lines[0].startswith("function"))
+        self.assertEqual(
+            sorted(line.split()[0] for line in lines[1:3]),
+            ["profiled_module.identity", "profiled_module.to_ft"],
+        )
+        self.assertIn("2 functions decorated", lines[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
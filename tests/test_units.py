@@ -0,0 +1,151 @@
+import subprocess
+import sys
+import tempfile
+import unittest
+from math import isclose
+from pathlib import Path
+from typing import Any
+
+from typing_extensions import Annotated
+
+from impunity import get_registry, impunity, set_registry
+from impunity.conversion import conversion_plan, power, product
+from impunity.units import parse
+
+UNITS = [
+    "m",
+    "km",
+    "ft",
+    "nmi",
+    "m/s",
+    "km/h",
+    "kts",
+    "ft/min",
+    "kg * m / s^2",
+    "N",
+    "lbf",
+    "Pa",
+    "hPa",
+    "psi",
+    "inHg",
+    "K",
+    "degC",
+    "degF",
+    "J/kg",
+    "kg/m**3",
+    "rad",
+    "deg",
+    "m^-1",
+    "1 / s",
+]
+
+
+class BuiltinUnits(unittest.TestCase):
+    def tearDown(self) -> None:
+        set_registry()
+
+    def test_parse(self) -> None:
+        speed = parse("km / h")
+        assert speed is not None
+        self.assertAlmostEqual(speed.scale, 1 / 3.6)
+        self.assertEqual(speed.dimensions, (1, 0, -1, 0, 0, 0, 0))
+
+        force = parse("kg m s^-2")
+        assert force is not None
+        self.assertEqual(force.dimensions, parse("N").dimensions)  # type: ignore
+
+        self.assertIsNotNone(parse("(m)^(0.5)"))
+        self.assertIsNone(parse("furlong"))  # not in the table
+        self.assertIsNone(parse("degC / s"))  # offset unit in a product
+        self.assertIsNone(parse("2 * m"))
+
+    def test_same_as_pint(self) -> None:
+        Q_ = get_registry().Quantity
+        for received in UNITS:
+            for expected in UNITS:
+                plan = conversion_plan(received, expected)
+                if not Q_(1, received).is_compatible_with(expected):
+                    self.assertIsNone(plan)
+                    continue
+                assert plan is not None
+                for value in (0, 1, 10):
+                    self.assertTrue(
+                        isclose(
+                            plan.scale * value + plan.offset,
+                            Q_(value, received).to(expected).m,
+                            rel_tol=1e-12,
+                            abs_tol=1e-12,
+                        ),
+                        (received, expected),
+                    )
+
+    def test_without_pint(self) -> None:
+        code = """
+import sys
+from typing_extensions import Annotated
+from impunity import impunity
+
+@impunity(cache=False)
+def speed(
+    distance: Annotated[float, "nmi"], duration: Annotated[float, "min"]
+) -> Annotated[float, "m/s"]:
+    result: Annotated[float, "kts"] = distance / duration
+    return result
+
+print(round(speed(1, 60), 4), "pint" in sys.modules)
+"""
+        with tempfile.TemporaryDirectory() as folder:
+            script = Path(folder) / "script.py"
+            script.write_text(code)
+            out = subprocess.check_output([sys.executable, str(script)])
+        self.assertEqual(out.decode().strip(), "0.5144 False")
+
+    def test_custom_registry(self) -> None:
+        from pint import UnitRegistry
+
+        ureg = UnitRegistry()
+        ureg.define("foot = 0.3 * meter")
+        set_registry(ureg)
+        plan = conversion_plan("ft", "m")
+        assert plan is not None
+        self.assertAlmostEqual(plan.scale, 0.3)
+
+
+class DerivedUnits(unittest.TestCase):
+    def test_interned(self) -> None:
+        self.assertIs(parse("km/h"), parse("kph"))
+        self.assertIs(product("km", "h", divide=True), parse("kph"))
+        self.assertIs(product(product("m", "s"), "s", divide=True), parse("m"))
+        self.assertIs(power("m", 2), parse("m**2"))
+        self.assertIs(power(power("m", 2), 0.5), parse("m"))
+        self.assertEqual(product("furlong", "s", divide=True), "furlong/s")
+
+    def test_composition(self) -> None:
+        @impunity
+        def density(
+            mass: Annotated[Any, "kg"],
+            length: Annotated[Any, "m"],
+            width: Annotated[Any, "cm"],
+        ) -> Annotated[Any, "g/cm^2"]:
+            return mass / (length * width)
+
+        self.assertAlmostEqual(density(1, 1, 100), 0.1)
+
+        @impunity
+        def side(area: Annotated[Any, "km^2"]) -> Annotated[Any, "m"]:
+            return area ** (1 / 2)
+
+        self.assertAlmostEqual(side(4), 2000)
+
+    def test_pint_fallback(self) -> None:
+        @impunity
+        def speed(
+            distance: Annotated[Any, "m"], duration: Annotated[Any, "s"]
+        ) -> Annotated[Any, "furlong/fortnight"]:
+            return distance / duration
+
+        self.assertAlmostEqual(speed(1, 1), 6012.88, delta=1e-2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -80,6 +80,33 @@ class Wrapper(unittest.TestCase):
         res = test_unknown_annotation(1000, 1000)
         self.assertAlmostEqual(res, 609.60, delta=1e-2)
 
+    def test_closure(self) -> None:
+        factor = 2
+
+        @impunity
+        def scaled(h: "m") -> "ft":
+            return factor * h
+
+        self.assertAlmostEqual(scaled(1000), 6561.67, delta=1e-2)
+        factor = 3
+        self.assertAlmostEqual(scaled(1000), 9842.52, delta=1e-2)
+
+    def test_line_numbers(self) -> None:
+        @impunity
+        def failing(h: "m") -> "ft":
+            result: "ft" = h
+            raise ValueError(result)
+
+        try:
+            failing(1000)
+        except ValueError as e:
+            traceback = e.__traceback__
+        assert traceback is not None and traceback.tb_next is not None
+        self.assertEqual(
+            traceback.tb_next.tb_lineno,
+            failing.__code__.co_firstlineno + 3,
+        )
+
     def test_class_method_ignore(self) -> None:
         c = WrappedIgnoreClass()
         self.assertAlmostEqual(c.f(c.class_alt), 1000, delta=1e-2)